@@ -1,14 +1,159 @@
-import React from "react";
+import PropTypes from "prop-types";
+import React, { useEffect, useRef, useState } from "react";
 import { Link } from "react-router-dom";
-import { Header, Item } from "semantic-ui-react";
+import { Button, Form, Header, Item, Loader, Message, Segment } from "semantic-ui-react";
 
+import api from "../../../api";
+import makeCancelable from "../../../utilities/makeCancelable";
 import DocumentTitle from "../../DocumentTitle";
-import Fetch from "../../Fetch";
 import VariantId from "../../VariantId";
 import Page from "../Page";
 import VariantSearch from "./VariantSearch";
 
+const PAGE_SIZE = 100;
+
+const VariantFilterForm = ({ onSubmit }) => {
+  const [variantId, setVariantId] = useState("");
+  const [gene, setGene] = useState("");
+  const [region, setRegion] = useState("");
+
+  return (
+    <Segment attached>
+      <Header as="h4">Filter my variants</Header>
+      <Form
+        onSubmit={() => {
+          const filters = { variant_id: variantId, gene, region };
+          onSubmit(
+            Object.keys(filters)
+              .filter(key => filters[key])
+              .reduce((acc, key) => ({ ...acc, [key]: filters[key].trim() }), {})
+          );
+        }}
+      >
+        <Form.Group widths="equal">
+          <Form.Input
+            id="variants-filter-variant-id"
+            label="Variant ID starts with"
+            placeholder="chrom-pos"
+            value={variantId}
+            onChange={(e, { value }) => setVariantId(value)}
+          />
+          <Form.Input
+            id="variants-filter-gene"
+            label="Gene symbol starts with"
+            value={gene}
+            onChange={(e, { value }) => setGene(value)}
+          />
+          <Form.Input
+            id="variants-filter-region"
+            label="Region"
+            placeholder="chrom:start-stop"
+            value={region}
+            onChange={(e, { value }) => setRegion(value)}
+          />
+        </Form.Group>
+        <Button type="submit">Filter</Button>
+      </Form>
+    </Segment>
+  );
+};
+
+VariantFilterForm.propTypes = {
+  onSubmit: PropTypes.func.isRequired,
+};
+
+const VariantsList = ({ filters }) => {
+  const [variants, setVariants] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [isFetching, setIsFetching] = useState(true);
+  const [error, setError] = useState(null);
+  const currentRequest = useRef(null);
+
+  const loadVariants = (cursor = null) => {
+    setIsFetching(true);
+    setError(null);
+
+    if (currentRequest.current) {
+      currentRequest.current.cancel();
+    }
+
+    const params = { ...filters, page_size: PAGE_SIZE };
+    if (cursor) {
+      params.cursor = cursor;
+    }
+
+    currentRequest.current = makeCancelable(api.get("/variants/", params));
+    currentRequest.current.then(
+      data => {
+        setVariants(previousVariants =>
+          cursor ? [...previousVariants, ...data.variants] : data.variants
+        );
+        setNextCursor(data.next_cursor);
+        setIsFetching(false);
+      },
+      err => {
+        setError(err);
+        setIsFetching(false);
+      }
+    );
+  };
+
+  useEffect(() => {
+    setVariants([]);
+    loadVariants();
+  }, [filters]);
+
+  // Cancel any pending request when unmounted.
+  useEffect(() => () => currentRequest.current && currentRequest.current.cancel(), []);
+
+  return (
+    <React.Fragment>
+      {error && (
+        <Message error>
+          <Message.Header>Error</Message.Header>
+          <p>{error.message}</p>
+        </Message>
+      )}
+
+      {variants.length > 0 && (
+        <Item.Group>
+          {variants.map(variant => (
+            <Item key={`${variant.variant_id}-${variant.reference_genome}`}>
+              <Item.Content>
+                <Item.Header>
+                  <Link
+                    to={`/variant/${variant.variant_id}?reference_genome=${variant.reference_genome}`}
+                  >
+                    <VariantId
+                      variantId={variant.variant_id}
+                      referenceGenome={variant.reference_genome}
+                    />
+                  </Link>
+                </Item.Header>
+              </Item.Content>
+            </Item>
+          ))}
+        </Item.Group>
+      )}
+
+      {!isFetching && !error && variants.length === 0 && <p>No variants.</p>}
+
+      {isFetching && <Loader active inline="centered" />}
+
+      {!isFetching && nextCursor && (
+        <Button onClick={() => loadVariants(nextCursor)}>Load more variants</Button>
+      )}
+    </React.Fragment>
+  );
+};
+
+VariantsList.propTypes = {
+  filters: PropTypes.objectOf(PropTypes.string).isRequired,
+};
+
 const VariantsPage = () => {
+  const [filters, setFilters] = useState({});
+
   return (
     <Page>
       <DocumentTitle title="Variants" />
@@ -18,38 +163,9 @@ const VariantsPage = () => {
 
       <VariantSearch />
 
-      <Fetch path="/variants/">
-        {({ data: { variants } }) => {
-          return (
-            <React.Fragment>
-              {variants.length > 0 ? (
-                <React.Fragment>
-                  <Item.Group>
-                    {variants.map(variant => (
-                      <Item key={variant.variant_id}>
-                        <Item.Content>
-                          <Item.Header>
-                            <Link
-                              to={`/variant/${variant.variant_id}?reference_genome=${variant.reference_genome}`}
-                            >
-                              <VariantId
-                                variantId={variant.variant_id}
-                                referenceGenome={variant.reference_genome}
-                              />
-                            </Link>
-                          </Item.Header>
-                        </Item.Content>
-                      </Item>
-                    ))}
-                  </Item.Group>
-                </React.Fragment>
-              ) : (
-                <p>No variants.</p>
-              )}
-            </React.Fragment>
-          );
-        }}
-      </Fetch>
+      <VariantFilterForm onSubmit={setFilters} />
+
+      <VariantsList filters={filters} />
     </Page>
   );
 };
@@ -0,0 +1 @@
+default_app_config = "curation_portal.apps.CurationPortalConfig"  # pylint: disable=invalid-name
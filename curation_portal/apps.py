@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class CurationPortalConfig(AppConfig):
     name = "curation_portal"
+
+    def ready(self):
+        # Connect signal receivers that invalidate cached project data.
+        import curation_portal.cache  # pylint: disable=import-outside-toplevel,unused-import
@@ -1,6 +1,19 @@
 from django.conf import settings
 from django.contrib.auth.middleware import RemoteUserMiddleware
 
+from curation_portal.rules import permission_cache
+
 
 class AuthMiddleware(RemoteUserMiddleware):
     header = settings.CURATION_PORTAL_AUTH_HEADER
+
+
+class PermissionCacheMiddleware:
+    """Load information used for permission checks at most once per request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with permission_cache():
+            return self.get_response(request)
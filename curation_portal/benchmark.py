@@ -0,0 +1,552 @@
+"""Generate synthetic projects and measure the cost of API requests at different project sizes."""
+
+import json
+import math
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from curation_portal import export
+from curation_portal.cache import PROJECT_CACHE_ALIAS, get_project_cache
+from curation_portal.models import (
+    ImportJob,
+    ImportJobError,
+    Project,
+    User,
+    update_project_progress,
+)
+from curation_portal.serializers import ImportedResultSerializer, VariantSerializer, chunks
+from curation_portal.views.project_assignments import NewAssignmentSerializer
+
+
+# Number of variants, assignments, or results to validate and save at a time.
+GENERATE_CHUNK_SIZE = 500
+
+# Curator that uploaded assignments and results are assigned to.
+UPLOAD_CURATOR = "benchmark-uploader@example.com"
+
+CONSEQUENCES = [
+    "frameshift_variant",
+    "stop_gained",
+    "splice_donor_variant",
+    "splice_acceptor_variant",
+    "missense_variant",
+]
+
+
+def generate_variants(num_variants, num_annotations, chrom=1):
+    """Yield upload data for variants with a number of annotations each."""
+    for i in range(num_variants):
+        yield {
+            "variant_id": f"{chrom}-{100000 + i * 10}-A-G",
+            "AC": i % 20,
+            "AN": 100000,
+            "AF": (i % 20) / 100000,
+            "annotations": [
+                {
+                    "consequence": CONSEQUENCES[(i + j) % len(CONSEQUENCES)],
+                    "gene_id": f"ENSG{(i + j) % 100:011d}",
+                    "gene_symbol": f"GENE{(i + j) % 100}",
+                    "transcript_id": f"ENST{i:09d}{j:03d}",
+                    "loftee": "HC",
+                }
+                for j in range(num_annotations)
+            ],
+        }
+
+
+class BenchmarkProject:  # pylint: disable=too-few-public-methods
+    def __init__(self, project, owner, curators, num_results):
+        self.project = project
+        self.owner = owner
+        self.curators = curators
+        self.num_results = num_results
+
+        self.variant = project.variants.order_by("xpos").first()
+        self.import_job = project.import_jobs.first()
+
+
+def generate_project(num_variants, num_annotations=1, num_curators=1, result_fraction=0.5):
+    """
+    Create a project with a number of variants, each assigned to every curator.
+
+    Variants and annotations are created through the same serializers used for uploads.
+    Curators have results for the first `result_fraction` of their assigned variants.
+    """
+    suffix = uuid.uuid4().hex[:8]
+
+    owner = User.objects.create(username=f"benchmark-owner-{suffix}@example.com", is_staff=True)
+    owner.user_permissions.add(
+        *Permission.objects.filter(codename__in=["add_project", "add_variant"])
+    )
+
+    curators = [
+        User.objects.create(username=f"benchmark-curator-{suffix}-{i}@example.com")
+        for i in range(num_curators)
+    ]
+
+    project = Project.objects.create(name=f"Benchmark {suffix}", created_by=owner)
+    project.owners.add(owner)
+
+    for chunk in chunks(generate_variants(num_variants, num_annotations), GENERATE_CHUNK_SIZE):
+        serializer = VariantSerializer(data=chunk, context={"project": project}, many=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+    variant_ids = list(project.variants.order_by("xpos").values_list("variant_id", flat=True))
+    num_curated_variants = int(len(variant_ids) * result_fraction)
+
+    results = (
+        {
+            "curator": curator.username,
+            "variant_id": variant_id,
+            "verdict": export.VERDICTS[i % len(export.VERDICTS)],
+            "notes": "Benchmark result",
+            "flag_mapping_error": i % 2 == 0,
+        }
+        for curator in curators
+        for i, variant_id in enumerate(variant_ids[:num_curated_variants])
+    )
+    for chunk in chunks(results, GENERATE_CHUNK_SIZE):
+        serializer = ImportedResultSerializer(data=chunk, context={"project": project}, many=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+    assignments = (
+        {"curator": curator.username, "variant_id": variant_id}
+        for curator in curators
+        for variant_id in variant_ids[num_curated_variants:]
+    )
+    for chunk in chunks(assignments, GENERATE_CHUNK_SIZE):
+        serializer = NewAssignmentSerializer(data=chunk, context={"project": project}, many=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+    import_job = ImportJob.objects.create(
+        project=project, kind="variants", status=ImportJob.STATUS_FAILED, created_by=owner
+    )
+    ImportJobError.objects.bulk_create(
+        [ImportJobError(job=import_job, row=row, errors="{}") for row in range(num_variants)]
+    )
+
+    update_project_progress(project.id)
+    project.save()
+
+    return BenchmarkProject(
+        project, owner, curators, num_results=num_curated_variants * num_curators
+    )
+
+
+def get_export_batches(data):
+    """Return the number of chunks that a project's results are exported in."""
+    return math.ceil(data.num_results / export.EXPORT_CHUNK_SIZE)
+
+
+# Requests to measure for each API view.
+#
+# Each request has the URL name and optionally a function returning its arguments, the HTTP method,
+# a function selecting the user to make the request as, and optionally a function returning request
+# data and the format to send it in (JSON by default).
+#
+# Exports load results in chunks, so they are expected to make a fixed number of queries per
+# chunk. "get_batches" returns the number of chunks for a project.
+BENCHMARK_REQUESTS = [
+    {
+        "url_name": "api-app-settings",
+        "method": "get",
+        "get_user": lambda data: data.curators[0],
+    },
+    {
+        "url_name": "api-cache-stats",
+        "method": "get",
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-metrics",
+        "method": "get",
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-assignments",
+        "method": "get",
+        "get_user": lambda data: data.curators[0],
+    },
+    {
+        "url_name": "api-projects",
+        "method": "get",
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-create-project",
+        "method": "post",
+        "get_user": lambda data: data.owner,
+        "get_data": lambda data: {"name": "New project"},
+    },
+    {
+        "url_name": "api-project",
+        "method": "get",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-project",
+        "method": "patch",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+        "get_data": lambda data: {"name": "Renamed project"},
+    },
+    {
+        "url_name": "api-project-assignments",
+        "method": "get",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.curators[0],
+    },
+    {
+        "url_name": "api-project-assignments",
+        "method": "post",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+        "get_data": lambda data: {
+            "assignments": [
+                {"curator": UPLOAD_CURATOR, "variant_id": data.variant.variant_id},
+            ]
+        },
+    },
+    {
+        "url_name": "api-project-variants",
+        "method": "get",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-project-variants",
+        "method": "post",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+        "get_data": lambda data: list(generate_variants(1, 1, chrom=2)),
+    },
+    {
+        "url_name": "api-project-variants-locus",
+        "method": "get",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+        "get_data": lambda data: {"region": "1:100000-200000"},
+    },
+    {
+        "url_name": "api-curate-variant",
+        "method": "get",
+        "get_kwargs": lambda data: {"project_id": data.project.id, "variant_id": data.variant.id},
+        "get_user": lambda data: data.curators[0],
+    },
+    {
+        "url_name": "api-curate-variant",
+        "method": "post",
+        "get_kwargs": lambda data: {"project_id": data.project.id, "variant_id": data.variant.id},
+        "get_user": lambda data: data.curators[0],
+        "get_data": lambda data: {"verdict": "lof", "notes": "Updated", "flag_homopolymer": True},
+    },
+    {
+        "url_name": "api-project-results",
+        "method": "get",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-project-results",
+        "method": "post",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+        "get_data": lambda data: [
+            {"curator": UPLOAD_CURATOR, "variant_id": data.variant.variant_id, "verdict": "lof"}
+        ],
+    },
+    {
+        "url_name": "api-project-result-changes",
+        "method": "get",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-project-result-deletions",
+        "method": "get",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-project-results-export",
+        "method": "get",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+        "get_batches": get_export_batches,
+    },
+    {
+        "url_name": "api-project-imports",
+        "method": "get",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-project-imports",
+        "method": "post",
+        "get_kwargs": lambda data: {"project_id": data.project.id},
+        "get_user": lambda data: data.owner,
+        "get_data": lambda data: {
+            "kind": "variants",
+            "file": SimpleUploadedFile(
+                "variants.json", json.dumps(list(generate_variants(1, 1, chrom=2))).encode()
+            ),
+        },
+        "format": "multipart",
+    },
+    {
+        "url_name": "api-project-import",
+        "method": "get",
+        "get_kwargs": lambda data: {
+            "project_id": data.project.id,
+            "import_job_id": data.import_job.id,
+        },
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-project-import-errors",
+        "method": "get",
+        "get_kwargs": lambda data: {
+            "project_id": data.project.id,
+            "import_job_id": data.import_job.id,
+        },
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-profile",
+        "method": "get",
+        "get_user": lambda data: data.curators[0],
+    },
+    {
+        "url_name": "api-settings",
+        "method": "get",
+        "get_user": lambda data: data.curators[0],
+    },
+    {
+        "url_name": "api-settings",
+        "method": "patch",
+        "get_user": lambda data: data.curators[0],
+        "get_data": lambda data: {"ucsc_username": "benchmark"},
+    },
+    {
+        "url_name": "api-variants",
+        "method": "get",
+        "get_user": lambda data: data.curators[0],
+    },
+    {
+        "url_name": "api-variants-locus",
+        "method": "get",
+        "get_user": lambda data: data.curators[0],
+        "get_data": lambda data: {"gene": "GENE1"},
+    },
+    {
+        "url_name": "api-variant-projects",
+        "method": "get",
+        "get_kwargs": lambda data: {"variant_id": data.variant.variant_id},
+        "get_user": lambda data: data.curators[0],
+    },
+    {
+        "url_name": "api-variant-results",
+        "method": "get",
+        "get_kwargs": lambda data: {"variant_id": data.variant.variant_id},
+        "get_user": lambda data: data.owner,
+    },
+    {
+        "url_name": "api-variant-results-export",
+        "method": "get",
+        "get_kwargs": lambda data: {"variant_id": data.variant.variant_id},
+        "get_user": lambda data: data.owner,
+    },
+]
+
+
+def get_request_name(request):
+    return f"{request['method'].upper()} {request['url_name']}"
+
+
+def send_request(request, data):
+    """
+    Send a request and read its response.
+
+    Changes made by the request are rolled back, so that each request sees the same data.
+    Cached project data is cleared first, so that the cost of computing it is measured. This must
+    only be called with the separate project cache set up by run_benchmark.
+    """
+    client = APIClient()
+    client.force_authenticate(request["get_user"](data))
+
+    path = reverse(request["url_name"], kwargs=request.get("get_kwargs", lambda data: {})(data))
+
+    get_project_cache().clear()
+    with transaction.atomic():
+        response = getattr(client, request["method"])(
+            path,
+            request.get("get_data", lambda data: None)(data),
+            format=request.get("format", "json"),
+            secure=True,
+        )
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+        else:
+            response.content  # pylint: disable=pointless-statement
+
+        transaction.set_rollback(True)
+
+    return response
+
+
+def measure_request(request, data, repeat=3):
+    """Return the status code, query count, median wall time, and peak memory use of a request."""
+    with CaptureQueriesContext(connection) as queries:
+        response = send_request(request, data)
+
+    # Savepoint queries are made by send_request, not the view.
+    num_queries = len([q for q in queries.captured_queries if "SAVEPOINT" not in q["sql"]])
+
+    times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        send_request(request, data)
+        times.append(time.perf_counter() - start_time)
+
+    # Memory is measured separately since tracing allocations slows down requests.
+    tracemalloc.start()
+    try:
+        send_request(request, data)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "status_code": response.status_code,
+        "queries": num_queries,
+        "batches": request.get("get_batches", lambda data: 0)(data),
+        "time_ms": round(statistics.median(times) * 1000, 3),
+        "peak_memory_kb": round(peak_memory / 1024, 1),
+    }
+
+
+def check_measurements(measurements, thresholds=None, queries_per_batch=2):
+    """
+    Return a list of failures for a request's measurements at several scales.
+
+    A request fails if it makes more queries for a larger project than for a smaller one,
+    after allowing for `queries_per_batch` queries for each chunk of data that is loaded
+    separately. It also fails if any measurement exceeds one of the given thresholds
+    (max_queries, max_time_ms, or max_peak_memory_kb).
+    """
+    failures = []
+
+    by_scale = sorted(measurements.items())
+    (smallest_scale, smallest), (largest_scale, largest) = by_scale[0], by_scale[-1]
+
+    smallest_queries = smallest["queries"] - queries_per_batch * smallest["batches"]
+    largest_queries = largest["queries"] - queries_per_batch * largest["batches"]
+    if largest_queries > smallest_queries:
+        failures.append(
+            f"Query count depends on project size: {smallest['queries']} queries with "
+            f"{smallest_scale} variants, {largest['queries']} queries with {largest_scale} variants"
+        )
+
+    for scale, measurement in by_scale:
+        if not 200 <= measurement["status_code"] < 300:
+            failures.append(f"Status code {measurement['status_code']} with {scale} variants")
+
+        for measure in ("queries", "time_ms", "peak_memory_kb"):
+            threshold = (thresholds or {}).get(f"max_{measure}")
+            if threshold is not None and measurement[measure] > threshold:
+                failures.append(
+                    f"{measure} {measurement[measure]} exceeds {threshold} with {scale} variants"
+                )
+
+    return failures
+
+
+@contextmanager
+def isolated_storage():
+    """
+    Use a separate project cache and media directory while the block runs.
+
+    Requests clear the project cache before they are measured, and the project cache is shared
+    between workers, so clearing it would evict data cached for other users. The cache uses the
+    configured backend so that its cost is still measured. Files uploaded by requests are also
+    written to a temporary directory, since database changes are rolled back but files are not.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_cache_settings = {
+            **settings.CACHES[PROJECT_CACHE_ALIAS],
+            "LOCATION": os.path.join(temp_dir, "cache"),
+        }
+        with override_settings(
+            CACHES={**settings.CACHES, PROJECT_CACHE_ALIAS: project_cache_settings},
+            MEDIA_ROOT=os.path.join(temp_dir, "media"),
+        ):
+            yield
+
+
+def run_benchmark(
+    scales, num_annotations=1, num_curators=2, result_fraction=0.5, repeat=3, thresholds=None
+):  # pylint: disable=too-many-arguments
+    """
+    Measure every request in BENCHMARK_REQUESTS for projects with each number of variants in scales.
+
+    Generated data is rolled back once measurements are complete. Returns a report with the
+    configuration, measurements for each request keyed by scale, and any failures.
+    """
+    measurements = {get_request_name(request): {} for request in BENCHMARK_REQUESTS}
+
+    for scale in scales:
+        with isolated_storage(), transaction.atomic():
+            data = generate_project(
+                scale,
+                num_annotations=num_annotations,
+                num_curators=num_curators,
+                result_fraction=result_fraction,
+            )
+
+            for request in BENCHMARK_REQUESTS:
+                measurements[get_request_name(request)][scale] = measure_request(
+                    request, data, repeat=repeat
+                )
+
+            transaction.set_rollback(True)
+
+    failures = {}
+    for request_name, request_measurements in measurements.items():
+        request_failures = check_measurements(
+            request_measurements, thresholds=(thresholds or {}).get(request_name)
+        )
+        if request_failures:
+            failures[request_name] = request_failures
+
+    return {
+        "config": {
+            "scales": list(scales),
+            "annotations_per_variant": num_annotations,
+            "curators": num_curators,
+            "result_fraction": result_fraction,
+            "repeat": repeat,
+        },
+        "measurements": {
+            request_name: {str(scale): m for scale, m in request_measurements.items()}
+            for request_name, request_measurements in measurements.items()
+        },
+        "failures": failures,
+    }
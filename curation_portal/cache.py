@@ -0,0 +1,135 @@
+import uuid
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch.dispatcher import receiver
+
+from curation_portal.models import CurationAssignment, CurationResult, Project, Variant
+
+
+PROJECT_CACHE_ALIAS = "project_data"
+
+CACHE_STATS_KEYS = {"hits": "stats:hits", "misses": "stats:misses"}
+
+
+def get_project_cache():
+    return caches[PROJECT_CACHE_ALIAS]
+
+
+# Rather than tracking every cached key for a project, cache keys include a generation that is
+# replaced whenever any of the project's data changes. Entries for older generations are never
+# read again and are evicted when they expire.
+def get_generation_key(project_id):
+    return f"project:{project_id}:generation"
+
+
+def get_project_cache_generation(project_id):
+    cache = get_project_cache()
+    generation = cache.get(get_generation_key(project_id))
+    if generation is None:
+        generation = uuid.uuid4().hex
+        if not cache.add(get_generation_key(project_id), generation, timeout=None):
+            generation = cache.get(get_generation_key(project_id), generation)
+
+    return generation
+
+
+def bump_project_cache_generation(project_id):
+    """Invalidate all cached data for a project."""
+
+    def bump():
+        get_project_cache().set(get_generation_key(project_id), uuid.uuid4().hex, timeout=None)
+
+    # Data cached by other requests while a transaction is open would be based on the
+    # database's state before the transaction, so invalidate again once it is committed.
+    bump()
+    transaction.on_commit(bump)
+
+
+def increment_stat(stat):
+    cache = get_project_cache()
+    key = CACHE_STATS_KEYS[stat]
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key has not been set yet or has been evicted. If another worker sets it first,
+        # add fails and the count is incremented instead. The dummy cache never stores it.
+        if not cache.add(key, 1, timeout=None):
+            try:
+                cache.incr(key)
+            except ValueError:
+                pass
+
+
+def get_cache_stats():
+    cache = get_project_cache()
+    return {stat: cache.get(key, 0) for stat, key in CACHE_STATS_KEYS.items()}
+
+
+def get_cached_project_data(project_id, name, compute, variation=None):
+    """
+    Return cached data for a project, calling compute to generate and cache it on a cache miss.
+
+    Name identifies the kind of data and variation distinguishes between different versions
+    of it (for example, for users with different permissions).
+    """
+    cache = get_project_cache()
+    key = ":".join(
+        [
+            "project",
+            str(project_id),
+            get_project_cache_generation(project_id),
+            name,
+            *([variation] if variation else []),
+        ]
+    )
+
+    data = cache.get(key)
+    if data is not None:
+        increment_stat("hits")
+        return data
+
+    increment_stat("misses")
+    data = compute()
+    cache.set(key, data)
+    return data
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def project_changed(sender, instance, *args, **kwargs):  # pylint: disable=unused-argument
+    bump_project_cache_generation(instance.id)
+
+
+@receiver(m2m_changed, sender=Project.owners.through)
+def project_owners_changed(
+    sender, instance, action, reverse, pk_set, *args, **kwargs
+):  # pylint: disable=unused-argument,too-many-arguments
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    # When reverse is set, owned projects were changed from the user side of the relationship.
+    for project_id in (pk_set or []) if reverse else [instance.id]:
+        bump_project_cache_generation(project_id)
+
+
+@receiver(post_save, sender=Variant)
+@receiver(post_delete, sender=Variant)
+def variant_changed(sender, instance, *args, **kwargs):  # pylint: disable=unused-argument
+    bump_project_cache_generation(instance.project_id)
+
+
+@receiver(post_save, sender=CurationAssignment)
+@receiver(post_delete, sender=CurationAssignment)
+def assignment_changed(sender, instance, *args, **kwargs):  # pylint: disable=unused-argument
+    bump_project_cache_generation(instance.project_id)
+
+
+@receiver(post_save, sender=CurationResult)
+@receiver(post_delete, sender=CurationResult)
+def result_changed(sender, instance, *args, **kwargs):  # pylint: disable=unused-argument
+    # Results saved before they are linked to an assignment have no project. Linking the result
+    # saves the assignment, which invalidates the project's data.
+    if instance.project_id is not None:
+        bump_project_cache_generation(instance.project_id)
@@ -0,0 +1,55 @@
+import hashlib
+from calendar import timegm
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from curation_portal.models import CurationResult
+
+
+def get_project_validators(project, user):
+    """
+    Return an ETag and last modified time for a user's view of a project's data.
+
+    These change when the project is saved (as it is when variants, assignments, or results
+    are uploaded) or when any of the project's results are created, updated, or deleted.
+    """
+    results = CurationResult.objects.filter(assignment__variant__project=project).aggregate(
+        last_updated_at=Max("updated_at"), num_results=Count("id")
+    )
+
+    last_modified = project.updated_at
+    if results["last_updated_at"] and results["last_updated_at"] > last_modified:
+        last_modified = results["last_updated_at"]
+
+    # Responses differ depending on the user's permissions, so include the user in the ETag.
+    etag = hashlib.md5(
+        ":".join(
+            [
+                str(user.id),
+                project.updated_at.isoformat(),
+                results["last_updated_at"].isoformat() if results["last_updated_at"] else "",
+                str(results["num_results"]),
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+
+    return quote_etag(etag), last_modified
+
+
+def get_not_modified_response(request, validators):
+    """Return a 304 Not Modified response if the client's copy is current, otherwise None."""
+    etag, last_modified = validators
+    return get_conditional_response(
+        request, etag=etag, last_modified=timegm(last_modified.utctimetuple())
+    )
+
+
+def set_validators(response, validators):
+    """Add validators to a response and require clients to revalidate before reusing it."""
+    etag, last_modified = validators
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(timegm(last_modified.utctimetuple()))
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,328 @@
+import csv
+from collections import defaultdict
+
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+
+from curation_portal.metrics import iter_measured_export
+from curation_portal.models import (
+    VariantAnnotation,
+    FLAG_FIELDS,
+    FLAG_LABELS,
+    get_flags_from_bitmask,
+)
+
+# pyarrow is optional and only required for columnar exports.
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+# Some pyarrow builds do not include Parquet support.
+try:
+    import pyarrow.parquet
+except ImportError:
+    pass
+
+
+# Number of assignments to load at a time when exporting results.
+EXPORT_CHUNK_SIZE = 500
+
+RESULT_FIELDS = ["notes", "should_revisit", "verdict", *FLAG_FIELDS]
+
+VERDICTS = ["lof", "likely_lof", "uncertain", "likely_not_lof", "not_lof"]
+
+# Flags are read from the result's flags bitmask, so the individual flag columns are not loaded.
+DEFERRED_RESULT_FIELDS = [f"result__{f}" for f in FLAG_FIELDS]
+
+
+class Echo:
+    """File-like object that returns written values instead of storing them."""
+
+    def write(self, value):  # pylint: disable=no-self-use
+        return value
+
+
+def iter_assignment_chunks(assignments, chunk_size=None):
+    """
+    Yield lists of assignments from a queryset, along with a map of variant ID to annotations
+    for the variants in each list.
+
+    Assignments are paged through by primary key so that only one chunk is held in memory
+    at a time and no database cursor is left open between chunks.
+    """
+    if chunk_size is None:
+        chunk_size = EXPORT_CHUNK_SIZE
+
+    last_pk = None
+    while True:
+        chunk = assignments.order_by("pk")
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+
+        chunk = list(chunk[:chunk_size])
+        if not chunk:
+            return
+
+        annotations = defaultdict(list)
+        for annotation in VariantAnnotation.objects.filter(
+            variant_id__in=set(assignment.variant_id for assignment in chunk)
+        ).only("variant_id", "gene_id", "gene_symbol", "transcript_id"):
+            annotations[annotation.variant_id].append(annotation)
+
+        yield chunk, annotations
+
+        last_pk = chunk[-1].pk
+
+
+def get_result_values(result):
+    return {
+        "notes": result.notes,
+        "should_revisit": result.should_revisit,
+        "verdict": result.verdict,
+        **get_flags_from_bitmask(result.flags),
+    }
+
+
+def iter_results_csv(assignments, first_column_label, get_first_column_value):
+    """Yield lines of a CSV file containing the results for a queryset of assignments."""
+    writer = csv.writer(Echo())
+
+    yield writer.writerow(
+        [first_column_label, "Gene", "Transcript", "Curator"]
+        + [
+            FLAG_LABELS.get(f, " ".join(word.capitalize() for word in f.split("_")))
+            for f in RESULT_FIELDS
+        ]
+    )
+
+    for chunk, annotations in iter_assignment_chunks(assignments.defer(*DEFERRED_RESULT_FIELDS)):
+        for assignment in chunk:
+            variant_annotations = annotations[assignment.variant_id]
+            result_values = get_result_values(assignment.result)
+            row = [
+                get_first_column_value(assignment),
+                ";".join(
+                    set(
+                        f"{annotation.gene_id}:{annotation.gene_symbol}"
+                        for annotation in variant_annotations
+                    )
+                ),
+                ";".join(set(annotation.transcript_id for annotation in variant_annotations)),
+                assignment.curator.username,
+            ] + [result_values[f] for f in RESULT_FIELDS]
+            yield writer.writerow(row)
+
+
+def results_csv_response(assignments, filename, first_column_label, get_first_column_value):
+    """Return a response that streams results for a queryset of assignments as a CSV file."""
+    response = StreamingHttpResponse(
+        iter_measured_export(
+            iter_results_csv(assignments, first_column_label, get_first_column_value), "csv"
+        ),
+        content_type="text/csv",
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def get_results_schema(first_column_name):
+    return pyarrow.schema(
+        [
+            (first_column_name, pyarrow.string()),
+            ("gene_ids", pyarrow.list_(pyarrow.string())),
+            ("gene_symbols", pyarrow.list_(pyarrow.string())),
+            ("transcript_ids", pyarrow.list_(pyarrow.string())),
+            ("curator", pyarrow.string()),
+            ("notes", pyarrow.string()),
+            ("should_revisit", pyarrow.bool_()),
+            ("verdict", pyarrow.dictionary(pyarrow.int8(), pyarrow.string())),
+            *[(f, pyarrow.bool_()) for f in FLAG_FIELDS],
+        ]
+    )
+
+
+def get_results_record_batch(schema, chunk, annotations, get_first_column_value):
+    """Return a record batch containing the results for a list of assignments."""
+    columns = defaultdict(list)
+    for assignment in chunk:
+        # Gene IDs and symbols are sorted by gene ID so that they can be matched up by position.
+        genes = sorted(
+            set(
+                (annotation.gene_id, annotation.gene_symbol)
+                for annotation in annotations[assignment.variant_id]
+            )
+        )
+
+        columns[schema.names[0]].append(get_first_column_value(assignment))
+        columns["gene_ids"].append([gene_id for gene_id, _ in genes])
+        columns["gene_symbols"].append([gene_symbol for _, gene_symbol in genes])
+        columns["transcript_ids"].append(
+            sorted(
+                set(annotation.transcript_id for annotation in annotations[assignment.variant_id])
+            )
+        )
+        columns["curator"].append(assignment.curator.username)
+        for field, value in get_result_values(assignment.result).items():
+            columns[field].append(value)
+
+    # Use the same dictionary for every batch so that verdict codes are consistent across the file.
+    verdict = pyarrow.DictionaryArray.from_arrays(
+        pyarrow.array(
+            [
+                VERDICTS.index(verdict) if verdict in VERDICTS else None
+                for verdict in columns["verdict"]
+            ],
+            type=pyarrow.int8(),
+        ),
+        pyarrow.array(VERDICTS, type=pyarrow.string()),
+    )
+
+    return pyarrow.RecordBatch.from_arrays(
+        [
+            (
+                verdict
+                if field.name == "verdict"
+                else pyarrow.array(columns[field.name], type=field.type)
+            )
+            for field in schema
+        ],
+        schema=schema,
+    )
+
+
+class ParquetResultsWriter:
+    def __init__(self, sink, schema):
+        self.writer = pyarrow.parquet.ParquetWriter(sink, schema)
+
+    def write_batch(self, batch):
+        # Each batch is written as a separate row group.
+        self.writer.write_table(pyarrow.Table.from_batches([batch]))
+
+    def close(self):
+        self.writer.close()
+
+
+COLUMNAR_FORMATS = {
+    # file format: (file extension, content type, function returning a writer)
+    "parquet": ("parquet", "application/vnd.apache.parquet", ParquetResultsWriter),
+    "arrow": (
+        "arrow",
+        "application/vnd.apache.arrow.stream",
+        lambda sink, schema: pyarrow.ipc.new_stream(sink, schema),
+    ),
+}
+
+
+def get_available_columnar_formats():
+    if pyarrow is None:
+        return []
+
+    return [
+        file_format
+        for file_format in COLUMNAR_FORMATS
+        if file_format != "parquet" or hasattr(pyarrow, "parquet")
+    ]
+
+
+class ColumnarExportBuffer:
+    """
+    Write-only file-like object that holds data written to it until it is taken.
+
+    Parquet and Arrow IPC stream writers only append to their output, so data can be sent as soon as
+    each batch of results is written instead of writing the whole file first.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def take(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def iter_results_columnar(assignments, file_format, first_column_label, get_first_column_value):
+    """
+    Yield the contents of a Parquet or Arrow IPC stream file containing the results for a
+    queryset of assignments.
+
+    Results are written in batches, so that only one chunk of assignments is held in memory
+    at a time. Each batch is yielded as soon as it is written.
+    """
+    _, _, get_writer = COLUMNAR_FORMATS[file_format]
+
+    schema = get_results_schema(first_column_label.lower().replace(" ", "_"))
+
+    output = ColumnarExportBuffer()
+    writer = get_writer(output, schema)
+    for chunk, annotations in iter_assignment_chunks(assignments.defer(*DEFERRED_RESULT_FIELDS)):
+        writer.write_batch(
+            get_results_record_batch(schema, chunk, annotations, get_first_column_value)
+        )
+        yield output.take()
+
+    writer.close()
+    yield output.take()
+
+
+def results_columnar_response(
+    assignments, file_format, filename_prefix, first_column_label, get_first_column_value
+):  # pylint: disable=too-many-arguments
+    """
+    Return a response that streams results for a queryset of assignments as a Parquet or
+    Arrow IPC stream file.
+    """
+    extension, content_type, _ = COLUMNAR_FORMATS[file_format]
+
+    response = StreamingHttpResponse(
+        iter_measured_export(
+            iter_results_columnar(
+                assignments, file_format, first_column_label, get_first_column_value
+            ),
+            file_format,
+        ),
+        content_type=content_type,
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename_prefix}.{extension}"'
+    return response
+
+
+def results_export_response(
+    assignments, file_format, filename_prefix, first_column_label, get_first_column_value
+):  # pylint: disable=too-many-arguments
+    """Return a response containing results for a queryset of assignments in the requested format."""
+    if file_format == "csv":
+        return results_csv_response(
+            assignments, f"{filename_prefix}.csv", first_column_label, get_first_column_value
+        )
+
+    if file_format not in COLUMNAR_FORMATS:
+        raise ValidationError({"file_format": [f"Unknown file format '{file_format}'"]})
+
+    if file_format not in get_available_columnar_formats():
+        raise ValidationError(
+            {"file_format": [f"Exporting {file_format} files requires the pyarrow package"]}
+        )
+
+    return results_columnar_response(
+        assignments, file_format, filename_prefix, first_column_label, get_first_column_value
+    )
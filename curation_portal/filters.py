@@ -1,14 +1,166 @@
+import re
+
 import django_filters
+from django.db.models import F
+from rest_framework.exceptions import ValidationError
+
+from curation_portal.models import (
+    CurationAssignment,
+    CurationResult,
+    Variant,
+    VariantAnnotation,
+    FLAG_BITS,
+    FLAG_GROUPS,
+)
+from curation_portal.serializers import get_xpos
+
+
+def get_flags_mask(value):
+    """
+    Return a bitmask for a comma separated list of flags.
+
+    The list may contain flag field names (for example, "flag_mapping_error") or flag group
+    names (for example, "technical").
+    """
+    mask = 0
+    for name in value.split(","):
+        name = name.strip()
+        if name in FLAG_BITS:
+            mask |= FLAG_BITS[name]
+        elif name in FLAG_GROUPS:
+            for flag in FLAG_GROUPS[name]:
+                mask |= FLAG_BITS[flag]
+        else:
+            raise ValidationError({"flags": [f"Unknown flag '{name}'"]})
+
+    return mask
+
+
+class FlagsFilter(django_filters.CharFilter):
+    """Filter on a flags bitmask field for results with any (or all) of a list of flags set."""
+
+    def __init__(self, *args, require_all=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.require_all = require_all
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+
+        mask = get_flags_mask(value)
+        alias = f"{self.field_name.replace('__', '_')}_and_{mask}"
+        qs = qs.annotate(**{alias: F(self.field_name).bitand(mask)})
+        if self.require_all:
+            return qs.filter(**{alias: mask})
+
+        return qs.filter(**{f"{alias}__gt": 0})
+
+
+REGION_REGEX = re.compile(r"^(?:chr)?(\d{1,2}|X|Y|M)[-:](\d+)(?:-(\d+))?$", re.IGNORECASE)
+
+
+def parse_region(value):
+    """Return the range of xpos values covered by a region formatted as chrom:start-stop."""
+    match = REGION_REGEX.match(value.strip().replace(",", ""))
+    if not match:
+        raise ValidationError({"region": [f"Invalid region '{value}'"]})
+
+    chrom, start, stop = match.groups()
+    start = int(start)
+    stop = int(stop) if stop else start
+    if stop < start:
+        raise ValidationError({"region": [f"Invalid region '{value}'"]})
+
+    return get_xpos(chrom.upper(), start), get_xpos(chrom.upper(), stop)
+
+
+class RegionFilter(django_filters.CharFilter):
+    """Filter on an xpos field for variants within a region."""
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
 
-from curation_portal.models import CurationAssignment
+        start, stop = parse_region(value)
+        return qs.filter(**{f"{self.field_name}__gte": start, f"{self.field_name}__lte": stop})
+
+
+class AnnotationFilter(django_filters.CharFilter):
+    """
+    Filter on a field of variants' annotations.
+
+    Variants with multiple matching annotations would be duplicated by joining annotations, so
+    matching variants are selected with a subquery instead. field_name is the path to the variant.
+    """
+
+    def __init__(self, *args, annotation_field, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.annotation_field = annotation_field
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+
+        annotations = VariantAnnotation.objects.filter(
+            **{f"{self.annotation_field}__{self.lookup_expr}": value}
+        )
+        return qs.filter(**{f"{self.field_name}__in": annotations.values("variant_id")})
+
+
+class VariantIdPrefixFilter(django_filters.CharFilter):
+    """Filter for variant IDs starting with a prefix, which may use colons as separators."""
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+
+        return qs.filter(**{f"{self.field_name}__startswith": value.strip().replace(":", "-")})
 
 
 class AssignmentFilter(django_filters.FilterSet):
+    result__flags__any = FlagsFilter(field_name="result__flags")
+    result__flags__all = FlagsFilter(field_name="result__flags", require_all=True)
+
+    # Case insensitive substring searches on annotations can use trigram indexes on PostgreSQL.
+    # See migration 0025_case_insensitive_annotation_search_indexes.
+    variant__annotation__gene_symbol = AnnotationFilter(
+        field_name="variant", annotation_field="gene_symbol", lookup_expr="exact"
+    )
+    variant__annotation__gene_symbol__contains = AnnotationFilter(
+        field_name="variant", annotation_field="gene_symbol", lookup_expr="icontains"
+    )
+    variant__annotation__consequence = AnnotationFilter(
+        field_name="variant", annotation_field="consequence", lookup_expr="exact"
+    )
+    variant__annotation__consequence__contains = AnnotationFilter(
+        field_name="variant", annotation_field="consequence", lookup_expr="icontains"
+    )
+
     class Meta:
         model = CurationAssignment
         fields = {
             "result__verdict": ["exact", "isnull"],
             "result__should_revisit": ["exact"],
-            "variant__annotation__gene_symbol": ["exact"],
-            "variant__annotation__consequence": ["exact", "contains"],
+            "variant__major_consequence": ["exact"],
         }
+
+
+class ResultFilter(django_filters.FilterSet):
+    flags__any = FlagsFilter(field_name="flags")
+    flags__all = FlagsFilter(field_name="flags", require_all=True)
+
+    class Meta:
+        model = CurationResult
+        fields = ()
+
+
+class VariantFilter(django_filters.FilterSet):
+    variant_id = VariantIdPrefixFilter(field_name="variant_id")
+    gene = AnnotationFilter(
+        field_name="id", annotation_field="gene_symbol", lookup_expr="istartswith"
+    )
+    region = RegionFilter(field_name="xpos")
+
+    class Meta:
+        model = Variant
+        fields = ("reference_genome",)
@@ -0,0 +1,288 @@
+import gzip
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from curation_portal.metrics import record_import
+from curation_portal.models import (
+    ImportJob,
+    ImportJobError,
+    mark_results_changed,
+    update_assignment_ordinals,
+    update_project_progress,
+)
+from curation_portal.parsers import iter_ndjson
+from curation_portal.serializers import ImportedResultSerializer, VariantSerializer, chunks
+
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+# Number of rows to validate and save at a time.
+IMPORT_CHUNK_SIZE = 500
+
+# Stop validating an import after this many rows with errors.
+MAX_IMPORT_ERRORS = 1000
+
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+
+
+def get_variant_key(data):
+    return data.get("variant_id")
+
+
+def get_result_key(data):
+    return (data.get("curator"), data.get("variant_id"))
+
+
+IMPORT_TYPES = {
+    # kind: (serializer class, function returning the key that must be unique within a file, duplicate message)
+    "variants": (VariantSerializer, get_variant_key, "Duplicate variant"),
+    "results": (ImportedResultSerializer, get_result_key, "Duplicate result"),
+}
+
+
+def decompressed(fileobj):
+    """Return a stream of the file's contents, decompressing it if it is gzip compressed."""
+    fileobj.seek(0)
+    is_gzipped = fileobj.read(2) == GZIP_MAGIC_NUMBER
+    fileobj.seek(0)
+    return gzip.GzipFile(fileobj=fileobj) if is_gzipped else fileobj
+
+
+def read_import_file(job):
+    """
+    Yield (row number, data) pairs from an import job's file.
+
+    Files may contain either a JSON list or newline-delimited JSON, optionally gzip compressed.
+    Newline-delimited JSON is read incrementally. Row numbers are line numbers for newline-delimited
+    JSON and positions in the list for JSON lists.
+    """
+    with job.file.open("rb") as f:
+        is_json_list = decompressed(f).read(1024).lstrip().startswith(b"[")
+
+        stream = decompressed(f)
+        if is_json_list:
+            yield from enumerate(json.load(stream), 1)
+        else:
+            yield from iter_ndjson(stream)
+
+
+def validate_import(job):
+    """
+    Validate every row in an import job's file and record errors for invalid rows.
+
+    This runs outside of a transaction so that progress is visible while the job is running.
+    Returns True if all rows are valid.
+    """
+    serializer_class, get_key, duplicate_message = IMPORT_TYPES[job.kind]
+
+    seen_keys = set()
+    num_errors = 0
+    for chunk in chunks(read_import_file(job), IMPORT_CHUNK_SIZE):
+        serializer = serializer_class(
+            data=[data for _, data in chunk], context={"project": job.project}, many=True
+        )
+        serializer.is_valid()
+        row_errors = serializer.errors if isinstance(serializer.errors, list) else [{}] * len(chunk)
+
+        # Rows are only checked for duplicates within a chunk by the list serializer,
+        # so check for duplicates across the whole file here.
+        errors = []
+        for (row, data), item_errors in zip(chunk, row_errors):
+            key = get_key(data) if isinstance(data, dict) else None
+            if key in seen_keys:
+                item_errors = {**item_errors, "non_field_errors": [duplicate_message]}
+            elif key is not None:
+                seen_keys.add(key)
+
+            if item_errors:
+                errors.append(ImportJobError(job=job, row=row, errors=json.dumps(item_errors)))
+
+        errors = errors[: MAX_IMPORT_ERRORS - num_errors]
+        ImportJobError.objects.bulk_create(errors)
+        num_errors += len(errors)
+
+        job.rows_processed += len(chunk)
+        job.heartbeat_at = timezone.now()
+        job.save(update_fields=["rows_processed", "heartbeat_at"])
+
+        if num_errors >= MAX_IMPORT_ERRORS:
+            break
+
+    return num_errors == 0
+
+
+@contextmanager
+def heartbeat(job):
+    """
+    Periodically update a running import job's heartbeat until the block exits.
+
+    Rows are saved in a single transaction, and heartbeats written inside that transaction would not
+    be visible to other workers until it commits. Django opens a separate database connection for
+    each thread, so heartbeats written by a background thread are committed immediately.
+    """
+    stopped = threading.Event()
+
+    def update_heartbeat():
+        try:
+            while not stopped.wait(settings.CURATION_PORTAL_IMPORT_JOB_TIMEOUT / 4):
+                try:
+                    ImportJob.objects.filter(id=job.id, status=ImportJob.STATUS_IMPORTING).update(
+                        heartbeat_at=timezone.now()
+                    )
+                except DatabaseError:
+                    logger.exception("Failed to update heartbeat for import job %d", job.id)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=update_heartbeat, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        thread.join()
+
+
+class ImportJobInterrupted(Exception):
+    """Raised when another worker marks an import job as failed while it is running."""
+
+
+def save_import(job):
+    """
+    Save all rows in an import job's file and mark the job as succeeded.
+
+    The job's status is updated in the same transaction as its rows, so rows are not saved if
+    another worker has marked the job as failed in the meantime. Returns the number of rows saved.
+    """
+    serializer_class, _, _ = IMPORT_TYPES[job.kind]
+
+    num_saved = 0
+    with transaction.atomic():
+        started_at = timezone.now()
+        for chunk in chunks(read_import_file(job), IMPORT_CHUNK_SIZE):
+            serializer = serializer_class(
+                data=[data for _, data in chunk],
+                # Update assignment ordinals and project progress once after all chunks are saved
+                # instead of for each chunk.
+                context={"project": job.project, "chunked": True},
+                many=True,
+            )
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+            num_saved += len(chunk)
+
+        if job.kind == "results":
+            update_assignment_ordinals(job.project)
+            mark_results_changed(job.project.id, started_at)
+
+        update_project_progress(job.project.id)
+
+        job.project.save()  # Save project to set updated_at timestamp
+
+        finished = ImportJob.objects.filter(id=job.id, status=ImportJob.STATUS_IMPORTING).update(
+            status=ImportJob.STATUS_SUCCEEDED, rows_imported=num_saved, finished_at=timezone.now()
+        )
+        if not finished:
+            raise ImportJobInterrupted
+
+    return num_saved
+
+
+def run_import_job(job):
+    try:
+        if validate_import(job):
+            started_importing = ImportJob.objects.filter(
+                id=job.id, status=ImportJob.STATUS_VALIDATING
+            ).update(status=ImportJob.STATUS_IMPORTING, heartbeat_at=timezone.now())
+            if not started_importing:
+                raise ImportJobInterrupted
+
+            with heartbeat(job):
+                job.rows_imported = save_import(job)
+
+            record_import(job.kind, job.rows_imported)
+        else:
+            job.status = ImportJob.STATUS_FAILED
+            job.error = "Some rows contain errors"
+    except ImportJobInterrupted:
+        logger.warning("Import job %d was marked as failed while running", job.id)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.exception("Import job %d failed", job.id)
+        job.status = ImportJob.STATUS_FAILED
+        job.error = str(exc)
+
+    # Only record failures for jobs that are still running. Successful imports are recorded by
+    # save_import and jobs marked as failed by another worker keep that status.
+    if job.status == ImportJob.STATUS_FAILED:
+        ImportJob.objects.filter(
+            id=job.id, status__in=[ImportJob.STATUS_VALIDATING, ImportJob.STATUS_IMPORTING]
+        ).update(status=job.status, error=job.error, finished_at=timezone.now())
+
+    job.refresh_from_db(fields=["status", "error", "rows_imported", "finished_at"])
+
+    # Uploaded files are no longer needed once the job is done.
+    job.file.delete(save=False)
+    job.save(update_fields=["file"])
+
+
+def claim_next_import_job():
+    """
+    Return the oldest pending import job and mark it as started, or None if there are no pending jobs.
+
+    Jobs are claimed with a conditional update so that multiple workers never run the same job.
+    """
+    pending_job_ids = (
+        ImportJob.objects.filter(status=ImportJob.STATUS_PENDING)
+        .order_by("created_at", "id")
+        .values_list("id", flat=True)[:10]
+    )
+    for job_id in pending_job_ids:
+        now = timezone.now()
+        claimed = ImportJob.objects.filter(id=job_id, status=ImportJob.STATUS_PENDING).update(
+            status=ImportJob.STATUS_VALIDATING, started_at=now, heartbeat_at=now
+        )
+        if claimed:
+            return ImportJob.objects.select_related("project").get(id=job_id)
+
+    return None
+
+
+def fail_stale_import_jobs():
+    """
+    Mark running import jobs that have not made progress within the import job timeout as failed.
+
+    Jobs are left running if the worker running them crashes or is killed. Rows are saved in a
+    single transaction, so failed jobs never leave a partial import. Returns the number of jobs
+    marked as failed.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.CURATION_PORTAL_IMPORT_JOB_TIMEOUT)
+    stale_jobs = ImportJob.objects.filter(
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, started_at__lt=cutoff),
+        status__in=[ImportJob.STATUS_VALIDATING, ImportJob.STATUS_IMPORTING],
+    )
+
+    num_failed = 0
+    for job in stale_jobs:
+        # Conditional update so that a job that reports progress in the meantime is not failed.
+        failed = ImportJob.objects.filter(
+            id=job.id, status=job.status, heartbeat_at=job.heartbeat_at
+        ).update(
+            status=ImportJob.STATUS_FAILED,
+            error="Import job was interrupted",
+            finished_at=timezone.now(),
+        )
+        if failed:
+            logger.warning("Import job %d was interrupted", job.id)
+            job.file.delete(save=False)
+            job.save(update_fields=["file"])
+            num_failed += 1
+
+    return num_failed
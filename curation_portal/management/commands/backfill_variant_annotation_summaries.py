@@ -0,0 +1,52 @@
+from collections import defaultdict
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from curation_portal.models import Variant, VariantAnnotation, get_annotation_summary
+
+
+class Command(BaseCommand):
+    help = "Store major consequence and genes on variants, computed from their annotations"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Update all variants instead of only variants without stored values",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500, help="Number of variants to update at a time"
+        )
+
+    def handle(self, *args, **options):
+        variants = Variant.objects.order_by("pk").only("id")
+        if not options["all"]:
+            variants = variants.filter(gene_symbols__isnull=True)
+
+        num_updated = 0
+        last_pk = 0
+        while True:
+            batch = list(variants.filter(pk__gt=last_pk)[: options["batch_size"]])
+            if not batch:
+                break
+
+            annotations = defaultdict(list)
+            for annotation in VariantAnnotation.objects.filter(variant__in=batch).values(
+                "variant_id", "consequence", "gene_symbol"
+            ):
+                annotations[annotation["variant_id"]].append(annotation)
+
+            for variant in batch:
+                for field, value in get_annotation_summary(annotations[variant.id]).items():
+                    setattr(variant, field, value)
+
+            with transaction.atomic():
+                Variant.objects.bulk_update(
+                    batch, ["major_consequence", "major_consequence_rank", "gene_symbols"]
+                )
+
+            num_updated += len(batch)
+            last_pk = batch[-1].pk
+
+        self.stdout.write(f"Updated {num_updated} variants")
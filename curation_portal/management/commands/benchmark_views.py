@@ -0,0 +1,74 @@
+import json
+
+from django.core.management import BaseCommand, CommandError
+from django.test.utils import setup_test_environment
+
+from curation_portal.benchmark import run_benchmark
+
+
+class Command(BaseCommand):
+    help = "Measure query counts, response times, and memory use of API views"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scales",
+            default="10,100,1000",
+            help="Comma separated numbers of variants in generated projects (default: 10,100,1000)",
+        )
+        parser.add_argument(
+            "--annotations", type=int, default=3, help="Number of annotations per variant"
+        )
+        parser.add_argument("--curators", type=int, default=2, help="Number of curators")
+        parser.add_argument(
+            "--result-fraction",
+            type=float,
+            default=0.5,
+            help="Fraction of each curator's assignments that have results",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Number of times to time each request"
+        )
+        parser.add_argument(
+            "--thresholds",
+            help="JSON file with max_queries, max_time_ms, and max_peak_memory_kb for requests",
+        )
+        parser.add_argument("--output", help="File to write report to (default: stdout)")
+
+    def handle(self, *args, **options):
+        try:
+            scales = sorted(int(scale) for scale in options["scales"].split(","))
+        except ValueError:
+            raise CommandError("Invalid scales")
+
+        thresholds = None
+        if options["thresholds"]:
+            with open(options["thresholds"]) as f:
+                thresholds = json.load(f)
+
+        # Allow requests from the test client.
+        setup_test_environment()
+
+        report = run_benchmark(
+            scales,
+            num_annotations=options["annotations"],
+            num_curators=options["curators"],
+            result_fraction=options["result_fraction"],
+            repeat=options["repeat"],
+            thresholds=thresholds,
+        )
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2)
+        else:
+            self.stdout.write(json.dumps(report, indent=2))
+
+        if report["failures"]:
+            raise CommandError(
+                "Benchmark failed:\n"
+                + "\n".join(
+                    f"{request_name}: {failure}"
+                    for request_name, failures in report["failures"].items()
+                    for failure in failures
+                )
+            )
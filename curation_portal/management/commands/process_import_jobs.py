@@ -0,0 +1,40 @@
+import time
+
+from django.core.management import BaseCommand
+
+from curation_portal.imports import (
+    claim_next_import_job,
+    fail_stale_import_jobs,
+    run_import_job,
+)
+
+
+class Command(BaseCommand):
+    help = "Run pending variant and result import jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once", action="store_true", help="Exit after all pending jobs have been run"
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5,
+            help="Seconds to wait before checking for new jobs when there are no pending jobs",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            num_failed = fail_stale_import_jobs()
+            if num_failed:
+                self.stdout.write(f"Marked {num_failed} interrupted import job(s) as failed")
+
+            job = claim_next_import_job()
+            if job:
+                self.stdout.write(f"Running import job {job.id} ({job.kind})")
+                run_import_job(job)
+                self.stdout.write(f"Import job {job.id} {job.status}")
+            elif options["once"]:
+                break
+            else:
+                time.sleep(options["poll_interval"])
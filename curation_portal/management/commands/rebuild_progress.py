@@ -0,0 +1,24 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from curation_portal.models import Project, update_project_progress
+
+
+class Command(BaseCommand):
+    help = "Recompute stored curation progress for projects"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "project_ids", type=int, nargs="*", help="Projects to update (default: all projects)"
+        )
+
+    def handle(self, *args, **options):
+        projects = Project.objects.order_by("id")
+        if options["project_ids"]:
+            projects = projects.filter(id__in=options["project_ids"])
+
+        for project_id in projects.values_list("id", flat=True):
+            with transaction.atomic():
+                update_project_progress(project_id)
+
+            self.stdout.write(f"Updated progress for project {project_id}")
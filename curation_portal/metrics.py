@@ -0,0 +1,292 @@
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+METRICS = {
+    # name: (type, description, histogram buckets)
+    "curation_portal_requests_total": ("counter", "Number of requests handled", None),
+    "curation_portal_request_duration_seconds": (
+        "histogram",
+        "Time taken to handle requests",
+        DURATION_BUCKETS,
+    ),
+    "curation_portal_request_queries": (
+        "histogram",
+        "Number of database queries run per request",
+        QUERY_COUNT_BUCKETS,
+    ),
+    "curation_portal_imported_rows_total": ("counter", "Number of rows imported", None),
+    "curation_portal_exported_bytes_total": ("counter", "Number of bytes exported", None),
+    "curation_portal_export_duration_seconds": (
+        "histogram",
+        "Time taken to generate exports",
+        DURATION_BUCKETS,
+    ),
+}
+
+# Minimum number of seconds between writes of a process's metrics to the metrics directory.
+FLUSH_INTERVAL = 1
+
+
+def get_metric_key(name, labels):
+    return (name, tuple(sorted(labels.items())))
+
+
+class MetricsStore:
+    """
+    Counters and histograms for the current process.
+
+    Since app servers run multiple worker processes, each process periodically writes its
+    metrics to a separate file in CURATION_PORTAL_METRICS_DIR. Metrics are combined from
+    all files in that directory when they are read.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.pid = os.getpid()
+        # Include a unique ID in the file name so that a process with a reused PID does not
+        # replace the metrics of an earlier process.
+        self.filename = f"metrics-{self.pid}-{uuid.uuid4().hex}.json"
+        self.values = {}
+        self.last_flush_time = 0
+        self.flush_timer = None
+
+    def update(self, name, labels, value):
+        with self.lock:
+            # Metrics inherited from a parent process belong to the parent.
+            if os.getpid() != self.pid:
+                self.reset()
+
+            key = get_metric_key(name, labels)
+            metric_type, _, buckets = METRICS[name]
+            if metric_type == "counter":
+                self.values[key] = self.values.get(key, 0) + value
+            else:
+                histogram = self.values.setdefault(
+                    key, {"buckets": [0] * len(buckets), "sum": 0, "count": 0}
+                )
+                for i, bucket in enumerate(buckets):
+                    if value <= bucket:
+                        histogram["buckets"][i] += 1
+                        break
+
+                histogram["sum"] += value
+                histogram["count"] += 1
+
+        self.schedule_flush()
+
+    def get_values(self):
+        with self.lock:
+            return [
+                [name, dict(labels), copy.deepcopy(value)]
+                for (name, labels), value in self.values.items()
+            ]
+
+    def schedule_flush(self):
+        if not settings.CURATION_PORTAL_METRICS_DIR:
+            return
+
+        with self.lock:
+            time_since_flush = time.monotonic() - self.last_flush_time
+            if time_since_flush < FLUSH_INTERVAL:
+                # Make sure that the latest values are written even if no more updates are made.
+                if self.flush_timer is None:
+                    self.flush_timer = threading.Timer(
+                        FLUSH_INTERVAL - time_since_flush, self.flush
+                    )
+                    self.flush_timer.daemon = True
+                    self.flush_timer.start()
+
+                return
+
+        self.flush()
+
+    def flush(self):
+        directory = settings.CURATION_PORTAL_METRICS_DIR
+        if not directory:
+            return
+
+        with self.flush_lock:
+            with self.lock:
+                self.last_flush_time = time.monotonic()
+                self.flush_timer = None
+
+            try:
+                os.makedirs(directory, exist_ok=True)
+                # Write to a temporary file and rename it so that readers never see a partial file.
+                fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+                with os.fdopen(fd, "w") as temp_file:
+                    json.dump(self.get_values(), temp_file)
+
+                os.replace(temp_path, os.path.join(directory, self.filename))
+            except OSError:
+                logger.exception("Failed to write metrics")
+
+
+store = MetricsStore()  # pylint: disable=invalid-name
+
+
+def increment_counter(name, labels, value=1):
+    store.update(name, labels, value)
+
+
+def observe_histogram(name, labels, value):
+    store.update(name, labels, value)
+
+
+def read_metrics_files(directory):
+    for filename in os.listdir(directory):
+        if not filename.startswith("metrics-") or filename == store.filename:
+            continue
+
+        try:
+            with open(os.path.join(directory, filename)) as metrics_file:
+                yield from json.load(metrics_file)
+        except (OSError, ValueError):
+            logger.warning("Failed to read metrics file %s", filename)
+
+
+def get_combined_metrics():
+    """Return metric values combined from all processes, keyed by metric name and labels."""
+    values = store.get_values()
+
+    directory = settings.CURATION_PORTAL_METRICS_DIR
+    if directory and os.path.isdir(directory):
+        values.extend(read_metrics_files(directory))
+
+    combined = {}
+    for name, labels, value in values:
+        if name not in METRICS:
+            continue
+
+        key = get_metric_key(name, labels)
+        if METRICS[name][0] == "counter":
+            combined[key] = combined.get(key, 0) + value
+        else:
+            histogram = combined.setdefault(
+                key, {"buckets": [0] * len(METRICS[name][2]), "sum": 0, "count": 0}
+            )
+            histogram["buckets"] = [a + b for a, b in zip(histogram["buckets"], value["buckets"])]
+            histogram["sum"] += value["sum"]
+            histogram["count"] += value["count"]
+
+    return combined
+
+
+def format_labels(labels):
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in labels) + "}"
+
+
+def format_bucket(bucket):
+    return "+Inf" if bucket == float("inf") else repr(float(bucket))
+
+
+def render_metrics():
+    """Return metrics in the Prometheus text exposition format."""
+    combined = get_combined_metrics()
+
+    lines = []
+    for name, (metric_type, description, buckets) in METRICS.items():
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+        for (metric_name, labels), value in sorted(combined.items(), key=lambda item: item[0]):
+            if metric_name != name:
+                continue
+
+            if metric_type == "counter":
+                lines.append(f"{name}{format_labels(labels)} {value}")
+                continue
+
+            cumulative_count = 0
+            for bucket, count in zip((*buckets, float("inf")), (*value["buckets"], None)):
+                cumulative_count = value["count"] if count is None else cumulative_count + count
+                bucket_labels = (*labels, ("le", format_bucket(bucket)))
+                lines.append(f"{name}_bucket{format_labels(bucket_labels)} {cumulative_count}")
+
+            lines.append(f"{name}_sum{format_labels(labels)} {value['sum']}")
+            lines.append(f"{name}_count{format_labels(labels)} {value['count']}")
+
+    return "\n".join(lines) + "\n"
+
+
+def record_import(kind, num_rows):
+    increment_counter("curation_portal_imported_rows_total", {"kind": kind}, num_rows)
+
+
+def record_export(file_format, num_bytes, duration):
+    increment_counter("curation_portal_exported_bytes_total", {"format": file_format}, num_bytes)
+    observe_histogram("curation_portal_export_duration_seconds", {"format": file_format}, duration)
+
+
+def iter_measured_export(content, file_format):
+    """Yield chunks of a streamed export, recording its size and duration once it is complete."""
+    start_time = time.perf_counter()
+    num_bytes = 0
+    for chunk in content:
+        num_bytes += len(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        yield chunk
+
+    record_export(file_format, num_bytes, time.perf_counter() - start_time)
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class MetricsMiddleware:
+    """Record the number, duration, and number of database queries of requests for each view."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        query_counter = QueryCounter()
+        start_time = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(query_counter))
+
+            response = self.get_response(request)
+
+        duration = time.perf_counter() - start_time
+
+        resolver_match = getattr(request, "resolver_match", None)
+        view = (resolver_match.url_name if resolver_match else None) or "unknown"
+
+        increment_counter(
+            "curation_portal_requests_total",
+            {"view": view, "method": request.method, "status": str(response.status_code)},
+        )
+        observe_histogram("curation_portal_request_duration_seconds", {"view": view}, duration)
+        observe_histogram("curation_portal_request_queries", {"view": view}, query_counter.count)
+
+        return response
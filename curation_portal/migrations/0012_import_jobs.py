@@ -0,0 +1,96 @@
+# Generated by Django 2.2.24 on 2026-10-18 17:29
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0011_curationresult_flag_untranslated_transcript")]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportJob",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("variants", "Variants"), ("results", "Results")], max_length=10
+                    ),
+                ),
+                ("file", models.FileField(blank=True, null=True, upload_to="imports/")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("validating", "Validating"),
+                            ("importing", "Importing"),
+                            ("succeeded", "Succeeded"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("rows_processed", models.IntegerField(default=0)),
+                ("rows_imported", models.IntegerField(default=0)),
+                ("error", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="import_jobs",
+                        related_query_name="import_job",
+                        to="curation_portal.Project",
+                    ),
+                ),
+            ],
+            options={"db_table": "curation_import_job"},
+        ),
+        migrations.CreateModel(
+            name="ImportJobError",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("row", models.IntegerField(null=True)),
+                ("errors", models.TextField()),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="row_errors",
+                        related_query_name="row_error",
+                        to="curation_portal.ImportJob",
+                    ),
+                ),
+            ],
+            options={"db_table": "curation_import_job_error", "ordering": ("row",)},
+        ),
+        migrations.AddIndex(
+            model_name="importjob",
+            index=models.Index(fields=["status", "created_at"], name="import_job_status_idx"),
+        ),
+    ]
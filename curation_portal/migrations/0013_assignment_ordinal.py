@@ -0,0 +1,44 @@
+# Generated by Django 2.2.24 on 2026-10-18 17:40
+
+from django.db import migrations, models
+
+
+def set_assignment_ordinals(apps, schema_editor):  # pylint: disable=unused-argument
+    Project = apps.get_model("curation_portal", "Project")  # pylint: disable=invalid-name
+    Variant = apps.get_model("curation_portal", "Variant")  # pylint: disable=invalid-name
+    CurationAssignment = apps.get_model(  # pylint: disable=invalid-name
+        "curation_portal", "CurationAssignment"
+    )
+
+    for project in Project.objects.all():
+        variant_pks = (
+            Variant.objects.filter(project=project)
+            .order_by("xpos", "ref", "alt", "id")
+            .values_list("id", flat=True)
+        )
+        variant_ordinals = {variant_pk: ordinal for ordinal, variant_pk in enumerate(variant_pks)}
+
+        assignments = list(CurationAssignment.objects.filter(variant__project=project))
+        for assignment in assignments:
+            assignment.ordinal = variant_ordinals[assignment.variant_id]
+
+        CurationAssignment.objects.bulk_update(assignments, ["ordinal"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0012_import_jobs")]
+
+    operations = [
+        migrations.AddField(
+            model_name="curationassignment",
+            name="ordinal",
+            field=models.PositiveIntegerField(default=0),
+            preserve_default=False,
+        ),
+        migrations.RunPython(set_assignment_ordinals, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="curationassignment",
+            index=models.Index(fields=["curator", "ordinal"], name="assignment_ordinal_idx"),
+        ),
+    ]
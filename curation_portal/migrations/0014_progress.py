@@ -0,0 +1,108 @@
+# Generated by Django 2.2.24 on 2026-10-18 18:05
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+import django.db.models.deletion
+
+
+def populate_progress(apps, schema_editor):  # pylint: disable=unused-argument
+    Project = apps.get_model("curation_portal", "Project")  # pylint: disable=invalid-name
+    Variant = apps.get_model("curation_portal", "Variant")  # pylint: disable=invalid-name
+    CurationAssignment = apps.get_model(  # pylint: disable=invalid-name
+        "curation_portal", "CurationAssignment"
+    )
+    ProjectProgress = apps.get_model(  # pylint: disable=invalid-name
+        "curation_portal", "ProjectProgress"
+    )
+    CuratorProgress = apps.get_model(  # pylint: disable=invalid-name
+        "curation_portal", "CuratorProgress"
+    )
+
+    for project in Project.objects.all():
+        curator_counts = (
+            CurationAssignment.objects.filter(variant__project=project)
+            .values("curator_id")
+            .annotate(
+                total_assignments=Count("id"),
+                completed_assignments=Count("id", filter=Q(result__verdict__isnull=False)),
+            )
+            .order_by()
+        )
+        CuratorProgress.objects.bulk_create(
+            [CuratorProgress(project=project, **counts) for counts in curator_counts],
+            batch_size=500,
+        )
+
+        ProjectProgress.objects.create(
+            project=project,
+            total_variants=Variant.objects.filter(project=project).count(),
+            curated_variants=Variant.objects.filter(
+                project=project, curation_assignment__result__verdict__isnull=False
+            )
+            .values("id")
+            .distinct()
+            .count(),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0013_assignment_ordinal")]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectProgress",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="progress",
+                        serialize=False,
+                        to="curation_portal.Project",
+                    ),
+                ),
+                ("total_variants", models.PositiveIntegerField(default=0)),
+                ("curated_variants", models.PositiveIntegerField(default=0)),
+            ],
+            options={"db_table": "curation_project_progress"},
+        ),
+        migrations.CreateModel(
+            name="CuratorProgress",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("total_assignments", models.PositiveIntegerField(default=0)),
+                ("completed_assignments", models.PositiveIntegerField(default=0)),
+                (
+                    "curator",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="curation_progress",
+                        related_query_name="curation_progress",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="curator_progress",
+                        related_query_name="curator_progress",
+                        to="curation_portal.Project",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "curation_curator_progress",
+                "unique_together": {("project", "curator")},
+            },
+        ),
+        migrations.RunPython(populate_progress, migrations.RunPython.noop),
+    ]
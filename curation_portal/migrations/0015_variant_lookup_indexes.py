@@ -0,0 +1,22 @@
+# Generated by Django 2.2.24 on 2026-10-18 18:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0014_progress")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="variant",
+            index=models.Index(fields=["variant_id", "reference_genome"], name="variant_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="variant", index=models.Index(fields=["xpos"], name="variant_xpos_idx")
+        ),
+        migrations.AddIndex(
+            model_name="curationassignment",
+            index=models.Index(fields=["curator", "variant"], name="assignment_curator_idx"),
+        ),
+    ]
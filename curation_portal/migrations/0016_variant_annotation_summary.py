@@ -0,0 +1,24 @@
+# Generated by Django 2.2.24 on 2026-10-18 18:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0015_variant_lookup_indexes")]
+
+    operations = [
+        migrations.AddField(
+            model_name="variant", name="gene_symbols", field=models.TextField(blank=True, null=True)
+        ),
+        migrations.AddField(
+            model_name="variant",
+            name="major_consequence",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="variant",
+            name="major_consequence_rank",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
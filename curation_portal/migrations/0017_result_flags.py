@@ -0,0 +1,67 @@
+# Generated by Django 2.2.24 on 2026-10-18 21:05
+
+from functools import reduce
+from operator import add
+
+from django.db import migrations, models
+
+
+FLAG_BITS = {
+    "flag_mapping_error": 1 << 0,
+    "flag_genotyping_error": 1 << 1,
+    "flag_homopolymer": 1 << 2,
+    "flag_no_read_data": 1 << 3,
+    "flag_reference_error": 1 << 4,
+    "flag_strand_bias": 1 << 5,
+    "flag_mnp": 1 << 6,
+    "flag_essential_splice_rescue": 1 << 7,
+    "flag_in_frame_exon": 1 << 8,
+    "flag_minority_of_transcripts": 1 << 9,
+    "flag_weak_exon_conservation": 1 << 10,
+    "flag_last_exon": 1 << 11,
+    "flag_other_transcript_error": 1 << 12,
+    "flag_first_150_bp": 1 << 13,
+    "flag_long_exon": 1 << 14,
+    "flag_low_pext": 1 << 15,
+    "flag_pext_less_than_half_max": 1 << 16,
+    "flag_uninformative_pext": 1 << 17,
+    "flag_weak_gene_conservation": 1 << 18,
+    "flag_untranslated_transcript": 1 << 19,
+    "flag_skewed_ab": 1 << 20,
+    "flag_possible_splice_site_rescue": 1 << 21,
+}
+
+
+def set_result_flags(apps, schema_editor):  # pylint: disable=unused-argument
+    CurationResult = apps.get_model(
+        "curation_portal", "CurationResult"
+    )  # pylint: disable=invalid-name
+
+    # Compute all bitmasks with a single update query.
+    CurationResult.objects.update(
+        flags=reduce(
+            add,
+            [
+                models.Case(
+                    models.When(**{flag: True}, then=models.Value(bit)),
+                    default=models.Value(0),
+                    output_field=models.PositiveIntegerField(),
+                )
+                for flag, bit in FLAG_BITS.items()
+            ],
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0016_variant_annotation_summary")]
+
+    operations = [
+        migrations.AddField(
+            model_name="curationresult",
+            name="flags",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(set_result_flags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 2.2.24 on 2026-10-18 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0017_result_flags")]
+
+    operations = [
+        migrations.CreateModel(
+            name="CurationResultDeletion",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("project_id", models.IntegerField()),
+                ("result_id", models.IntegerField()),
+                ("variant_id", models.CharField(max_length=1000)),
+                ("curator", models.CharField(max_length=150)),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={"db_table": "curation_result_deletion"},
+        ),
+        migrations.AddIndex(
+            model_name="curationresult",
+            index=models.Index(fields=["updated_at", "id"], name="result_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="curationresultdeletion",
+            index=models.Index(
+                fields=["project_id", "deleted_at", "id"], name="result_deletion_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 2.2.24 on 2026-10-18 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0018_result_changes")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="variant",
+            index=models.Index(fields=["project", "xpos"], name="variant_project_xpos_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="variantannotation",
+            index=models.Index(fields=["gene_id"], name="annotation_gene_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="variantannotation",
+            index=models.Index(fields=["gene_symbol"], name="annotation_gene_symbol_idx"),
+        ),
+    ]
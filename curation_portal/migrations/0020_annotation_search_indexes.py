@@ -0,0 +1,44 @@
+# Generated by Django 2.2.24 on 2026-10-19 00:30
+
+from django.db import migrations, models
+
+
+# Trigram indexes allow PostgreSQL to use an index for LIKE '%...%' queries.
+# Other databases fall back to the B-tree indexes on consequence and gene symbol.
+TRIGRAM_INDEXES = {
+    "annotation_consequence_trgm_idx": "consequence",
+    "annotation_gene_symbol_trgm_idx": "gene_symbol",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):  # pylint: disable=unused-argument
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} "
+            f"ON curation_variant_annotation USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):  # pylint: disable=unused-argument
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0019_variant_locus_indexes")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="variantannotation",
+            index=models.Index(fields=["consequence"], name="annotation_consequence_idx"),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
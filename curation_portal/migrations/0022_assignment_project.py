@@ -0,0 +1,53 @@
+# Generated by Django 2.2.24 on 2026-10-19 09:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def set_assignment_projects(apps, schema_editor):  # pylint: disable=unused-argument
+    Variant = apps.get_model("curation_portal", "Variant")  # pylint: disable=invalid-name
+    CurationAssignment = apps.get_model(  # pylint: disable=invalid-name
+        "curation_portal", "CurationAssignment"
+    )
+
+    CurationAssignment.objects.update(
+        project_id=Subquery(
+            Variant.objects.filter(id=OuterRef("variant_id")).values("project_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0021_import_job_heartbeat")]
+
+    operations = [
+        migrations.AddField(
+            model_name="curationassignment",
+            name="project",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="curation_portal.Project",
+            ),
+        ),
+        migrations.RunPython(set_assignment_projects, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="curationassignment",
+            name="project",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="curation_portal.Project",
+            ),
+        ),
+        migrations.RemoveIndex(model_name="curationassignment", name="assignment_ordinal_idx"),
+        migrations.AddIndex(
+            model_name="curationassignment",
+            index=models.Index(
+                fields=["curator", "project", "ordinal"], name="assignment_project_ordinal_idx"
+            ),
+        ),
+    ]
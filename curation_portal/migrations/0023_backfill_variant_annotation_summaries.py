@@ -0,0 +1,63 @@
+# Generated by Django 2.2.24 on 2026-10-19 10:20
+
+from collections import defaultdict
+
+from django.db import migrations
+
+from curation_portal.constants import CONSEQUENCE_TERM_RANK
+
+
+def get_annotation_summary(annotations):
+    consequence_terms = [
+        term for annotation in annotations for term in annotation["consequence"].split("&")
+    ]
+    ranked_consequence_terms = sorted(
+        consequence_terms,
+        key=lambda term: CONSEQUENCE_TERM_RANK.get(term, len(CONSEQUENCE_TERM_RANK)),
+    )
+    major_consequence = ranked_consequence_terms[0] if ranked_consequence_terms else None
+
+    return {
+        "major_consequence": major_consequence,
+        "major_consequence_rank": CONSEQUENCE_TERM_RANK.get(major_consequence),
+        "gene_symbols": ",".join(sorted(set(a["gene_symbol"] for a in annotations))),
+    }
+
+
+def set_variant_annotation_summaries(apps, schema_editor):  # pylint: disable=unused-argument
+    Variant = apps.get_model("curation_portal", "Variant")  # pylint: disable=invalid-name
+    VariantAnnotation = apps.get_model(  # pylint: disable=invalid-name
+        "curation_portal", "VariantAnnotation"
+    )
+
+    # Variants created before 0016_variant_annotation_summary have no stored summary.
+    variants = Variant.objects.filter(gene_symbols__isnull=True).order_by("pk").only("id")
+
+    last_pk = 0
+    while True:
+        batch = list(variants.filter(pk__gt=last_pk)[:1000])
+        if not batch:
+            break
+
+        annotations = defaultdict(list)
+        for annotation in VariantAnnotation.objects.filter(variant__in=batch).values(
+            "variant_id", "consequence", "gene_symbol"
+        ):
+            annotations[annotation["variant_id"]].append(annotation)
+
+        for variant in batch:
+            for field, value in get_annotation_summary(annotations[variant.id]).items():
+                setattr(variant, field, value)
+
+        Variant.objects.bulk_update(
+            batch, ["major_consequence", "major_consequence_rank", "gene_symbols"]
+        )
+
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0022_assignment_project")]
+
+    operations = [migrations.RunPython(set_variant_annotation_summaries, migrations.RunPython.noop)]
@@ -0,0 +1,52 @@
+# Generated by Django 2.2.24 on 2026-10-19 11:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+
+
+def set_result_projects(apps, schema_editor):  # pylint: disable=unused-argument
+    CurationAssignment = apps.get_model(  # pylint: disable=invalid-name
+        "curation_portal", "CurationAssignment"
+    )
+    CurationResult = apps.get_model(  # pylint: disable=invalid-name
+        "curation_portal", "CurationResult"
+    )
+
+    CurationResult.objects.update(
+        project_id=Subquery(
+            CurationAssignment.objects.filter(result_id=OuterRef("pk")).values("project_id")[:1]
+        ),
+        changed_at=F("updated_at"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0023_backfill_variant_annotation_summaries")]
+
+    operations = [
+        migrations.AddField(
+            model_name="curationresult",
+            name="project",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="curation_portal.Project",
+            ),
+        ),
+        migrations.AddField(
+            model_name="curationresult",
+            name="changed_at",
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(set_result_projects, migrations.RunPython.noop),
+        migrations.RemoveIndex(model_name="curationresult", name="result_updated_idx"),
+        migrations.AddIndex(
+            model_name="curationresult",
+            index=models.Index(fields=["project", "changed_at", "id"], name="result_changed_idx"),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 2.2.24 on 2026-10-19 11:30
+
+from django.db import migrations
+
+
+# Substring filters on annotations are case insensitive. On PostgreSQL, Django compiles icontains
+# lookups to UPPER("column"::text) LIKE UPPER(...), so the trigram indexes must be built on the
+# same expression for the planner to use them.
+PLAIN_TRIGRAM_INDEXES = {
+    "annotation_consequence_trgm_idx": "consequence",
+    "annotation_gene_symbol_trgm_idx": "gene_symbol",
+}
+
+UPPER_TRIGRAM_INDEXES = {
+    "annotation_consequence_upper_trgm_idx": "consequence",
+    "annotation_gene_symbol_upper_trgm_idx": "gene_symbol",
+}
+
+
+def create_upper_trigram_indexes(apps, schema_editor):  # pylint: disable=unused-argument
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for index_name in PLAIN_TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, column in UPPER_TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} "
+            f"ON curation_variant_annotation USING gin ((UPPER({column}::text)) gin_trgm_ops)"
+        )
+
+
+def create_plain_trigram_indexes(apps, schema_editor):  # pylint: disable=unused-argument
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for index_name in UPPER_TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+    for index_name, column in PLAIN_TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} "
+            f"ON curation_variant_annotation USING gin ({column} gin_trgm_ops)"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("curation_portal", "0024_result_changed_at")]
+
+    operations = [
+        migrations.RunPython(create_upper_trigram_indexes, create_plain_trigram_indexes),
+    ]
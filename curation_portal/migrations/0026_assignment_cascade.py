@@ -0,0 +1,44 @@
+# Generated by Django 2.2.24 on 2026-10-19 12:00
+
+import curation_portal.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("curation_portal", "0025_case_insensitive_annotation_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="curationassignment",
+            name="curator",
+            field=models.ForeignKey(
+                on_delete=curation_portal.models.cascade_to_assignments,
+                related_name="curation_assignments",
+                related_query_name="curation_assignment",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="curationassignment",
+            name="project",
+            field=models.ForeignKey(
+                on_delete=curation_portal.models.cascade_to_assignments,
+                related_name="+",
+                to="curation_portal.Project",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="curationassignment",
+            name="variant",
+            field=models.ForeignKey(
+                on_delete=curation_portal.models.cascade_to_assignments,
+                related_name="curation_assignments",
+                related_query_name="curation_assignment",
+                to="curation_portal.Variant",
+            ),
+        ),
+    ]
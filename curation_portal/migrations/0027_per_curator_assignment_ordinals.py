@@ -0,0 +1,38 @@
+# Generated by Django 2.2.24 on 2026-10-19 13:00
+
+import itertools
+from operator import attrgetter
+
+from django.db import migrations
+
+
+def set_per_curator_assignment_ordinals(apps, schema_editor):  # pylint: disable=unused-argument
+    CurationAssignment = apps.get_model(  # pylint: disable=invalid-name
+        "curation_portal", "CurationAssignment"
+    )
+
+    assignments = CurationAssignment.objects.order_by(
+        "project_id", "curator_id", "variant__xpos", "variant__ref", "variant__alt", "variant_id"
+    ).only("id", "project_id", "curator_id", "ordinal")
+
+    changed_assignments = []
+    for _, curator_assignments in itertools.groupby(
+        assignments.iterator(), key=attrgetter("project_id", "curator_id")
+    ):
+        for ordinal, assignment in enumerate(curator_assignments):
+            if assignment.ordinal != ordinal:
+                assignment.ordinal = ordinal
+                changed_assignments.append(assignment)
+
+    CurationAssignment.objects.bulk_update(changed_assignments, ["ordinal"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("curation_portal", "0026_assignment_cascade"),
+    ]
+
+    operations = [
+        migrations.RunPython(set_per_curator_assignment_ordinals, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,14 @@
+import itertools
+from operator import attrgetter
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
-from django.db.models.signals import post_delete
+from django.db.models import Count, F, Q
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch.dispatcher import receiver
+from django.utils import timezone
+
+from curation_portal.constants import CONSEQUENCE_TERM_RANK
 
 
 class User(AbstractUser):
@@ -55,10 +62,46 @@ class Variant(models.Model):
     AF = models.FloatField(null=True, blank=True)
     n_homozygotes = models.IntegerField(null=True, blank=True)
 
+    # Derived from the variant's annotations when the variant is created.
+    # See get_annotation_summary.
+    major_consequence = models.CharField(max_length=100, null=True, blank=True)
+    major_consequence_rank = models.IntegerField(null=True, blank=True)
+    # Comma separated, sorted list of distinct gene symbols
+    gene_symbols = models.TextField(null=True, blank=True)
+
     class Meta:
         db_table = "curation_variant"
         unique_together = ("project", "variant_id")
         ordering = ("xpos", "ref", "alt")
+        indexes = [
+            # For looking up a variant across all projects
+            models.Index(fields=["variant_id", "reference_genome"], name="variant_id_idx"),
+            models.Index(fields=["xpos"], name="variant_xpos_idx"),
+            # For region queries within a project
+            models.Index(fields=["project", "xpos"], name="variant_project_xpos_idx"),
+        ]
+
+
+def get_annotation_summary(annotations):
+    """
+    Return values for a variant's stored major consequence and gene fields.
+
+    Annotations are dicts with "consequence" and "gene_symbol" keys.
+    """
+    consequence_terms = [
+        term for annotation in annotations for term in annotation["consequence"].split("&")
+    ]
+    ranked_consequence_terms = sorted(
+        consequence_terms,
+        key=lambda term: CONSEQUENCE_TERM_RANK.get(term, len(CONSEQUENCE_TERM_RANK)),
+    )
+    major_consequence = ranked_consequence_terms[0] if ranked_consequence_terms else None
+
+    return {
+        "major_consequence": major_consequence,
+        "major_consequence_rank": CONSEQUENCE_TERM_RANK.get(major_consequence),
+        "gene_symbols": ",".join(sorted(set(a["gene_symbol"] for a in annotations))),
+    }
 
 
 class VariantAnnotation(models.Model):
@@ -81,6 +124,14 @@ class VariantAnnotation(models.Model):
     class Meta:
         db_table = "curation_variant_annotation"
         unique_together = ("variant", "transcript_id")
+        indexes = [
+            # For looking up variants by gene
+            models.Index(fields=["gene_id"], name="annotation_gene_id_idx"),
+            models.Index(fields=["gene_symbol"], name="annotation_gene_symbol_idx"),
+            # For filtering by consequence. On PostgreSQL, substring searches on consequences and
+            # gene symbols use trigram indexes created in migration 0020_annotation_search_indexes.
+            models.Index(fields=["consequence"], name="annotation_consequence_idx"),
+        ]
 
 
 class VariantTag(models.Model):
@@ -95,16 +146,39 @@ class VariantTag(models.Model):
         db_table = "curation_variant_tag"
 
 
+def cascade_to_assignments(collector, field, sub_objs, using):
+    """
+    Delete assignments along with the variant, curator, or project that they refer to.
+
+    Deleting an assignment records the deletion of its result with the result's variant and curator
+    (see delete_assignment_result), so these are loaded along with the assignments instead of
+    separately for each assignment.
+
+    Deleting an assignment also renumbers the rest of its curator's assignments in the project (see
+    renumber_curator_assignments). That is skipped if the curator or project is being deleted too.
+    """
+    assignments = list(sub_objs.select_related("variant", "curator", "result"))
+    deleted_project_pks = {project.pk for project in collector.data.get(Project, ())}
+    deleted_curator_pks = {curator.pk for curator in collector.data.get(User, ())}
+    for assignment in assignments:
+        assignment.renumber_on_delete = (
+            assignment.project_id not in deleted_project_pks
+            and assignment.curator_id not in deleted_curator_pks
+        )
+
+    models.CASCADE(collector, field, assignments, using)
+
+
 class CurationAssignment(models.Model):
     variant = models.ForeignKey(
         Variant,
-        on_delete=models.CASCADE,
+        on_delete=cascade_to_assignments,
         related_name="curation_assignments",
         related_query_name="curation_assignment",
     )
     curator = models.ForeignKey(
         User,
-        on_delete=models.CASCADE,
+        on_delete=cascade_to_assignments,
         related_name="curation_assignments",
         related_query_name="curation_assignment",
     )
@@ -112,20 +186,151 @@ class CurationAssignment(models.Model):
         "CurationResult", null=True, on_delete=models.SET_NULL, related_name="assignment"
     )
 
+    # Copy of the variant's project. Ordinals restart in each project, so looking up a curator's
+    # assignments by ordinal requires the project to be part of the index.
+    project = models.ForeignKey(Project, on_delete=cascade_to_assignments, related_name="+")
+
+    # Position of the assignment in the curator's assignments for the project, sorted by the
+    # variants' (xpos, ref, alt). Used to find the previous/next assignment for a curator and the
+    # assignment's index without sorting or counting all of the curator's assignments.
+    ordinal = models.PositiveIntegerField()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The result that stored progress counts were last updated for. See assignment_saved.
+        if "result_id" in field_names:
+            instance.counted_result_id = instance.result_id
+        return instance
+
     class Meta:
         db_table = "curation_assignment"
         unique_together = ("variant", "curator")
+        indexes = [
+            models.Index(
+                fields=["curator", "project", "ordinal"], name="assignment_project_ordinal_idx"
+            ),
+            # The unique constraint's index starts with variant, so it can't be used to look up
+            # a curator's assignments.
+            models.Index(fields=["curator", "variant"], name="assignment_curator_idx"),
+        ]
+
+
+def sorts_before(variant, prefix=""):
+    """
+    Return a filter for variants that sort before a variant in (xpos, ref, alt) order.
+
+    prefix is prepended to field names to filter models related to variants.
+    """
+
+    def q(**lookups):
+        return Q(**{f"{prefix}{lookup}": value for lookup, value in lookups.items()})
+
+    return (
+        q(xpos__lt=variant.xpos)
+        | q(xpos=variant.xpos, ref__lt=variant.ref)
+        | q(xpos=variant.xpos, ref=variant.ref, alt__lt=variant.alt)
+        | q(xpos=variant.xpos, ref=variant.ref, alt=variant.alt, id__lt=variant.id)
+    )
+
+
+def sorts_after(variant, prefix=""):
+    """Return a filter for variants that sort after a variant in (xpos, ref, alt) order."""
+    return ~sorts_before(variant, prefix) & ~Q(**{f"{prefix}id": variant.id})
+
+
+def update_assignment_ordinals(project, curators=None):
+    """
+    Number curators' assignments in a project in (xpos, ref, alt) order.
+
+    Used after creating assignments with bulk_create, which does not send pre_save signals.
+    If curators is None, assignments for all curators in the project are numbered.
+    """
+    assignments = CurationAssignment.objects.filter(project=project)
+    if curators is not None:
+        assignments = assignments.filter(curator__in=curators)
+
+    assignments = assignments.order_by(
+        "curator_id", "variant__xpos", "variant__ref", "variant__alt", "variant_id"
+    ).only("id", "curator_id", "ordinal")
+
+    changed_assignments = []
+    for _, curator_assignments in itertools.groupby(
+        assignments.iterator(), key=attrgetter("curator_id")
+    ):
+        for ordinal, assignment in enumerate(curator_assignments):
+            if assignment.ordinal != ordinal:
+                assignment.ordinal = ordinal
+                changed_assignments.append(assignment)
+
+    CurationAssignment.objects.bulk_update(changed_assignments, ["ordinal"], batch_size=1000)
+
+
+def get_curator_assignments(assignment):
+    """Return a queryset of the assignments in the same curator's list as an assignment."""
+    return CurationAssignment.objects.filter(
+        curator_id=assignment.curator_id, project_id=assignment.project_id
+    )
+
+
+@receiver(pre_save, sender=CurationAssignment)
+def set_assignment_ordinal(sender, instance, *args, **kwargs):  # pylint: disable=unused-argument
+    if instance.project_id is None:
+        instance.project_id = instance.variant.project_id
+
+    if instance.ordinal is None:
+        variant = instance.variant
+        curator_assignments = get_curator_assignments(instance)
+        instance.ordinal = curator_assignments.filter(sorts_before(variant, "variant__")).count()
+        curator_assignments.filter(sorts_after(variant, "variant__")).update(
+            ordinal=F("ordinal") + 1
+        )
 
 
 @receiver(post_delete, sender=CurationAssignment)
 def delete_assignment_result(sender, instance, *args, **kwargs):  # pylint: disable=unused-argument
     if instance.result:
+        # Record the deletion for the results change feed. When assignments are deleted along with
+        # their variant, curator, or project, these are already loaded. See cascade_to_assignments.
+        CurationResultDeletion.objects.create(
+            project_id=instance.project_id,
+            result_id=instance.result_id,
+            variant_id=instance.variant.variant_id,
+            curator=instance.curator.username,
+        )
+
         instance.result.delete()
 
 
+@receiver(post_delete, sender=CurationAssignment)
+def renumber_curator_assignments(
+    sender, instance, *args, **kwargs
+):  # pylint: disable=unused-argument
+    if getattr(instance, "renumber_on_delete", True):
+        # Shift assignments by variant order instead of by ordinal. When several assignments are
+        # deleted together, earlier signals may already have changed the remaining ordinals.
+        get_curator_assignments(instance).filter(sorts_after(instance.variant, "variant__")).update(
+            ordinal=F("ordinal") - 1
+        )
+
+
+@receiver(post_delete, sender=Project)
+def delete_project_result_deletions(
+    sender, instance, *args, **kwargs
+):  # pylint: disable=unused-argument
+    CurationResultDeletion.objects.filter(project_id=instance.id).delete()
+
+
 class CurationResult(models.Model):
+    # Copy of the result's assignment's project, so that changes to a project's results can be
+    # listed using an index. Set when the result is assigned. See assignment_saved.
+    project = models.ForeignKey(Project, null=True, on_delete=models.SET_NULL, related_name="+")
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Time the result was last saved. Unlike updated_at, this can't be set by imported results.
+    # Used to list changes to a project's results. See ProjectResultChangesView.
+    changed_at = models.DateTimeField(auto_now=True)
 
     # Flags
     ## Technical
@@ -155,6 +360,9 @@ class CurationResult(models.Model):
     flag_skewed_ab = models.BooleanField(default=False)
     flag_possible_splice_site_rescue = models.BooleanField(default=False)
 
+    # Bitmask of the flag fields above. See FLAG_BITS.
+    flags = models.PositiveIntegerField(default=0)
+
     # Notes
     notes = models.TextField(null=True, blank=True)
     should_revisit = models.BooleanField(default=False)
@@ -162,8 +370,39 @@ class CurationResult(models.Model):
     # Decision
     verdict = models.CharField(max_length=25, null=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Whether stored progress counts include this result as completed. See assignment_saved.
+        if "verdict" in field_names:
+            instance.counted_as_completed = instance.verdict is not None
+        return instance
+
     class Meta:
         db_table = "curation_result"
+        indexes = [models.Index(fields=["project", "changed_at", "id"], name="result_changed_idx")]
+
+
+class CurationResultDeletion(models.Model):
+    """
+    Record of a deleted result, so that clients syncing changes to a project's results
+    can remove it from their copy.
+    """
+
+    # These are not foreign keys so that deletions are still listed after the result's
+    # variant or curator have been deleted.
+    project_id = models.IntegerField()
+    result_id = models.IntegerField()
+    variant_id = models.CharField(max_length=1000)
+    curator = models.CharField(max_length=150)
+
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "curation_result_deletion"
+        indexes = [
+            models.Index(fields=["project_id", "deleted_at", "id"], name="result_deletion_idx")
+        ]
 
 
 FLAG_FIELDS = [
@@ -203,3 +442,346 @@ FLAG_LABELS = {
     "flag_pext_less_than_half_max": "Flag pext < 50% max",
     "flag_uninformative_pext": "Flag Uninformative pext",
 }
+
+
+# Flags are also stored as a bitmask in CurationResult.flags so that results can be filtered by
+# sets of flags with a single integer expression. Bits must not be reassigned, since they are
+# stored in the database, so new flags should be given the next unused bit.
+FLAG_BITS = {
+    "flag_mapping_error": 1 << 0,
+    "flag_genotyping_error": 1 << 1,
+    "flag_homopolymer": 1 << 2,
+    "flag_no_read_data": 1 << 3,
+    "flag_reference_error": 1 << 4,
+    "flag_strand_bias": 1 << 5,
+    "flag_mnp": 1 << 6,
+    "flag_essential_splice_rescue": 1 << 7,
+    "flag_in_frame_exon": 1 << 8,
+    "flag_minority_of_transcripts": 1 << 9,
+    "flag_weak_exon_conservation": 1 << 10,
+    "flag_last_exon": 1 << 11,
+    "flag_other_transcript_error": 1 << 12,
+    "flag_first_150_bp": 1 << 13,
+    "flag_long_exon": 1 << 14,
+    "flag_low_pext": 1 << 15,
+    "flag_pext_less_than_half_max": 1 << 16,
+    "flag_uninformative_pext": 1 << 17,
+    "flag_weak_gene_conservation": 1 << 18,
+    "flag_untranslated_transcript": 1 << 19,
+    "flag_skewed_ab": 1 << 20,
+    "flag_possible_splice_site_rescue": 1 << 21,
+}
+
+
+FLAG_GROUPS = {
+    "technical": FLAG_FIELDS[0:6],
+    "rescue": FLAG_FIELDS[6:9],
+    "impact": FLAG_FIELDS[9:20],
+    "comment": FLAG_FIELDS[20:22],
+}
+
+
+def mark_results_changed(project_id, since):
+    """
+    Set the changed time of a project's results saved since a time to the current time.
+
+    Changes are listed by the time they were saved, but are only visible once their transaction
+    is committed. Calling this at the end of a long transaction keeps changes saved early in
+    the transaction from being listed as older than they appear to clients.
+    """
+    CurationResult.objects.filter(project_id=project_id, changed_at__gte=since).update(
+        changed_at=timezone.now()
+    )
+
+
+def get_flags_bitmask(result):
+    """Return the bitmask for the flags set on a result."""
+    return sum(bit for flag, bit in FLAG_BITS.items() if getattr(result, flag))
+
+
+def get_flags_from_bitmask(bitmask):
+    """Return a map of flag field name to whether or not the flag is set in a bitmask."""
+    return {flag: bool(bitmask & bit) for flag, bit in FLAG_BITS.items()}
+
+
+@receiver(pre_save, sender=CurationResult)
+def set_result_flags(sender, instance, *args, **kwargs):  # pylint: disable=unused-argument
+    instance.flags = get_flags_bitmask(instance)
+
+
+class ImportJob(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_VALIDATING = "validating"
+    STATUS_IMPORTING = "importing"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="import_jobs",
+        related_query_name="import_job",
+    )
+    kind = models.CharField(
+        max_length=10, choices=[("variants", "Variants"), ("results", "Results")]
+    )
+    file = models.FileField(upload_to="imports/", null=True, blank=True)
+
+    status = models.CharField(
+        max_length=10,
+        choices=[
+            (STATUS_PENDING, "Pending"),
+            (STATUS_VALIDATING, "Validating"),
+            (STATUS_IMPORTING, "Importing"),
+            (STATUS_SUCCEEDED, "Succeeded"),
+            (STATUS_FAILED, "Failed"),
+        ],
+        default=STATUS_PENDING,
+    )
+    rows_processed = models.IntegerField(default=0)
+    rows_imported = models.IntegerField(default=0)
+    error = models.TextField(null=True, blank=True)
+
+    created_by = models.ForeignKey(User, null=True, on_delete=models.SET_NULL)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Updated by the worker running the job as it makes progress. Used to detect jobs that
+    # were left running by a worker that crashed or was killed.
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "curation_import_job"
+        indexes = [models.Index(fields=["status", "created_at"], name="import_job_status_idx")]
+
+
+class ImportJobError(models.Model):
+    job = models.ForeignKey(
+        ImportJob,
+        on_delete=models.CASCADE,
+        related_name="row_errors",
+        related_query_name="row_error",
+    )
+
+    # Line number for newline-delimited JSON files or position in the list for JSON files.
+    row = models.IntegerField(null=True)
+    # JSON encoded validation errors
+    errors = models.TextField()
+
+    class Meta:
+        db_table = "curation_import_job_error"
+        ordering = ("row",)
+
+
+class ProjectProgress(models.Model):
+    project = models.OneToOneField(
+        Project, on_delete=models.CASCADE, primary_key=True, related_name="progress"
+    )
+
+    total_variants = models.PositiveIntegerField(default=0)
+    # Number of variants with at least one completed assignment
+    curated_variants = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "curation_project_progress"
+
+
+class CuratorProgress(models.Model):
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="curator_progress",
+        related_query_name="curator_progress",
+    )
+    curator = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="curation_progress",
+        related_query_name="curation_progress",
+    )
+
+    total_assignments = models.PositiveIntegerField(default=0)
+    completed_assignments = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "curation_curator_progress"
+        unique_together = ("project", "curator")
+
+
+def get_curator_progress_counts(project_id, curator_ids=None):
+    """Return a map of curator ID to assignment counts for a project."""
+    assignments = CurationAssignment.objects.filter(variant__project_id=project_id)
+    if curator_ids is not None:
+        assignments = assignments.filter(curator_id__in=curator_ids)
+
+    counts = (
+        assignments.values("curator_id")
+        .annotate(
+            total_assignments=Count("id"),
+            completed_assignments=Count("id", filter=Q(result__verdict__isnull=False)),
+        )
+        .order_by()
+    )
+    return {
+        row["curator_id"]: {
+            "total_assignments": row["total_assignments"],
+            "completed_assignments": row["completed_assignments"],
+        }
+        for row in counts
+    }
+
+
+def get_project_progress_counts(project_id):
+    return {
+        "total_variants": Variant.objects.filter(project_id=project_id).count(),
+        "curated_variants": Variant.objects.filter(
+            project_id=project_id, curation_assignment__result__verdict__isnull=False
+        )
+        .values("id")
+        .distinct()
+        .count(),
+    }
+
+
+def save_progress(model, lookup, counts):
+    if not model.objects.filter(**lookup).update(**counts):
+        model.objects.create(**lookup, **counts)
+
+
+def update_project_progress(project_id):
+    """
+    Recompute progress for a project and all of its curators.
+
+    This must be called after bulk creating variants, assignments, or results, since
+    bulk operations do not send the signals that keep progress up to date.
+    """
+    curator_counts = get_curator_progress_counts(project_id)
+
+    CuratorProgress.objects.filter(project_id=project_id).delete()
+    CuratorProgress.objects.bulk_create(
+        [
+            CuratorProgress(project_id=project_id, curator_id=curator_id, **counts)
+            for curator_id, counts in curator_counts.items()
+        ],
+        batch_size=500,
+    )
+
+    save_progress(
+        ProjectProgress, {"project_id": project_id}, get_project_progress_counts(project_id)
+    )
+
+
+def update_curator_progress(project_id, curator_id):
+    """Recompute progress for one curator in a project."""
+    counts = get_curator_progress_counts(project_id, [curator_id]).get(curator_id)
+    lookup = {"project_id": project_id, "curator_id": curator_id}
+    if counts:
+        save_progress(CuratorProgress, lookup, counts)
+    else:
+        CuratorProgress.objects.filter(**lookup).delete()
+
+    save_progress(
+        ProjectProgress, {"project_id": project_id}, get_project_progress_counts(project_id)
+    )
+
+
+def adjust_progress(assignment, total_change, completed_change):
+    """
+    Adjust stored progress counts for a change to one assignment.
+
+    Counts are incremented/decremented in the database instead of recomputed, so that saving
+    a result does not count all of a project's assignments.
+    """
+    if total_change or completed_change:
+        updated = CuratorProgress.objects.filter(
+            project_id=assignment.project_id, curator_id=assignment.curator_id
+        ).update(
+            total_assignments=F("total_assignments") + total_change,
+            completed_assignments=F("completed_assignments") + completed_change,
+        )
+        if not updated:
+            # This is the curator's first assignment in the project.
+            save_progress(
+                CuratorProgress,
+                {"project_id": assignment.project_id, "curator_id": assignment.curator_id},
+                get_curator_progress_counts(assignment.project_id, [assignment.curator_id])[
+                    assignment.curator_id
+                ],
+            )
+
+    # A variant is curated if any of its assignments are completed, so the number of curated
+    # variants only changes if no other assignment for the variant is completed.
+    if completed_change:
+        other_completed_assignments = CurationAssignment.objects.filter(
+            variant_id=assignment.variant_id, result__verdict__isnull=False
+        ).exclude(id=assignment.id)
+        if not other_completed_assignments.exists():
+            ProjectProgress.objects.filter(project_id=assignment.project_id).update(
+                curated_variants=F("curated_variants") + completed_change
+            )
+
+
+@receiver(post_save, sender=Variant)
+def variant_saved(sender, instance, created, *args, **kwargs):  # pylint: disable=unused-argument
+    if created:
+        updated = ProjectProgress.objects.filter(project_id=instance.project_id).update(
+            total_variants=F("total_variants") + 1
+        )
+        if not updated:
+            save_progress(
+                ProjectProgress,
+                {"project_id": instance.project_id},
+                get_project_progress_counts(instance.project_id),
+            )
+
+
+@receiver(post_save, sender=CurationAssignment)
+def assignment_saved(sender, instance, created, *args, **kwargs):  # pylint: disable=unused-argument
+    result = instance.result
+    completed = result is not None and result.verdict is not None
+
+    # Progress counts are adjusted based on whether the assignment was completed when counts
+    # were last updated, which is tracked on the assignment and result instances.
+    counted_result_id = getattr(instance, "counted_result_id", None)
+    if created or counted_result_id is None:
+        was_completed = False
+    elif counted_result_id == instance.result_id and hasattr(result, "counted_as_completed"):
+        was_completed = result.counted_as_completed
+    else:
+        # The assignment's result was replaced, so its previous state is not known.
+        update_curator_progress(instance.project_id, instance.curator_id)
+        was_completed = None
+
+    if was_completed is not None:
+        adjust_progress(instance, int(created), int(completed) - int(was_completed))
+
+    instance.counted_result_id = instance.result_id
+    if result is not None:
+        result.counted_as_completed = completed
+
+        if result.project_id != instance.project_id:
+            CurationResult.objects.filter(pk=result.pk).update(project_id=instance.project_id)
+            result.project_id = instance.project_id
+
+
+@receiver(post_delete, sender=CurationAssignment)
+def assignment_deleted(sender, instance, *args, **kwargs):  # pylint: disable=unused-argument
+    # When an assignment is deleted as part of deleting its project or curator, the progress
+    # rows may already be deleted. Decrementing counts with an update is a no-op in that case,
+    # where recomputing counts would recreate them.
+    completed = bool(instance.result and instance.result.verdict is not None)
+
+    CuratorProgress.objects.filter(
+        project__variant=instance.variant_id, curator_id=instance.curator_id
+    ).update(
+        total_assignments=F("total_assignments") - 1,
+        completed_assignments=F("completed_assignments") - int(completed),
+    )
+
+    if completed:
+        project_progress = ProjectProgress.objects.filter(project__variant=instance.variant_id)
+        other_completed_assignments = CurationAssignment.objects.filter(
+            variant_id=instance.variant_id, result__verdict__isnull=False
+        ).exclude(id=instance.id)
+        if not other_completed_assignments.exists():
+            project_progress.update(curated_variants=F("curated_variants") - 1)
@@ -0,0 +1,59 @@
+import base64
+import binascii
+import json
+
+from rest_framework.exceptions import ParseError
+
+
+def encode_cursor(values):
+    """Return a cursor for a list of JSON serializable values identifying the last item on a page."""
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor, *converters):
+    """
+    Return a tuple of the values in a cursor, converted with the corresponding function in converters.
+
+    Raises ParseError if the cursor is invalid.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(converters):
+            raise ValueError
+
+        return tuple(convert(value) for convert, value in zip(converters, values))
+    except (binascii.Error, TypeError, UnicodeError, ValueError):
+        raise ParseError("Invalid cursor")
+
+
+def get_page(queryset, page_size):
+    """Return a list of up to page_size items from a queryset and whether there are more items."""
+    # Fetch one extra item to determine if there is another page.
+    page = list(queryset[: page_size + 1])
+    return page[:page_size], len(page) > page_size
+
+
+class CursorPaginationMixin:
+    """
+    Mixin for views that list items one page at a time.
+
+    The page size is read from the page_size query parameter. If no page size is given,
+    default_page_size is used. Page sizes are limited to max_page_size.
+    """
+
+    default_page_size = 100
+    max_page_size = 1000
+
+    def get_page_size(self):
+        if "page_size" not in self.request.query_params:
+            return self.default_page_size
+
+        try:
+            page_size = int(self.request.query_params["page_size"])
+        except ValueError:
+            raise ParseError("Invalid page size")
+
+        if page_size < 1:
+            raise ParseError("Invalid page size")
+
+        return min(page_size, self.max_page_size)
@@ -0,0 +1,41 @@
+import gzip
+import json
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+def iter_ndjson(stream):
+    """Yield (line number, parsed value) for each non-blank line of a newline-delimited JSON stream."""
+    try:
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as exc:
+                raise ParseError(f"JSON parse error on line {line_number} - {exc}")
+    except (EOFError, OSError):
+        # Raised by GzipFile for truncated or invalid compressed data.
+        raise ParseError("Invalid gzip compressed data")
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline-delimited JSON.
+
+    Parsed data is an iterator of (line number, value) pairs that reads from the request
+    stream as it is consumed, so that the request body is never held in memory all at once.
+    Gzip compressed request bodies are supported with a "Content-Encoding: gzip" header.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        request = (parser_context or {}).get("request")
+        if request is not None and request.META.get("HTTP_CONTENT_ENCODING") == "gzip":
+            stream = gzip.GzipFile(fileobj=stream)
+
+        return iter_ndjson(stream)
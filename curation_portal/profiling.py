@@ -0,0 +1,199 @@
+import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework.serializers import BaseSerializer
+from rules.permissions import ObjectPermissionBackend
+
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+# Number of queries included in slow request samples.
+MAX_SAMPLED_QUERIES = 20
+
+
+class RequestProfile:
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.duration = None
+        self.queries = []
+        self.timings = defaultdict(float)
+        self.active_sections = set()
+
+    def record_query(self, execute, sql, params, many, context):
+        start_time = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start_time))
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.start_time
+
+    def get_summary(self):
+        return {
+            "total_ms": round(self.duration * 1000, 3),
+            "db_ms": round(sum(duration for _, duration in self.queries) * 1000, 3),
+            "queries": len(self.queries),
+            "permissions_ms": round(self.timings["permissions"] * 1000, 3),
+            "serialization_ms": round(self.timings["serialization"] * 1000, 3),
+        }
+
+    def get_slowest_queries(self):
+        queries = sorted(self.queries, key=lambda query: query[1], reverse=True)
+        return [
+            {"sql": sql, "duration_ms": round(duration * 1000, 3)}
+            for sql, duration in queries[:MAX_SAMPLED_QUERIES]
+        ]
+
+
+def get_current_profile():
+    return getattr(_local, "profile", None)
+
+
+@contextmanager
+def profile_section(name):
+    """
+    Add time spent in the block to the current request's profile, if there is one.
+
+    Sections nested in a section with the same name are only counted once.
+    """
+    profile = get_current_profile()
+    if profile is None or name in profile.active_sections:
+        yield
+        return
+
+    profile.active_sections.add(name)
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.timings[name] += time.perf_counter() - start_time
+        profile.active_sections.discard(name)
+
+
+def profile_serializers():
+    """
+    Record time spent building serializers' data as serialization time.
+
+    Views read serializer data before returning a response, so it is not included in the time
+    spent rendering responses. All serializers' data properties call BaseSerializer.data.
+    """
+    data_property = BaseSerializer.data
+    if getattr(data_property.fget, "profiled", False):
+        return
+
+    def get_data(self):
+        with profile_section("serialization"):
+            return data_property.fget(self)
+
+    get_data.profiled = True
+    BaseSerializer.data = property(get_data)
+
+
+def get_server_timing_header(summary):
+    return ", ".join(
+        [
+            f'db;dur={summary["db_ms"]};desc="{summary["queries"]} queries"',
+            f'perm;dur={summary["permissions_ms"]};desc="Permission checks"',
+            f'ser;dur={summary["serialization_ms"]};desc="Serialization"',
+            f'total;dur={summary["total_ms"]}',
+        ]
+    )
+
+
+def write_slow_request_sample(sample):
+    with open(settings.CURATION_PORTAL_PROFILING_SLOW_REQUEST_FILE, "a") as sample_file:
+        sample_file.write(json.dumps(sample) + "\n")
+
+
+class ProfilingMiddleware:
+    """
+    Record database, permission check, and serialization time for each request.
+
+    Timings are added to responses in a Server-Timing header and logged. Requests that take
+    longer than CURATION_PORTAL_PROFILING_SLOW_REQUEST_MS are sampled to a file along with
+    their slowest queries.
+    """
+
+    def __init__(self, get_response):
+        if not settings.CURATION_PORTAL_PROFILING:
+            raise MiddlewareNotUsed
+
+        profile_serializers()
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        _local.profile = profile
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(profile.record_query))
+
+                response = self.get_response(request)
+        finally:
+            del _local.profile
+
+        profile.finish()
+        summary = profile.get_summary()
+        response["Server-Timing"] = get_server_timing_header(summary)
+
+        log_entry = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "user": request.user.username if request.user.is_authenticated else None,
+            **summary,
+        }
+        logger.info(json.dumps(log_entry))
+
+        if (
+            settings.CURATION_PORTAL_PROFILING_SLOW_REQUEST_FILE
+            and summary["total_ms"] >= settings.CURATION_PORTAL_PROFILING_SLOW_REQUEST_MS
+            and random.random() < settings.CURATION_PORTAL_PROFILING_SLOW_REQUEST_SAMPLE_RATE
+        ):
+            try:
+                write_slow_request_sample(
+                    {
+                        **log_entry,
+                        "query_string": request.META.get("QUERY_STRING", ""),
+                        "slowest_queries": profile.get_slowest_queries(),
+                    }
+                )
+            except OSError:
+                logger.exception("Failed to write slow request sample")
+
+        return response
+
+    def process_template_response(self, request, response):  # pylint: disable=no-self-use
+        # Rest Framework responses are rendered (their data is serialized to JSON) after the
+        # view returns and template response middleware has run.
+        profile = get_current_profile()
+        if profile is not None:
+            start_time = time.perf_counter()
+
+            def record_render_time(response):  # pylint: disable=unused-argument
+                profile.timings["serialization"] += time.perf_counter() - start_time
+
+            response.add_post_render_callback(record_render_time)
+
+        return response
+
+
+class ProfiledObjectPermissionBackend(ObjectPermissionBackend):
+    """Object permission backend that records time spent checking permissions."""
+
+    def has_perm(self, user, perm, *args, **kwargs):
+        with profile_section("permissions"):
+            return super().has_perm(user, perm, *args, **kwargs)
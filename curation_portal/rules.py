@@ -1,15 +1,98 @@
+import threading
+from contextlib import contextmanager
+
 import rules
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch.dispatcher import receiver
+
+from curation_portal.models import CurationAssignment, Project, User
+
+
+# Permission checks often need the same information several times while handling a request.
+# While a request is being handled, the projects a user owns and curates and the user's
+# permissions are loaded once and stored here.
+_permission_cache = threading.local()
+
+
+@contextmanager
+def permission_cache():
+    _permission_cache.users = {}
+    try:
+        yield
+    finally:
+        del _permission_cache.users
+
+
+def clear_permission_cache():
+    users = getattr(_permission_cache, "users", None)
+    if users is not None:
+        users.clear()
+
+
+def get_cached(user, key, load):
+    users = getattr(_permission_cache, "users", None)
+    if users is None or not user.is_authenticated:
+        return None
+
+    user_cache = users.setdefault(user.id, {})
+    if key not in user_cache:
+        user_cache[key] = load()
+
+    return user_cache[key]
+
 
-from curation_portal.models import CurationAssignment
+def load_owned_project_ids(user):
+    return set(user.owned_projects.values_list("id", flat=True))
+
+
+def load_curated_project_ids(user):
+    return set(
+        CurationAssignment.objects.filter(curator=user)
+        .values_list("variant__project_id", flat=True)
+        .order_by()
+        .distinct()
+    )
+
+
+def get_owned_project_ids(user):
+    return get_cached(user, "owned_project_ids", lambda: load_owned_project_ids(user))
+
+
+def get_curated_project_ids(user):
+    return get_cached(user, "curated_project_ids", lambda: load_curated_project_ids(user))
+
+
+def get_permission_codenames(user):
+    return get_cached(
+        user,
+        "permission_codenames",
+        lambda: set(user.user_permissions.values_list("codename", flat=True)),
+    )
+
+
+@receiver(post_save, sender=CurationAssignment)
+@receiver(post_delete, sender=CurationAssignment)
+@receiver(m2m_changed, sender=Project.owners.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def project_permissions_changed(*args, **kwargs):  # pylint: disable=unused-argument
+    clear_permission_cache()
 
 
 @rules.predicate
 def is_project_owner(user, project):
+    owned_project_ids = get_owned_project_ids(user)
+    if owned_project_ids is not None:
+        return project.id in owned_project_ids
+
     return project.owners.filter(id=user.id).exists()
 
 
 @rules.predicate
 def is_project_curator(user, project):
+    curated_project_ids = get_curated_project_ids(user)
+    if curated_project_ids is not None:
+        return project.id in curated_project_ids
+
     return CurationAssignment.objects.filter(curator=user, variant__project=project).exists()
 
 
@@ -19,6 +102,10 @@ rules.add_perm("curation_portal.change_project", is_project_owner)
 
 @rules.predicate
 def can_add_variants(user):
+    permission_codenames = get_permission_codenames(user)
+    if permission_codenames is not None:
+        return "add_variant" in permission_codenames
+
     return user.user_permissions.filter(codename="add_variant").exists()
 
 
@@ -1,9 +1,14 @@
+import itertools
 from collections import Counter, defaultdict
 
 from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.core.validators import MaxLengthValidator
+from django.db import connection
+from django.db.models import Max
 from rest_framework.serializers import (
+    CharField,
     ChoiceField,
+    DateTimeField,
     ListSerializer,
     ModelSerializer,
     RegexField,
@@ -20,11 +25,35 @@ from curation_portal.models import (
     Variant,
     VariantAnnotation,
     VariantTag,
+    get_annotation_summary,
+    get_flags_bitmask,
+    update_assignment_ordinals,
+    update_project_progress,
 )
 
 
 VARIANT_ID_REGEX = r"^(\d+|X|Y)[-:]([0-9]+)[-:]([ACGT]+)[-:]([ACGT]+)$"
 
+# Maximum number of rows to insert per query when bulk creating objects.
+BULK_CREATE_BATCH_SIZE = 1000
+
+# Number of variants to validate and save at a time when uploading variants from a stream.
+VARIANT_UPLOAD_CHUNK_SIZE = 500
+
+# Maximum number of values to pass to an `__in` filter. Larger lists may exceed the
+# database's limit on the number of parameters in a query.
+MAX_FILTER_VALUES = 500
+
+
+def chunks(iterable, size):
+    """Split an iterable into lists of at most `size` items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 class UserSettingsSerializer(ModelSerializer):
     class Meta:
@@ -55,6 +84,33 @@ class UserField(RelatedField):
         return value.username
 
 
+class UsernameField(CharField):
+    """A username that is validated, but not looked up, when deserializing."""
+
+    def __init__(self, **kwargs):
+        # These match the validators applied to Django's default User model's username field.
+        kwargs["max_length"] = 150
+        kwargs["validators"] = [UnicodeUsernameValidator()]
+        super().__init__(**kwargs)
+
+
+def get_or_create_users(usernames):
+    """Return a map of username to User for the given usernames, creating any users that do not exist."""
+    usernames = set(usernames)
+
+    users = {}
+    for chunk in chunks(usernames, MAX_FILTER_VALUES):
+        users.update({user.username: user for user in User.objects.filter(username__in=chunk)})
+
+    new_usernames = usernames - users.keys()
+    if new_usernames:
+        bulk_create(User, [User(username=username) for username in new_usernames])
+        for chunk in chunks(new_usernames, MAX_FILTER_VALUES):
+            users.update({user.username: user for user in User.objects.filter(username__in=chunk)})
+
+    return users
+
+
 class ProjectSerializer(ModelSerializer):
     owners = UserField(many=True, allow_empty=False)
 
@@ -101,7 +157,84 @@ class VariantTagSerializer(ModelSerializer):
         exclude = ("id", "variant")
 
 
+def bulk_create(model, objs, **kwargs):
+    """Insert objects in as few queries as the database allows."""
+    # Django 2.2 does not limit an explicit batch_size to what the database backend supports.
+    batch_size = min(
+        BULK_CREATE_BATCH_SIZE, connection.ops.bulk_batch_size(model._meta.concrete_fields, objs)
+    )
+    return model.objects.bulk_create(objs, batch_size=max(batch_size, 1), **kwargs)
+
+
+def bulk_create_with_pks(model, objs):
+    """Bulk create objects and set their primary keys."""
+    # Not all databases return primary keys from bulk inserts. For those databases, assign
+    # primary keys before inserting. This relies on the database serializing transactions
+    # that write to the table, so it must be run in a transaction.
+    if not connection.features.can_return_ids_from_bulk_insert:
+        max_pk = model.objects.aggregate(max_pk=Max("pk"))["max_pk"] or 0
+        for pk, obj in enumerate(objs, max_pk + 1):
+            obj.pk = pk
+
+    return bulk_create(model, objs)
+
+
+def get_variant_pks(project, variant_ids):
+    """Return a map of variant ID to primary key for the given variant IDs that exist in a project."""
+    variant_ids = set(variant_ids)
+
+    variants = Variant.objects.filter(project=project).order_by()
+    # For long lists of variant IDs, fetch all of the project's variants instead of filtering
+    # on the list. Either way, this is a single query.
+    if len(variant_ids) <= MAX_FILTER_VALUES:
+        variants = variants.filter(variant_id__in=variant_ids)
+
+    return {
+        variant_id: pk
+        for variant_id, pk in variants.values_list("variant_id", "id")
+        if variant_id in variant_ids
+    }
+
+
+def get_existing_assignments(project, variant_ids):
+    """Return the set of (curator username, variant ID) pairs assigned in a project for the given variant IDs."""
+    variant_ids = set(variant_ids)
+
+    assignments = CurationAssignment.objects.filter(variant__project=project)
+    # As in get_variant_pks, either filter on the list of variant IDs or fetch all of
+    # the project's assignments.
+    if len(variant_ids) <= MAX_FILTER_VALUES:
+        assignments = assignments.filter(variant__variant_id__in=variant_ids)
+
+    return {
+        (curator, variant_id)
+        for curator, variant_id in assignments.values_list(
+            "curator__username", "variant__variant_id"
+        )
+        if variant_id in variant_ids
+    }
+
+
 class VariantListSerializer(ListSerializer):  # pylint: disable=abstract-method
+    existing_variant_ids = None
+
+    def to_internal_value(self, data):
+        # Look up which variants already exist in the project with one query for the whole list
+        # instead of one query per variant in VariantSerializer.validate.
+        if isinstance(data, list):
+            self.existing_variant_ids = set(
+                get_variant_pks(
+                    self.context["project"],
+                    [
+                        item["variant_id"]
+                        for item in data
+                        if isinstance(item, dict) and "variant_id" in item
+                    ],
+                )
+            )
+
+        return super().to_internal_value(data)
+
     def validate(self, attrs):
         # Check that all variant IDs in the list are unique
         variant_id_counts = Counter(variant_data["variant_id"] for variant_data in attrs)
@@ -111,6 +244,53 @@ class VariantListSerializer(ListSerializer):  # pylint: disable=abstract-method
 
         return attrs
 
+    def create(self, validated_data):
+        project = self.context["project"]
+
+        variants = []
+        annotations_data = {}
+        tags_data = {}
+        for item in validated_data:
+            variant_id = item["variant_id"]
+            annotations_data[variant_id] = item.pop("annotations", None) or []
+            tags_data[variant_id] = item.pop("tags", None) or []
+            variants.append(
+                Variant(
+                    **item,
+                    **variant_id_parts(variant_id),
+                    **get_annotation_summary(annotations_data[variant_id]),
+                    project=project,
+                )
+            )
+
+        bulk_create(Variant, variants)
+
+        # Not all databases return primary keys from bulk inserts.
+        if any(variant.pk is None for variant in variants):
+            variant_pks = get_variant_pks(project, annotations_data.keys())
+            for variant in variants:
+                variant.pk = variant_pks[variant.variant_id]
+
+        bulk_create(
+            VariantAnnotation,
+            [
+                VariantAnnotation(**item, variant=variant)
+                for variant in variants
+                for item in annotations_data[variant.variant_id]
+            ],
+        )
+
+        bulk_create(
+            VariantTag,
+            [
+                VariantTag(**item, variant=variant)
+                for variant in variants
+                for item in tags_data[variant.variant_id]
+            ],
+        )
+
+        return variants
+
 
 class VariantSerializer(ModelSerializer):
     variant_id = RegexField(VARIANT_ID_REGEX, required=True)
@@ -120,13 +300,32 @@ class VariantSerializer(ModelSerializer):
 
     class Meta:
         model = Variant
-        exclude = ("project", "chrom", "pos", "xpos", "ref", "alt")
+        exclude = (
+            "project",
+            "chrom",
+            "pos",
+            "xpos",
+            "ref",
+            "alt",
+            "major_consequence",
+            "major_consequence_rank",
+            "gene_symbols",
+        )
         list_serializer_class = VariantListSerializer
 
     def validate(self, attrs):
         variant_id = attrs["variant_id"]
 
-        if Variant.objects.filter(variant_id=variant_id, project=self.context["project"]).exists():
+        # When validating a list of variants, the list serializer looks up existing variants.
+        existing_variant_ids = getattr(self.parent, "existing_variant_ids", None)
+        if existing_variant_ids is None:
+            variant_exists = Variant.objects.filter(
+                variant_id=variant_id, project=self.context["project"]
+            ).exists()
+        else:
+            variant_exists = variant_id in existing_variant_ids
+
+        if variant_exists:
             raise ValidationError("Variant already exists in project")
 
         return attrs
@@ -137,7 +336,10 @@ class VariantSerializer(ModelSerializer):
 
         variant_id = validated_data["variant_id"]
         variant = Variant.objects.create(
-            **validated_data, **variant_id_parts(variant_id), project=self.context["project"]
+            **validated_data,
+            **variant_id_parts(variant_id),
+            **get_annotation_summary(annotations_data or []),
+            project=self.context["project"],
         )
 
         if annotations_data:
@@ -151,7 +353,61 @@ class VariantSerializer(ModelSerializer):
         return variant
 
 
+def create_variants_from_stream(project, numbered_variants_data, chunk_size=None):
+    """
+    Validate and save variants from an iterable of (line number, variant data) pairs.
+
+    Variants are validated and saved in fixed size chunks, so the number of variants held in
+    memory does not depend on the size of the upload. Validation stops at the first chunk that
+    contains errors. Errors for individual variants are keyed by line number. This should be run
+    in a transaction so that no variants are saved if any chunk fails validation.
+
+    Returns the number of variants created.
+    """
+    num_created = 0
+    for chunk in chunks(numbered_variants_data, chunk_size or VARIANT_UPLOAD_CHUNK_SIZE):
+        line_numbers = [line_number for line_number, _ in chunk]
+        serializer = VariantSerializer(
+            data=[variant_data for _, variant_data in chunk],
+            context={"project": project},
+            many=True,
+        )
+        if not serializer.is_valid():
+            if isinstance(serializer.errors, dict):
+                raise ValidationError(serializer.errors)
+
+            raise ValidationError(
+                {
+                    f"line {line_number}": errors
+                    for line_number, errors in zip(line_numbers, serializer.errors)
+                    if errors
+                }
+            )
+
+        serializer.save()
+        num_created += len(chunk)
+
+    return num_created
+
+
 class ImportedResultListSerializer(ListSerializer):  # pylint: disable=abstract-method
+    existing_assignments = None
+
+    def to_internal_value(self, data):
+        # Look up existing assignments with one query for the whole list
+        # instead of one query per result in ImportedResultSerializer.validate.
+        if isinstance(data, list):
+            self.existing_assignments = get_existing_assignments(
+                self.context["project"],
+                [
+                    item["variant_id"]
+                    for item in data
+                    if isinstance(item, dict) and "variant_id" in item
+                ],
+            )
+
+        return super().to_internal_value(data)
+
     def validate(self, attrs):
         # Check that all curator/variant ID pairs in the list are unique
         assignment_counts = Counter(
@@ -174,25 +430,67 @@ class ImportedResultListSerializer(ListSerializer):  # pylint: disable=abstract-
         return attrs
 
     def create(self, validated_data):
-        results = []
+        project = self.context["project"]
 
         # ignore any variants in the curations file
         #   that are not in the project
+        variant_pks = get_variant_pks(project, [item["variant_id"] for item in validated_data])
+        validated_data = [item for item in validated_data if item["variant_id"] in variant_pks]
+
+        curators = get_or_create_users(item["curator"] for item in validated_data)
+
+        results = []
+        timestamp_overrides = []
         for item in validated_data:
-            variant_id = item['variant_id']
-            if not Variant.objects.filter(
-                project=self.context["project"],
-                variant_id=variant_id
-            ).exists():
-                continue
-
-            result = self.child.create(item)
+            result_data = {k: v for k, v in item.items() if k not in ("curator", "variant_id")}
+            result = CurationResult(**result_data, project=project)
+            # bulk_create does not send pre_save signals, so the flags bitmask must be set here.
+            result.flags = get_flags_bitmask(result)
             results.append(result)
+            timestamp_overrides.append(
+                {f: result_data[f] for f in ("created_at", "updated_at") if f in result_data}
+            )
+
+        bulk_create_with_pks(CurationResult, results)
+
+        # bulk_create sets auto_now fields to the current time. If a created/updated timestamp
+        # is specified, restore it afterwards. Unlike changing the auto_now settings on the
+        # model's fields, this does not affect other saves of CurationResults.
+        overridden_results = []
+        for result, overrides in zip(results, timestamp_overrides):
+            if overrides:
+                for field_name, value in overrides.items():
+                    setattr(result, field_name, value)
+                overridden_results.append(result)
+
+        if overridden_results:
+            CurationResult.objects.bulk_update(overridden_results, ["created_at", "updated_at"])
+
+        bulk_create(
+            CurationAssignment,
+            [
+                CurationAssignment(
+                    curator=curators[item["curator"]],
+                    variant_id=variant_pks[item["variant_id"]],
+                    project=project,
+                    ordinal=0,  # Set by update_assignment_ordinals
+                    result=result,
+                )
+                for item, result in zip(validated_data, results)
+            ],
+        )
+
+        # Import jobs save results in chunks and update ordinals and progress once all chunks
+        # are saved.
+        if not self.context.get("chunked", False):
+            update_assignment_ordinals(project, curators.values())
+            update_project_progress(project.id)
 
         return results
 
+
 class ImportedResultSerializer(ModelSerializer):
-    curator = UserField(required=True)
+    curator = UsernameField(required=True)
     variant_id = RegexField(VARIANT_ID_REGEX, required=True)
 
     verdict = ChoiceField(
@@ -201,38 +499,55 @@ class ImportedResultSerializer(ModelSerializer):
         allow_null=True,
     )
 
+    # ModelSerializer makes auto_now fields read only. Imported results may specify
+    # created and updated timestamps, so declare them explicitly to make them writable.
+    created_at = DateTimeField(required=False)
+    updated_at = DateTimeField(required=False)
+
     class Meta:
         model = CurationResult
-        exclude = ("id",)
+        exclude = ("id", "flags")
         list_serializer_class = ImportedResultListSerializer
 
     def validate(self, attrs):
-        if CurationAssignment.objects.filter(
-            variant__project=self.context["project"],
-            variant__variant_id=attrs["variant_id"],
-            curator__username=attrs["curator"],
-        ).exists():
+        # When validating a list of results, the list serializer looks up existing assignments.
+        existing_assignments = getattr(self.parent, "existing_assignments", None)
+        if existing_assignments is None:
+            assignment_exists = CurationAssignment.objects.filter(
+                variant__project=self.context["project"],
+                variant__variant_id=attrs["variant_id"],
+                curator__username=attrs["curator"],
+            ).exists()
+        else:
+            assignment_exists = (attrs["curator"], attrs["variant_id"]) in existing_assignments
+
+        if assignment_exists:
             raise ValidationError("Duplicate assignment")
 
         return attrs
 
     def create(self, validated_data):
-        curator = validated_data.pop("curator", None)
+        curator, _ = User.objects.get_or_create(username=validated_data.pop("curator", None))
         variant_id = validated_data.pop("variant_id", None)
 
         variant = Variant.objects.get(project=self.context["project"], variant_id=variant_id)
 
         assignment = CurationAssignment.objects.create(curator=curator, variant=variant)
 
-        result = CurationResult(**validated_data)
-
-        # If a created/updated timestamp is specified, override the auto_now settings on CurationResult
-        for field in result._meta.local_fields:
-            if field.name in ["created_at", "updated_at"] and field.name in validated_data:
-                field.auto_now = False
-                field.auto_now_add = False
+        timestamp_overrides = {
+            f: validated_data.pop(f) for f in ("created_at", "updated_at") if f in validated_data
+        }
 
+        result = CurationResult(**validated_data, project=self.context["project"])
         result.save()
+
+        # save sets auto_now fields to the current time. If a created/updated timestamp
+        # is specified, restore it afterwards.
+        if timestamp_overrides:
+            CurationResult.objects.filter(pk=result.pk).update(**timestamp_overrides)
+            for field_name, value in timestamp_overrides.items():
+                setattr(result, field_name, value)
+
         assignment.result = result
         assignment.save()
 
@@ -54,6 +54,9 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "curation_portal.auth.AuthMiddleware",
+    "curation_portal.metrics.MetricsMiddleware",
+    "curation_portal.profiling.ProfilingMiddleware",
+    "curation_portal.auth.PermissionCacheMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -93,10 +96,38 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/2.2/topics/cache/
+
+# Serialized project data is cached to avoid repeating expensive queries for projects that
+# are frequently reloaded. See curation_portal/cache.py.
+# Cached data is invalidated by replacing a generation key stored in the cache, so every app
+# server process must share the same cache. locmem is only suitable for a single process.
+PROJECT_CACHE_BACKEND = os.getenv("CURATION_PORTAL_PROJECT_CACHE", "file")
+
+PROJECT_CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "none": "django.core.cache.backends.dummy.DummyCache",
+}
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "project_data": {
+        "BACKEND": PROJECT_CACHE_BACKENDS[PROJECT_CACHE_BACKEND],
+        "LOCATION": (
+            os.getenv("CURATION_PORTAL_PROJECT_CACHE_DIR", os.path.join(BASE_DIR, "cache"))
+            if PROJECT_CACHE_BACKEND == "file"
+            else "project_data"
+        ),
+        "TIMEOUT": int(os.getenv("CURATION_PORTAL_PROJECT_CACHE_TIMEOUT", "3600")),
+    },
+}
+
 AUTH_USER_MODEL = "curation_portal.User"
 
 AUTHENTICATION_BACKENDS = [
-    "rules.permissions.ObjectPermissionBackend",
+    "curation_portal.profiling.ProfiledObjectPermissionBackend",
     "django.contrib.auth.backends.RemoteUserBackend",
 ]
 
@@ -132,6 +163,10 @@ STATIC_ROOT = os.path.join(BASE_DIR, "static")
 
 STATIC_URL = "/static/"
 
+# Uploaded files
+
+MEDIA_ROOT = os.getenv("MEDIA_ROOT", os.path.join(BASE_DIR, "media"))
+
 # Security
 
 SECURE_CONTENT_TYPE_NOSNIFF = True
@@ -155,3 +190,41 @@ REST_FRAMEWORK = {"DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.Dja
 CURATION_PORTAL_AUTH_HEADER = os.getenv("CURATION_PORTAL_AUTH_HEADER", "REMOTE_USER")
 
 CURATION_PORTAL_SIGN_OUT_URL = os.getenv("CURATION_PORTAL_SIGN_OUT_URL", None)
+
+# Running import jobs that have not made progress for this many seconds are marked as failed.
+# See curation_portal/imports.py.
+CURATION_PORTAL_IMPORT_JOB_TIMEOUT = int(os.getenv("CURATION_PORTAL_IMPORT_JOB_TIMEOUT", "3600"))
+
+# Changes to results are listed once they are older than this many seconds, so that changes in
+# transactions committed out of order are not skipped.
+# See curation_portal/views/project_result_changes.py.
+CURATION_PORTAL_CHANGE_FEED_DELAY = float(os.getenv("CURATION_PORTAL_CHANGE_FEED_DELAY", "10"))
+
+# Request profiling. See curation_portal/profiling.py.
+CURATION_PORTAL_PROFILING = os.getenv("CURATION_PORTAL_PROFILING", "false").lower() == "true"
+
+CURATION_PORTAL_PROFILING_SLOW_REQUEST_MS = float(
+    os.getenv("CURATION_PORTAL_PROFILING_SLOW_REQUEST_MS", "1000")
+)
+
+CURATION_PORTAL_PROFILING_SLOW_REQUEST_SAMPLE_RATE = float(
+    os.getenv("CURATION_PORTAL_PROFILING_SLOW_REQUEST_SAMPLE_RATE", "1")
+)
+
+CURATION_PORTAL_PROFILING_SLOW_REQUEST_FILE = os.getenv(
+    "CURATION_PORTAL_PROFILING_SLOW_REQUEST_FILE", None
+)
+
+# Metrics. See curation_portal/metrics.py.
+CURATION_PORTAL_METRICS_DIR = os.getenv("CURATION_PORTAL_METRICS_DIR", None)
+
+# Logging
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"level": "INFO", "class": "logging.StreamHandler"}},
+    "loggers": {
+        "curation_portal.profiling": {"handlers": ["console"], "level": "INFO", "propagate": False}
+    },
+}
@@ -11,7 +11,8 @@ LOGGING = {
     "disable_existing_loggers": False,
     "handlers": {"console": {"level": "DEBUG", "class": "logging.StreamHandler"}},
     "loggers": {
-        "django.db.backends": {"handlers": ["console"], "level": "DEBUG", "propagate": False}
+        "django.db.backends": {"handlers": ["console"], "level": "DEBUG", "propagate": False},
+        "curation_portal.profiling": {"handlers": ["console"], "level": "INFO", "propagate": False},
     },
 }
 
@@ -5,6 +5,12 @@ from .base import *  # pylint: disable=wildcard-import,unused-wildcard-import
 
 DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}
 
+# Cached project data would outlive the transactions that tests are rolled back in.
+CACHES = {
+    **CACHES,
+    "project_data": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+}
+
 SECURE_SSL_REDIRECT = False
 
 SESSION_COOKIE_SECURE = False
@@ -9,17 +9,29 @@ from django.urls import path, register_converter
 from django.views.generic import TemplateView
 
 from curation_portal.views.app_settings import ApplicationSettingsView
+from curation_portal.views.cache_stats import CacheStatsView
 from curation_portal.views.curate_variant import CurateVariantView
+from curation_portal.views.metrics import MetricsView
 from curation_portal.views.projects import AssignedProjectsView, OwnedProjectsView
 from curation_portal.views.project import ProjectView
 from curation_portal.views.project_assignments import ProjectAssignmentsView
 from curation_portal.views.project_admin import CreateProjectView
+from curation_portal.views.project_imports import (
+    ProjectImportJobErrorsView,
+    ProjectImportJobsView,
+    ProjectImportJobView,
+)
+from curation_portal.views.project_result_changes import (
+    ProjectResultChangesView,
+    ProjectResultDeletionsView,
+)
 from curation_portal.views.project_results import ProjectResultsView
 from curation_portal.views.project_results_export import ExportProjectResultsView
 from curation_portal.views.project_variants import ProjectVariantsView
 from curation_portal.views.user import ProfileView
 from curation_portal.views.user_settings import UserSettingsView
 from curation_portal.views.variants import VariantsView
+from curation_portal.views.variant_locus import ProjectVariantLocusView, VariantsLocusView
 from curation_portal.views.variant_projects import VariantProjectsView
 from curation_portal.views.variant_results import VariantResultsView
 from curation_portal.views.variant_results_export import ExportVariantResultsView
@@ -66,6 +78,8 @@ urlpatterns = [
     path("variant/<variant_id:variant_id>/", DEFAULT_TEMPLATE_VIEW, name="variant"),
     path("variant/<variant_id:variant_id>/results/", DEFAULT_TEMPLATE_VIEW, name="variant-results"),
     path("api/settings/", ApplicationSettingsView.as_view(), name="api-app-settings"),
+    path("api/cache/stats/", CacheStatsView.as_view(), name="api-cache-stats"),
+    path("api/metrics/", MetricsView.as_view(), name="api-metrics"),
     path("api/assignments/", AssignedProjectsView.as_view(), name="api-assignments"),
     path("api/projects/", OwnedProjectsView.as_view(), name="api-projects"),
     path("api/projects/create/", CreateProjectView.as_view(), name="api-create-project"),
@@ -81,6 +95,11 @@ urlpatterns = [
         ProjectVariantsView.as_view(),
         name="api-project-variants",
     ),
+    path(
+        "api/project/<int:project_id>/variants/locus/",
+        ProjectVariantLocusView.as_view(),
+        name="api-project-variants-locus",
+    ),
     path(
         "api/project/<int:project_id>/variant/<int:variant_id>/curate/",
         CurateVariantView.as_view(),
@@ -91,14 +110,40 @@ urlpatterns = [
         ProjectResultsView.as_view(),
         name="api-project-results",
     ),
+    path(
+        "api/project/<int:project_id>/results/changes/",
+        ProjectResultChangesView.as_view(),
+        name="api-project-result-changes",
+    ),
+    path(
+        "api/project/<int:project_id>/results/deletions/",
+        ProjectResultDeletionsView.as_view(),
+        name="api-project-result-deletions",
+    ),
     path(
         "api/project/<int:project_id>/results/export/",
         ExportProjectResultsView.as_view(),
         name="api-project-results-export",
     ),
+    path(
+        "api/project/<int:project_id>/imports/",
+        ProjectImportJobsView.as_view(),
+        name="api-project-imports",
+    ),
+    path(
+        "api/project/<int:project_id>/import/<int:import_job_id>/",
+        ProjectImportJobView.as_view(),
+        name="api-project-import",
+    ),
+    path(
+        "api/project/<int:project_id>/import/<int:import_job_id>/errors/",
+        ProjectImportJobErrorsView.as_view(),
+        name="api-project-import-errors",
+    ),
     path("api/profile/", ProfileView.as_view(), name="api-profile"),
     path("api/profile/settings/", UserSettingsView.as_view(), name="api-settings"),
     path("api/variants/", VariantsView.as_view(), name="api-variants"),
+    path("api/variants/locus/", VariantsLocusView.as_view(), name="api-variants-locus"),
     path(
         "api/variant/<variant_id:variant_id>/projects/",
         VariantProjectsView.as_view(),
@@ -3,9 +3,19 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from curation_portal.export import get_available_columnar_formats
+
 
 class ApplicationSettingsView(APIView):
     permission_classes = (IsAuthenticated,)
 
     def get(self, request):
-        return Response({"settings": {"sign_out_url": settings.CURATION_PORTAL_SIGN_OUT_URL}})
+        return Response(
+            {
+                "settings": {
+                    "sign_out_url": settings.CURATION_PORTAL_SIGN_OUT_URL,
+                    # Columnar export formats are only available if pyarrow is installed.
+                    "export_formats": ["csv", *get_available_columnar_formats()],
+                }
+            }
+        )
@@ -0,0 +1,12 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from curation_portal.cache import get_cache_stats
+
+
+class CacheStatsView(APIView):
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request):  # pylint: disable=no-self-use,unused-argument
+        return Response({"stats": get_cache_stats()})
@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import ensure_csrf_cookie
 from rest_framework.exceptions import NotFound
@@ -35,7 +36,7 @@ class VariantSerializer(ModelSerializer):
 
     class Meta:
         model = Variant
-        exclude = ("project",)
+        exclude = ("project", "major_consequence", "major_consequence_rank", "gene_symbols")
 
 
 class CurationResultSerializer(ModelSerializer):
@@ -65,7 +66,7 @@ class CurateVariantView(APIView):
             assignment = (
                 self.request.user.curation_assignments.select_related("variant", "result")
                 .prefetch_related("variant__annotations", "variant__tags")
-                .get(variant=self.kwargs["variant_id"], variant__project=self.kwargs["project_id"])
+                .get(variant=self.kwargs["variant_id"], project=self.kwargs["project_id"])
             )
 
             return assignment
@@ -78,41 +79,31 @@ class CurateVariantView(APIView):
 
         filtered_assignments = AssignmentFilter(
             request.GET,
-            request.user.curation_assignments.filter(variant__project=assignment.variant.project),
+            request.user.curation_assignments.filter(project=assignment.project_id),
         )
 
-        previous_site_variants = (
-            filtered_assignments.qs.filter(variant__xpos__lt=assignment.variant.xpos)
-            .order_by("variant__xpos", "variant__ref", "variant__alt")
-            .reverse()
-            .values("variant", "variant__variant_id")
-        )
-        num_previous_site_variants = previous_site_variants.count()
-        previous_site_variant = previous_site_variants.first()
-
-        colocated_variants = (
-            filtered_assignments.qs.filter(variant__xpos=assignment.variant.xpos)
-            .order_by("variant__xpos", "variant__ref", "variant__alt")
+        # Assignment ordinals number each curator's assignments in a project in the (xpos, ref, alt)
+        # order of their variants, so adjacent assignments can be found with the
+        # (curator, project, ordinal) index.
+        previous_assignments = filtered_assignments.qs.filter(ordinal__lt=assignment.ordinal)
+        # The index is the assignment's position in the filtered list of assignments. Without
+        # filters, that is the assignment's ordinal.
+        if any(name in request.GET for name in AssignmentFilter.base_filters):
+            index = previous_assignments.count()
+        else:
+            index = assignment.ordinal
+        previous_variant = (
+            previous_assignments.order_by("-ordinal")
             .values("variant", "variant__variant_id")
+            .first()
         )
-
-        next_site_variant = (
-            filtered_assignments.qs.filter(variant__xpos__gt=assignment.variant.xpos)
-            .order_by("variant__xpos", "variant__ref", "variant__alt")
+        next_variant = (
+            filtered_assignments.qs.filter(ordinal__gt=assignment.ordinal)
+            .order_by("ordinal")
             .values("variant", "variant__variant_id")
             .first()
         )
 
-        surrounding_variants = [previous_site_variant, *colocated_variants, next_site_variant]
-        index_in_surrounding_variants = [
-            v["variant__variant_id"] if v is not None else None for v in surrounding_variants
-        ].index(assignment.variant.variant_id)
-
-        previous_variant = surrounding_variants[index_in_surrounding_variants - 1]
-        next_variant = surrounding_variants[index_in_surrounding_variants + 1]
-
-        index = num_previous_site_variants + index_in_surrounding_variants - 1
-
         return Response(
             {
                 "index": index,
@@ -124,17 +115,27 @@ class CurateVariantView(APIView):
         )
 
     def post(self, request, *args, **kwargs):  # pylint: disable=unused-argument
-        assignment = self.get_assignment()
-
-        if assignment.result:
-            result = assignment.result
-        else:
-            result = CurationResult()
-
-        serializer = CurationResultSerializer(result, data=request.data)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-        assignment.result = result
-        assignment.save()
+        # Saving the assignment updates progress counts, which must stay consistent with the result.
+        # Lock the assignment so that concurrent saves for it (for example, a double submitted form)
+        # do not both create a result and count the assignment as completed twice.
+        with transaction.atomic():
+            try:
+                assignment = request.user.curation_assignments.select_for_update().get(
+                    variant=kwargs["variant_id"], project=kwargs["project_id"]
+                )
+            except CurationAssignment.DoesNotExist:
+                raise NotFound
+
+            if assignment.result:
+                result = assignment.result
+            else:
+                result = CurationResult(project_id=assignment.project_id)
+
+            serializer = CurationResultSerializer(result, data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            serializer.save()
+            assignment.result = result
+            assignment.save()
 
         return Response({})
@@ -1,4 +1,3 @@
-from django.db.models import Count
 from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
@@ -6,7 +5,13 @@ from rest_framework.response import Response
 from rest_framework.serializers import ModelSerializer
 from rest_framework.views import APIView
 
-from curation_portal.models import CurationAssignment, Project
+from curation_portal.cache import get_cached_project_data
+from curation_portal.conditional import (
+    get_not_modified_response,
+    get_project_validators,
+    set_validators,
+)
+from curation_portal.models import CuratorProgress, Project, ProjectProgress
 from curation_portal.serializers import ProjectSerializer as EditProjectSerializer
 
 
@@ -25,50 +30,48 @@ class ProjectView(APIView):
             raise NotFound
         return project
 
-    def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
-        project = self.get_project()
-
+    def get_project_data(self, project, is_owner):  # pylint: disable=no-self-use
         response = ProjectSerializer(project).data
 
-        if project.owners.filter(id=request.user.id).exists():
+        if is_owner:
             response["owners"] = [owner.username for owner in project.owners.all()]
 
-            total_assignments_by_curator = dict(
-                CurationAssignment.objects.filter(variant__project=project)
-                .values_list("curator__username")
-                .annotate(num_assignments=Count("variant"))
-                .all()
-            )
-            completed_assignments_by_curator = dict(
-                CurationAssignment.objects.filter(
-                    variant__project=project, result__verdict__isnull=False
-                )
-                .values_list("curator__username")
-                .annotate(num_assignments=Count("variant"))
-                .all()
-            )
-
+            curator_progress = CuratorProgress.objects.filter(
+                project=project, total_assignments__gt=0
+            ).select_related("curator")
             response["assignments"] = {
-                curator: {
-                    "total": num_assignments,
-                    "completed": completed_assignments_by_curator.get(curator, 0),
+                progress.curator.username: {
+                    "total": progress.total_assignments,
+                    "completed": progress.completed_assignments,
                 }
-                for curator, num_assignments in total_assignments_by_curator.items()
+                for progress in curator_progress
+            }
+
+            project_progress = ProjectProgress.objects.filter(project=project).first()
+            response["variants"] = {
+                "total": project_progress.total_variants if project_progress else 0,
+                "curated": project_progress.curated_variants if project_progress else 0,
             }
 
-            total_variants = project.variants.count()
-            num_curated_variants = (
-                CurationAssignment.objects.filter(
-                    variant__project=project, result__verdict__isnull=False
-                )
-                .values("variant__variant_id")
-                .distinct()
-                .count()
-            )
+        return response
 
-            response["variants"] = {"total": total_variants, "curated": num_curated_variants}
+    def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        project = self.get_project()
+
+        validators = get_project_validators(project, request.user)
+        not_modified_response = get_not_modified_response(request, validators)
+        if not_modified_response:
+            return not_modified_response
+
+        is_owner = project.owners.filter(id=request.user.id).exists()
+        response = get_cached_project_data(
+            project.id,
+            "project",
+            lambda: self.get_project_data(project, is_owner),
+            variation="owner" if is_owner else "curator",
+        )
 
-        return Response(response)
+        return set_validators(Response(response), validators)
 
     def patch(self, request, *args, **kwargs):  # pylint: disable=unused-argument
         project = self.get_project()
@@ -1,25 +1,38 @@
-import itertools
 from collections import Counter, defaultdict
 
 from django.db import transaction
-from django.db.models import Prefetch
+from django.db.models import Q
 from rest_framework import serializers
-from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.exceptions import NotFound, ParseError, PermissionDenied
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from curation_portal.constants import CONSEQUENCE_TERM_RANK
 from curation_portal.filters import AssignmentFilter
+from curation_portal.metrics import record_import
 from curation_portal.models import (
     CurationAssignment,
     CurationResult,
     Project,
     User,
     Variant,
-    VariantAnnotation,
+    get_annotation_summary,
+    update_assignment_ordinals,
+    update_project_progress,
+    FLAG_FIELDS,
 )
+from curation_portal.pagination import CursorPaginationMixin, decode_cursor, encode_cursor, get_page
+from curation_portal.serializers import bulk_create, get_or_create_users, get_variant_pks
+
+
+def get_variant_annotation_summary(variant):
+    if variant.gene_symbols is None:
+        # Variants are backfilled by migration 0023, so this is only reached for variants
+        # whose stored values were cleared.
+        return get_annotation_summary(variant.annotations.values("consequence", "gene_symbol"))
+
+    return {"major_consequence": variant.major_consequence, "gene_symbols": variant.gene_symbols}
 
 
 class VariantSerializer(serializers.ModelSerializer):
@@ -27,14 +40,11 @@ class VariantSerializer(serializers.ModelSerializer):
     genes = serializers.SerializerMethodField()
 
     def get_major_consequence(self, obj):  # pylint: disable=no-self-use
-        ranked_consequences = sorted(
-            itertools.chain.from_iterable(a.consequence.split("&") for a in obj.annotations.all()),
-            key=CONSEQUENCE_TERM_RANK.get,
-        )
-        return ranked_consequences[0] if len(ranked_consequences) > 0 else "unknown"
+        return get_variant_annotation_summary(obj)["major_consequence"] or "unknown"
 
     def get_genes(self, obj):  # pylint: disable=no-self-use
-        return set(a.gene_symbol for a in obj.annotations.all())
+        gene_symbols = get_variant_annotation_summary(obj)["gene_symbols"]
+        return gene_symbols.split(",") if gene_symbols else []
 
     class Meta:
         model = Variant
@@ -44,7 +54,15 @@ class VariantSerializer(serializers.ModelSerializer):
 class ResultSerializer(serializers.ModelSerializer):
     class Meta:
         model = CurationResult
-        fields = "__all__"
+        fields = (
+            "id",
+            "created_at",
+            "updated_at",
+            *FLAG_FIELDS,
+            "notes",
+            "should_revisit",
+            "verdict",
+        )
 
 
 class AssignmentSerializer(serializers.ModelSerializer):
@@ -56,7 +74,50 @@ class AssignmentSerializer(serializers.ModelSerializer):
         fields = ("variant", "result")
 
 
+def select_fields(serializer, field_paths):
+    """
+    Remove fields from a serializer that are not in a list of field paths.
+
+    Nested fields are selected with dotted paths, for example "variant.variant_id".
+    Selecting a nested serializer without a path selects all of its fields.
+    """
+    selected_subfields = defaultdict(list)
+    for path in field_paths:
+        field_name, _, subfield_path = path.partition(".")
+        if field_name not in serializer.fields:
+            raise ParseError(f"Unknown field '{path}'")
+
+        selected_subfields[field_name].append(subfield_path)
+
+    for field_name in list(serializer.fields):
+        if field_name not in selected_subfields:
+            del serializer.fields[field_name]
+        elif all(selected_subfields[field_name]):
+            field = serializer.fields[field_name]
+            if not isinstance(field, serializers.Serializer):
+                raise ParseError(f"Field '{field_name}' has no subfields")
+
+            select_fields(field, selected_subfields[field_name])
+
+
 class NewAssignmentListSerializer(serializers.ListSerializer):  # pylint: disable=abstract-method
+    variant_pks = None
+
+    def to_internal_value(self, data):
+        # Look up the project's variants with one query for the whole list
+        # instead of one query per assignment in NewAssignmentSerializer.validate_variant_id.
+        if isinstance(data, list):
+            self.variant_pks = get_variant_pks(
+                self.context["project"],
+                [
+                    item["variant_id"]
+                    for item in data
+                    if isinstance(item, dict) and isinstance(item.get("variant_id"), str)
+                ],
+            )
+
+        return super().to_internal_value(data)
+
     def validate(self, attrs):
         # Check that all curator/variant ID pairs in the list are unique
         assignment_counts = Counter(
@@ -78,6 +139,35 @@ class NewAssignmentListSerializer(serializers.ListSerializer):  # pylint: disabl
 
         return attrs
 
+    def create(self, validated_data):
+        variant_pks = self.variant_pks
+        if variant_pks is None:
+            variant_pks = get_variant_pks(
+                self.context["project"], [item["variant_id"] for item in validated_data]
+            )
+
+        curators = get_or_create_users(item["curator"] for item in validated_data)
+
+        # Assignments that already exist are left unchanged.
+        assignments = bulk_create(
+            CurationAssignment,
+            [
+                CurationAssignment(
+                    curator=curators[item["curator"]],
+                    variant_id=variant_pks[item["variant_id"]],
+                    project=self.context["project"],
+                    ordinal=0,  # Set by update_assignment_ordinals
+                )
+                for item in validated_data
+            ],
+            ignore_conflicts=True,
+        )
+
+        update_assignment_ordinals(self.context["project"], curators.values())
+        update_project_progress(self.context["project"].id)
+
+        return assignments
+
 
 class NewAssignmentSerializer(serializers.Serializer):
     curator = serializers.CharField(max_length=150)
@@ -87,7 +177,16 @@ class NewAssignmentSerializer(serializers.Serializer):
         list_serializer_class = NewAssignmentListSerializer
 
     def validate_variant_id(self, value):
-        if not Variant.objects.filter(project=self.context["project"], variant_id=value).exists():
+        # When validating a list of assignments, the list serializer looks up the project's variants.
+        variant_pks = getattr(self.parent, "variant_pks", None)
+        if variant_pks is None:
+            variant_exists = Variant.objects.filter(
+                project=self.context["project"], variant_id=value
+            ).exists()
+        else:
+            variant_exists = value in variant_pks
+
+        if not variant_exists:
             raise serializers.ValidationError("Variant does not exist")
 
         return value
@@ -112,9 +211,12 @@ class NewAssignmentSerializer(serializers.Serializer):
         raise NotImplementedError
 
 
-class ProjectAssignmentsView(APIView):
+class ProjectAssignmentsView(CursorPaginationMixin, APIView):
     permission_classes = (IsAuthenticated,)
 
+    # Assignments are only paginated if a page size is given.
+    default_page_size = None
+
     def get_project(self):
         project = get_object_or_404(Project, id=self.kwargs["project_id"])
         if not self.request.user.has_perm("curation_portal.view_project", project):
@@ -125,24 +227,48 @@ class ProjectAssignmentsView(APIView):
     def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
         project = self.get_project()
 
+        page_size = self.get_page_size()
+
+        fields = None
+        if "fields" in request.query_params:
+            fields = [f for f in request.query_params["fields"].split(",") if f]
+
+        def serialize_assignments(assignments):
+            serializer = AssignmentSerializer(assignments, many=True)
+            if fields is not None:
+                select_fields(serializer.child, fields)
+
+            return serializer.data
+
+        # Ordinals follow the (xpos, ref, alt) order of variants, so assignments can be listed
+        # in variant order using the (curator, project, ordinal) index.
         assignments = (
-            request.user.curation_assignments.filter(variant__project=project)
+            request.user.curation_assignments.filter(project=project)
             .select_related("result", "variant")
-            .prefetch_related(
-                Prefetch(
-                    "variant__annotations",
-                    queryset=VariantAnnotation.objects.only(
-                        "consequence", "gene_symbol", "variant_id", "id"
-                    ),
-                )
-            )
-            .order_by("variant__xpos", "variant__ref", "variant__alt")
+            .order_by("ordinal", "id")
         )
 
-        filtered_assignments = AssignmentFilter(request.GET, queryset=assignments)
+        filtered_assignments = AssignmentFilter(request.GET, queryset=assignments).qs
 
-        assignments_serializer = AssignmentSerializer(filtered_assignments.qs, many=True)
-        return Response({"assignments": assignments_serializer.data})
+        if page_size is None:
+            return Response({"assignments": serialize_assignments(filtered_assignments)})
+
+        page = filtered_assignments
+        if "cursor" in request.query_params:
+            ordinal, pk = decode_cursor(request.query_params["cursor"], int, int)
+            page = page.filter(Q(ordinal__gt=ordinal) | Q(ordinal=ordinal, id__gt=pk))
+
+        page, has_next_page = get_page(page, page_size)
+
+        return Response(
+            {
+                "assignments": serialize_assignments(page),
+                "count": filtered_assignments.count(),
+                "next_cursor": (
+                    encode_cursor([page[-1].ordinal, page[-1].id]) if has_next_page else None
+                ),
+            }
+        )
 
     def post(self, request, *args, **kwargs):  # pylint: disable=unused-argument
         project = self.get_project()
@@ -159,4 +285,5 @@ class ProjectAssignmentsView(APIView):
             serializer.save()
             project.save()
 
+        record_import("assignments", len(serializer.validated_data))
         return Response({})
@@ -0,0 +1,119 @@
+import json
+
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.generics import get_object_or_404
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.serializers import (
+    ChoiceField,
+    FileField,
+    ModelSerializer,
+    Serializer,
+    SerializerMethodField,
+)
+from rest_framework.views import APIView
+
+from curation_portal.models import ImportJob, ImportJobError, Project
+
+
+class ImportJobSerializer(ModelSerializer):
+    created_by = SerializerMethodField()
+
+    def get_created_by(self, obj):  # pylint: disable=no-self-use
+        return obj.created_by.username if obj.created_by else None
+
+    class Meta:
+        model = ImportJob
+        fields = (
+            "id",
+            "kind",
+            "status",
+            "rows_processed",
+            "rows_imported",
+            "error",
+            "created_by",
+            "created_at",
+            "started_at",
+            "finished_at",
+        )
+
+
+class NewImportJobSerializer(Serializer):  # pylint: disable=abstract-method
+    kind = ChoiceField(["variants", "results"])
+    file = FileField()
+
+
+class ImportJobErrorSerializer(ModelSerializer):
+    errors = SerializerMethodField()
+
+    def get_errors(self, obj):  # pylint: disable=no-self-use
+        return json.loads(obj.errors)
+
+    class Meta:
+        model = ImportJobError
+        fields = ("row", "errors")
+
+
+class ProjectImportJobsBaseView(APIView):
+    """
+    Base class for views of a project's import jobs, which can only be viewed by project owners.
+    """
+
+    permission_classes = (IsAuthenticated,)
+
+    def get_project(self):
+        project = get_object_or_404(Project, id=self.kwargs["project_id"])
+        if not self.request.user.has_perm("curation_portal.change_project", project):
+            if not self.request.user.has_perm("curation_portal.view_project", project):
+                raise NotFound
+
+            raise PermissionDenied
+
+        return project
+
+    def get_import_job(self):
+        project = self.get_project()
+        return get_object_or_404(
+            ImportJob.objects.select_related("created_by"),
+            project=project,
+            id=self.kwargs["import_job_id"],
+        )
+
+
+class ProjectImportJobsView(ProjectImportJobsBaseView):
+    def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        project = self.get_project()
+
+        import_jobs = project.import_jobs.select_related("created_by").order_by("-created_at")
+        serializer = ImportJobSerializer(import_jobs, many=True)
+        return Response({"imports": serializer.data})
+
+    def post(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        project = self.get_project()
+
+        serializer = NewImportJobSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        if serializer.validated_data["kind"] == "variants" and not request.user.has_perm(
+            "curation_portal.add_variant_to_project", project
+        ):
+            raise PermissionDenied
+
+        import_job = ImportJob.objects.create(
+            project=project, created_by=request.user, **serializer.validated_data
+        )
+
+        return Response({"import": ImportJobSerializer(import_job).data}, status=202)
+
+
+class ProjectImportJobView(ProjectImportJobsBaseView):
+    def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        import_job = self.get_import_job()
+        return Response({"import": ImportJobSerializer(import_job).data})
+
+
+class ProjectImportJobErrorsView(ProjectImportJobsBaseView):
+    def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        import_job = self.get_import_job()
+        serializer = ImportJobErrorSerializer(import_job.row_errors.all(), many=True)
+        return Response({"errors": serializer.data})
@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.generics import get_object_or_404
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.serializers import ModelSerializer
+from rest_framework.views import APIView
+
+from curation_portal.models import CurationResult, CurationResultDeletion, Project
+from curation_portal.pagination import CursorPaginationMixin, decode_cursor, encode_cursor, get_page
+from curation_portal.views.project_results import CurationResultSerializer
+
+
+class CurationResultChangeSerializer(CurationResultSerializer):
+    class Meta(CurationResultSerializer.Meta):
+        fields = ("id", *CurationResultSerializer.Meta.fields, "created_at", "updated_at")
+
+
+class CurationResultDeletionSerializer(ModelSerializer):
+    class Meta:
+        model = CurationResultDeletion
+        fields = ("result_id", "variant_id", "curator", "deleted_at")
+
+
+def parse_cursor_timestamp(value):
+    timestamp = parse_datetime(value)
+    if timestamp is None:
+        raise ValueError
+
+    return timestamp
+
+
+class ChangeFeedView(CursorPaginationMixin, APIView):
+    """
+    Base class for lists of objects changed after a cursor, ordered by a timestamp and ID.
+
+    Responses include a cursor that can be used to request changes made after the last
+    object in the response. If there are no further changes, the cursor from the request
+    is returned so that it can be reused later.
+
+    Timestamps are set when objects are saved, but objects are only visible once their
+    transaction is committed. A change committed after a later change had already been listed
+    would be skipped by clients holding a cursor, so changes are only listed once they are
+    older than CURATION_PORTAL_CHANGE_FEED_DELAY seconds.
+    """
+
+    permission_classes = (IsAuthenticated,)
+
+    default_page_size = 500
+    max_page_size = 5000
+
+    timestamp_field = None
+    serializer_class = None
+    response_key = None
+
+    def get_project(self):
+        project = get_object_or_404(Project, id=self.kwargs["project_id"])
+        if not self.request.user.has_perm("curation_portal.change_project", project):
+            if not self.request.user.has_perm("curation_portal.view_project", project):
+                raise NotFound
+
+            raise PermissionDenied
+
+        return project
+
+    def get_queryset(self, project):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        project = self.get_project()
+        page_size = self.get_page_size()
+
+        settled_before = timezone.now() - timedelta(
+            seconds=settings.CURATION_PORTAL_CHANGE_FEED_DELAY
+        )
+        page = (
+            self.get_queryset(project)
+            .filter(**{f"{self.timestamp_field}__lte": settled_before})
+            .order_by(self.timestamp_field, "id")
+        )
+
+        cursor = request.query_params.get("cursor", None)
+        if cursor:
+            timestamp, pk = decode_cursor(cursor, parse_cursor_timestamp, int)
+            page = page.filter(
+                Q(**{f"{self.timestamp_field}__gt": timestamp})
+                | Q(**{self.timestamp_field: timestamp, "id__gt": pk})
+            )
+
+        page, has_more = get_page(page, page_size)
+
+        if page:
+            cursor = encode_cursor(
+                [getattr(page[-1], self.timestamp_field).isoformat(), page[-1].id]
+            )
+
+        return Response(
+            {
+                self.response_key: self.serializer_class(page, many=True).data,
+                "cursor": cursor,
+                "has_more": has_more,
+            }
+        )
+
+
+class ProjectResultChangesView(ChangeFeedView):
+    timestamp_field = "changed_at"
+    serializer_class = CurationResultChangeSerializer
+    response_key = "results"
+
+    def get_queryset(self, project):
+        return CurationResult.objects.filter(
+            project=project, assignment__isnull=False
+        ).select_related("assignment__curator", "assignment__variant")
+
+
+class ProjectResultDeletionsView(ChangeFeedView):
+    timestamp_field = "deleted_at"
+    serializer_class = CurationResultDeletionSerializer
+    response_key = "deletions"
+
+    def get_queryset(self, project):
+        return CurationResultDeletion.objects.filter(project_id=project.id)
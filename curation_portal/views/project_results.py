@@ -1,4 +1,5 @@
 from django.db import transaction
+from django.utils import timezone
 from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
@@ -6,7 +7,21 @@ from rest_framework.response import Response
 from rest_framework.serializers import ChoiceField, ModelSerializer, SerializerMethodField
 from rest_framework.views import APIView
 
-from curation_portal.models import CurationResult, Project, Variant, FLAG_FIELDS
+from curation_portal.cache import get_cached_project_data
+from curation_portal.conditional import (
+    get_not_modified_response,
+    get_project_validators,
+    set_validators,
+)
+from curation_portal.filters import ResultFilter
+from curation_portal.metrics import record_import
+from curation_portal.models import (
+    CurationResult,
+    Project,
+    Variant,
+    FLAG_FIELDS,
+    mark_results_changed,
+)
 from curation_portal.serializers import ImportedResultSerializer
 
 
@@ -54,11 +69,26 @@ class ProjectResultsView(APIView):
     def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
         project = self.get_project()
 
-        results = CurationResult.objects.filter(
-            assignment__variant__project=project
-        ).select_related("assignment__curator", "assignment__variant")
-        serializer = CurationResultSerializer(results, many=True)
-        return Response({"results": serializer.data})
+        validators = get_project_validators(project, request.user)
+        not_modified_response = get_not_modified_response(request, validators)
+        if not_modified_response:
+            return not_modified_response
+
+        def get_results():
+            results = CurationResult.objects.filter(
+                assignment__variant__project=project
+            ).select_related("assignment__curator", "assignment__variant")
+            filtered_results = ResultFilter(request.query_params, queryset=results).qs
+            return CurationResultSerializer(filtered_results, many=True).data
+
+        # Cache results separately for each combination of filters.
+        filters = "&".join(
+            f"{name}={request.query_params[name]}"
+            for name in sorted(ResultFilter.base_filters)
+            if name in request.query_params
+        )
+        results = get_cached_project_data(project.id, "results", get_results, variation=filters)
+        return set_validators(Response({"results": results}), validators)
 
     def post(self, request, *args, **kwargs):  # pylint: disable=unused-argument
         project = self.get_project()
@@ -69,7 +99,10 @@ class ProjectResultsView(APIView):
         serializer.is_valid(raise_exception=True)
 
         with transaction.atomic():
+            started_at = timezone.now()
             serializer.save()
+            mark_results_changed(project.id, started_at)
             project.save()  # Save project to set updated_at timestamp
 
+        record_import("results", len(serializer.validated_data))
         return Response({})
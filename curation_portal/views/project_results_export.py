@@ -1,21 +1,13 @@
-import csv
 import re
 
-from django.db.models import Prefetch
-from django.http import HttpResponse
 from django_filters import FilterSet
 from rest_framework.exceptions import NotFound
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 
-from curation_portal.models import (
-    CurationAssignment,
-    Project,
-    VariantAnnotation,
-    FLAG_FIELDS,
-    FLAG_LABELS,
-)
+from curation_portal.export import results_export_response
+from curation_portal.models import CurationAssignment, Project
 
 
 class ExportResultsFilter(FilterSet):
@@ -37,22 +29,10 @@ class ExportProjectResultsView(APIView):
     def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
         project = self.get_project()
 
-        result_fields = ["notes", "should_revisit", "verdict", *FLAG_FIELDS]
-
-        completed_assignments = (
-            CurationAssignment.objects.filter(
-                variant__project=project, result__verdict__isnull=False
-            )
-            .select_related("curator", "variant", "result")
-            .prefetch_related(
-                Prefetch(
-                    "variant__annotations",
-                    queryset=VariantAnnotation.objects.only(
-                        "variant_id", "gene_id", "gene_symbol", "transcript_id"
-                    ),
-                )
-            )
-        )
+        # Annotations are loaded separately for each chunk of exported assignments.
+        completed_assignments = CurationAssignment.objects.filter(
+            variant__project=project, result__verdict__isnull=False
+        ).select_related("curator", "variant", "result")
 
         # Project owners can download all results for the project and optionally filter them by curator.
         # Curators can only download their own results.
@@ -71,34 +51,11 @@ class ExportProjectResultsView(APIView):
         # Based on django.utils.text.get_valid_filename, but replace characters with "-" instead of removing them.
         filename_prefix = re.sub(r"(?u)[^-\w]", "-", filename_prefix)
 
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{filename_prefix}_results.csv"'
-
-        writer = csv.writer(response)
-
-        header_row = ["Variant ID", "Gene", "Transcript", "Curator"] + [
-            FLAG_LABELS.get(f, " ".join(word.capitalize() for word in f.split("_")))
-            for f in result_fields
-        ]
-        writer.writerow(header_row)
-
-        for assignment in filtered_assignments.qs:
-            row = [
-                assignment.variant.variant_id,
-                ";".join(
-                    set(
-                        f"{annotation.gene_id}:{annotation.gene_symbol}"
-                        for annotation in assignment.variant.annotations.all()
-                    )
-                ),
-                ";".join(
-                    set(
-                        annotation.transcript_id
-                        for annotation in assignment.variant.annotations.all()
-                    )
-                ),
-                assignment.curator.username,
-            ] + [getattr(assignment.result, f) for f in result_fields]
-            writer.writerow(row)
-
-        return response
+        # Results are written in chunks so that large exports are not held in memory.
+        return results_export_response(
+            filtered_assignments.qs,
+            request.query_params.get("file_format", "csv"),
+            f"{filename_prefix}_results",
+            "Variant ID",
+            lambda assignment: assignment.variant.variant_id,
+        )
@@ -4,10 +4,26 @@ from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.serializers import ModelSerializer
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 
-from curation_portal.models import Project, Variant
-from curation_portal.serializers import VariantSerializer as UploadedVariantSerializer
+from curation_portal.cache import get_cached_project_data
+from curation_portal.conditional import (
+    get_not_modified_response,
+    get_project_validators,
+    set_validators,
+)
+from curation_portal.metrics import record_import
+from curation_portal.models import (
+    Project,
+    Variant,
+    update_project_progress,
+)
+from curation_portal.parsers import NDJSONParser
+from curation_portal.serializers import (
+    VariantSerializer as UploadedVariantSerializer,
+    create_variants_from_stream,
+)
 
 
 class VariantSerializer(ModelSerializer):
@@ -19,6 +35,8 @@ class VariantSerializer(ModelSerializer):
 class ProjectVariantsView(APIView):
     permission_classes = (IsAuthenticated,)
 
+    parser_classes = (*api_settings.DEFAULT_PARSER_CLASSES, NDJSONParser)
+
     def get_project(self):
         project = get_object_or_404(Project, id=self.kwargs["project_id"])
         if not self.request.user.has_perm("curation_portal.change_project", project):
@@ -32,10 +50,17 @@ class ProjectVariantsView(APIView):
     def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
         project = self.get_project()
 
-        variants = project.variants.all()
+        validators = get_project_validators(project, request.user)
+        not_modified_response = get_not_modified_response(request, validators)
+        if not_modified_response:
+            return not_modified_response
 
-        serializer = VariantSerializer(variants, many=True)
-        return Response({"variants": serializer.data})
+        variants = get_cached_project_data(
+            project.id,
+            "variants",
+            lambda: VariantSerializer(project.variants.all(), many=True).data,
+        )
+        return set_validators(Response({"variants": variants}), validators)
 
     def post(self, request, *args, **kwargs):  # pylint: disable=unused-argument
         project = self.get_project()
@@ -43,6 +68,16 @@ class ProjectVariantsView(APIView):
         if not request.user.has_perm("curation_portal.add_variant_to_project", project):
             raise PermissionDenied
 
+        # Newline-delimited JSON uploads are validated and saved in chunks as they are read.
+        if request.content_type.startswith(NDJSONParser.media_type):
+            with transaction.atomic():
+                num_created = create_variants_from_stream(project, request.data or [])
+                update_project_progress(project.id)
+                project.save()  # Save project to set updated_at timestamp
+
+            record_import("variants", num_created)
+            return Response({})
+
         serializer = UploadedVariantSerializer(
             data=request.data, context={"project": project}, many=True
         )
@@ -50,6 +85,8 @@ class ProjectVariantsView(APIView):
 
         with transaction.atomic():
             serializer.save()
+            update_project_progress(project.id)
             project.save()  # Save project to set updated_at timestamp
 
+        record_import("variants", len(serializer.validated_data))
         return Response({})
@@ -1,34 +1,32 @@
-from django.db.models import Count, F, Q
+from django.db.models import F
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from curation_portal.models import CuratorProgress
+
 
 class AssignedProjectsView(APIView):
     permission_classes = (IsAuthenticated,)
 
     def get(self, request):
         assigned_projects = (
-            request.user.curation_assignments.values(
-                project_id=F("variant__project"), project_name=F("variant__project__name")
-            )
-            .annotate(
-                assigned=Count("variant_id"),
-                remaining=Count("variant_id", filter=Q(result__verdict__isnull=True)),
-            )
-            .order_by("-remaining", "-variant__project__created_at")
+            CuratorProgress.objects.filter(curator=request.user, total_assignments__gt=0)
+            .select_related("project")
+            .annotate(remaining=F("total_assignments") - F("completed_assignments"))
+            .order_by("-remaining", "-project__created_at")
         )
 
         return Response(
             {
                 "projects": [
                     {
-                        "id": project["project_id"],
-                        "name": project["project_name"],
-                        "variants_assigned": project["assigned"],
-                        "variants_curated": project["assigned"] - project["remaining"],
+                        "id": progress.project.id,
+                        "name": progress.project.name,
+                        "variants_assigned": progress.total_assignments,
+                        "variants_curated": progress.completed_assignments,
                     }
-                    for project in assigned_projects
+                    for progress in assigned_projects
                 ]
             }
         )
@@ -0,0 +1,144 @@
+from django.db.models import Exists, OuterRef, Q, Subquery
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from curation_portal.filters import parse_region
+from curation_portal.models import CurationAssignment, Project, Variant, VariantAnnotation
+from curation_portal.pagination import CursorPaginationMixin, decode_cursor, encode_cursor, get_page
+from curation_portal.views.variant_projects import count_variant_assignments
+from curation_portal.visibility import get_visible_project_ids, visible_variants
+
+
+def filter_variants_by_locus(variants, query_params):
+    """
+    Filter variants to those in a region (chrom:start-stop) or annotated with a gene.
+
+    Regions are converted to a range of xpos values. Genes may be identified by gene ID or symbol.
+    """
+    if "region" in query_params:
+        start, stop = parse_region(query_params["region"])
+        return variants.filter(xpos__range=(start, stop))
+
+    if "gene" in query_params:
+        gene = query_params["gene"].strip()
+        annotations = (
+            VariantAnnotation.objects.filter(gene_id=gene)
+            if gene.upper().startswith("ENSG")
+            else VariantAnnotation.objects.filter(gene_symbol=gene)
+        )
+        return variants.filter(id__in=annotations.values("variant_id"))
+
+    raise ValidationError({"region": ["Either a region or a gene is required"]})
+
+
+class VariantLocusView(CursorPaginationMixin, APIView):
+    """
+    Base class for lists of variants in a region or gene along with their curation status.
+
+    Variants are listed in xpos order, one page at a time. Responses include a cursor that can
+    be used to request the next page.
+    """
+
+    permission_classes = (IsAuthenticated,)
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
+        page_size = self.get_page_size()
+
+        curator_assignments = CurationAssignment.objects.filter(
+            variant_id=OuterRef("pk"), curator=request.user
+        )
+
+        variants = (
+            filter_variants_by_locus(self.get_queryset(), request.query_params)
+            .annotate(
+                is_variant_curator=Exists(curator_assignments),
+                verdict=Subquery(curator_assignments.values("result__verdict")[:1]),
+                total=count_variant_assignments(),
+                completed=count_variant_assignments(result__verdict__isnull=False),
+            )
+            .order_by("xpos", "id")
+            .values(
+                "id",
+                "variant_id",
+                "reference_genome",
+                "xpos",
+                "major_consequence",
+                "gene_symbols",
+                "project_id",
+                "project__name",
+                "is_variant_curator",
+                "verdict",
+                "total",
+                "completed",
+            )
+        )
+
+        if "cursor" in request.query_params:
+            xpos, pk = decode_cursor(request.query_params["cursor"], int, int)
+            variants = variants.filter(Q(xpos__gt=xpos) | Q(xpos=xpos, id__gt=pk))
+
+        page, has_next_page = get_page(variants, page_size)
+
+        owned_project_ids, _ = get_visible_project_ids(request.user)
+
+        def serialize_variant(variant):
+            serialized_variant = {
+                "id": variant["id"],
+                "variant_id": variant["variant_id"],
+                "reference_genome": variant["reference_genome"],
+                "major_consequence": variant["major_consequence"],
+                "genes": variant["gene_symbols"].split(",") if variant["gene_symbols"] else [],
+                "project": {"id": variant["project_id"], "name": variant["project__name"]},
+                "is_variant_curator": variant["is_variant_curator"],
+                "verdict": variant["verdict"],
+            }
+
+            # Only project owners can see the progress of other curators.
+            if variant["project_id"] in owned_project_ids:
+                serialized_variant["assignments"] = {
+                    "total": variant["total"],
+                    "completed": variant["completed"],
+                }
+
+            return serialized_variant
+
+        return Response(
+            {
+                "variants": [serialize_variant(variant) for variant in page],
+                "next_cursor": (
+                    encode_cursor([page[-1]["xpos"], page[-1]["id"]]) if has_next_page else None
+                ),
+            }
+        )
+
+
+class ProjectVariantLocusView(VariantLocusView):
+    def get_project(self):
+        project = get_object_or_404(Project, id=self.kwargs["project_id"])
+        if not self.request.user.has_perm("curation_portal.view_project", project):
+            raise NotFound
+
+        return project
+
+    def get_queryset(self):
+        project = self.get_project()
+        return visible_variants(self.request.user, Variant.objects.filter(project=project))
+
+
+class VariantsLocusView(VariantLocusView):
+    def get_queryset(self):
+        reference_genome = (
+            self.request.query_params["reference_genome"]
+            if "reference_genome" in self.request.query_params
+            else "GRCh37"
+        )
+
+        return visible_variants(
+            self.request.user, Variant.objects.filter(reference_genome=reference_genome)
+        )
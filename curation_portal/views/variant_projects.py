@@ -1,10 +1,30 @@
-from django.db.models import Count, F, Q
+from django.db.models import Count, Exists, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from curation_portal.models import CurationAssignment, Variant
+from curation_portal.models import CurationAssignment, Project, Variant
+
+
+def count_variant_assignments(**filters):
+    """
+    Return an expression counting a variant's assignments that match filters.
+
+    Assignments are counted in a subquery so that queries for variants do not need to be grouped.
+    """
+    return Coalesce(
+        Subquery(
+            CurationAssignment.objects.filter(variant_id=OuterRef("pk"), **filters)
+            .order_by()
+            .values("variant_id")
+            .annotate(count=Count("id"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
 
 
 class VariantProjectsView(APIView):
@@ -17,57 +37,56 @@ class VariantProjectsView(APIView):
             else "GRCh37"
         )
 
-        variants = (
-            Variant.objects.filter(
-                Q(variant_id=kwargs["variant_id"])
-                & Q(reference_genome=reference_genome)
-                & (
-                    Q(project__owners__id__contains=request.user.id)
-                    | Q(curation_assignment__curator=request.user)
-                )
-            )
-            .distinct()
-            .select_related("project")
+        owners = Project.owners.through.objects.filter(
+            project_id=OuterRef("project_id"), user_id=request.user.id
         )
-
-        if not variants:
-            raise NotFound("Variant not found")
-
-        assignments = set(
-            CurationAssignment.objects.filter(
-                variant__variant_id=kwargs["variant_id"], curator=request.user
-            ).values_list("variant", flat=True)
+        curator_assignments = CurationAssignment.objects.filter(
+            variant_id=OuterRef("pk"), curator=request.user
         )
 
-        project_assignments = {
-            p["project"]: {"total": p["total"], "completed": p["completed"]}
-            for p in (
-                CurationAssignment.objects.filter(variant__variant_id=kwargs["variant_id"])
-                .values(project=F("variant__project"))
-                .annotate(
-                    total=Count("id"),
-                    completed=Count("id", filter=Q(result__verdict__isnull=False)),
-                )
+        variants = (
+            Variant.objects.filter(
+                variant_id=kwargs["variant_id"], reference_genome=reference_genome
+            )
+            .annotate(
+                is_project_owner=Exists(owners), is_variant_curator=Exists(curator_assignments)
+            )
+            .filter(Q(is_project_owner=True) | Q(is_variant_curator=True))
+            .annotate(
+                total=count_variant_assignments(),
+                completed=count_variant_assignments(result__verdict__isnull=False),
+            )
+            .order_by("project_id")
+            .values(
+                "id",
+                "project_id",
+                "project__name",
+                "is_project_owner",
+                "is_variant_curator",
+                "total",
+                "completed",
             )
-        }
+        )
 
         projects = []
         for variant in variants:
-            is_project_owner = variant.project.owners.filter(id=request.user.id).exists()
-
             project = {
-                "id": variant.project.id,
-                "name": variant.project.name,
-                "variant_id": variant.id,
-                "is_project_owner": is_project_owner,
-                "is_variant_curator": variant.id in assignments,
+                "id": variant["project_id"],
+                "name": variant["project__name"],
+                "variant_id": variant["id"],
+                "is_project_owner": variant["is_project_owner"],
+                "is_variant_curator": variant["is_variant_curator"],
             }
 
-            if is_project_owner:
-                project["assignments"] = project_assignments.get(
-                    variant.project.id, {"total": 0, "completed": 0}
-                )
+            if variant["is_project_owner"]:
+                project["assignments"] = {
+                    "total": variant["total"],
+                    "completed": variant["completed"],
+                }
 
             projects.append(project)
 
+        if not projects:
+            raise NotFound("Variant not found")
+
         return Response({"variant": {"variant_id": kwargs["variant_id"], "projects": projects}})
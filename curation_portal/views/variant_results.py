@@ -1,11 +1,12 @@
-from django.db.models import Q
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.serializers import ChoiceField, ModelSerializer, SerializerMethodField
 from rest_framework.views import APIView
 
+from curation_portal.filters import ResultFilter
 from curation_portal.models import CurationResult, Project, Variant, FLAG_FIELDS
+from curation_portal.visibility import visible_assignments, visible_variants
 
 
 class VariantSerializer(ModelSerializer):
@@ -65,36 +66,27 @@ class VariantResultsView(APIView):
             else "GRCh37"
         )
 
-        variants = (
+        variants = visible_variants(
+            request.user,
             Variant.objects.filter(
-                Q(variant_id=kwargs["variant_id"])
-                & Q(reference_genome=reference_genome)
-                & (
-                    Q(project__owners__id__contains=request.user.id)
-                    | Q(curation_assignment__curator=request.user)
-                )
-            )
-            .distinct()
-            .select_related("project")
+                variant_id=kwargs["variant_id"], reference_genome=reference_genome
+            ),
         )
 
-        if not variants:
+        if not variants.exists():
             raise NotFound("Variant not found")
 
-        results = (
+        results = visible_assignments(
+            request.user,
             CurationResult.objects.filter(
-                Q(assignment__variant__variant_id=kwargs["variant_id"])
-                & Q(assignment__variant__reference_genome=reference_genome)
-                & (
-                    Q(assignment__variant__project__owners__id__contains=request.user.id)
-                    | Q(assignment__curator=request.user)
-                )
-            )
-            .distinct()
-            .select_related(
-                "assignment__curator", "assignment__variant", "assignment__variant__project"
-            )
+                assignment__variant__variant_id=kwargs["variant_id"],
+                assignment__variant__reference_genome=reference_genome,
+            ),
+            prefix="assignment__",
+        ).select_related(
+            "assignment__curator", "assignment__variant", "assignment__variant__project"
         )
 
-        serializer = CurationResultSerializer(results, many=True)
+        filtered_results = ResultFilter(request.query_params, queryset=results).qs
+        serializer = CurationResultSerializer(filtered_results, many=True)
         return Response({"results": serializer.data})
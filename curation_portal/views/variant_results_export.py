@@ -1,18 +1,10 @@
-import csv
-
-from django.db.models import Prefetch, Q
-from django.http import HttpResponse
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 
-from curation_portal.models import (
-    CurationAssignment,
-    Variant,
-    VariantAnnotation,
-    FLAG_FIELDS,
-    FLAG_LABELS,
-)
+from curation_portal.export import results_export_response
+from curation_portal.models import CurationAssignment, Variant
+from curation_portal.visibility import visible_assignments, visible_variants
 
 
 class ExportVariantResultsView(APIView):
@@ -25,76 +17,30 @@ class ExportVariantResultsView(APIView):
             else "GRCh37"
         )
 
-        variants = (
+        variants = visible_variants(
+            request.user,
             Variant.objects.filter(
-                Q(variant_id=kwargs["variant_id"])
-                & Q(reference_genome=reference_genome)
-                & (
-                    Q(project__owners__id__contains=request.user.id)
-                    | Q(curation_assignment__curator=request.user)
-                )
-            )
-            .distinct()
-            .select_related("project")
+                variant_id=kwargs["variant_id"], reference_genome=reference_genome
+            ),
         )
 
-        if not variants:
+        if not variants.exists():
             raise NotFound("Variant not found")
 
-        completed_assignments = (
+        completed_assignments = visible_assignments(
+            request.user,
             CurationAssignment.objects.filter(
-                Q(variant__variant_id=kwargs["variant_id"])
-                & Q(variant__reference_genome=reference_genome)
-                & (
-                    Q(variant__project__owners__id__contains=request.user.id)
-                    | Q(curator=request.user)
-                )
-                & Q(result__verdict__isnull=False)
-            )
-            .distinct()
-            .select_related("curator", "variant", "result")
-            .prefetch_related(
-                Prefetch(
-                    "variant__annotations",
-                    queryset=VariantAnnotation.objects.only(
-                        "variant_id", "gene_id", "gene_symbol", "transcript_id"
-                    ),
-                )
-            )
-        )
-
-        result_fields = ["notes", "should_revisit", "verdict", *FLAG_FIELDS]
-
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = (
-            f'attachment; filename="{kwargs["variant_id"]}_results.csv"'
+                variant__variant_id=kwargs["variant_id"],
+                variant__reference_genome=reference_genome,
+                result__verdict__isnull=False,
+            ),
+        ).select_related("curator", "variant__project", "result")
+
+        # Results are written in chunks so that large exports are not held in memory.
+        return results_export_response(
+            completed_assignments,
+            request.query_params.get("file_format", "csv"),
+            f"{kwargs['variant_id']}_results",
+            "Project",
+            lambda assignment: assignment.variant.project.name,
         )
-
-        writer = csv.writer(response)
-
-        header_row = ["Project", "Gene", "Transcript", "Curator"] + [
-            FLAG_LABELS.get(f, " ".join(word.capitalize() for word in f.split("_")))
-            for f in result_fields
-        ]
-        writer.writerow(header_row)
-
-        for assignment in completed_assignments:
-            row = [
-                assignment.variant.project.name,
-                ";".join(
-                    set(
-                        f"{annotation.gene_id}:{annotation.gene_symbol}"
-                        for annotation in assignment.variant.annotations.all()
-                    )
-                ),
-                ";".join(
-                    set(
-                        annotation.transcript_id
-                        for annotation in assignment.variant.annotations.all()
-                    )
-                ),
-                assignment.curator.username,
-            ] + [getattr(assignment.result, f) for f in result_fields]
-            writer.writerow(row)
-
-        return response
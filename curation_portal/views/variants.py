@@ -3,22 +3,50 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from curation_portal.filters import VariantFilter
 from curation_portal.models import Variant
+from curation_portal.pagination import CursorPaginationMixin, decode_cursor, encode_cursor, get_page
+from curation_portal.visibility import visible_variants
 
 
-class VariantsView(APIView):
+class VariantsView(CursorPaginationMixin, APIView):
+    """
+    List distinct variants that the user can see in any project.
+
+    Variants are listed in (xpos, variant ID, reference genome) order, one page at a time.
+    Responses include a cursor that can be used to request the next page.
+    """
+
     permission_classes = (IsAuthenticated,)
 
     def get(self, request, *args, **kwargs):  # pylint: disable=unused-argument
-        variants = (
-            Variant.objects.filter(
-                Q(project__owners__id__contains=request.user.id)
-                | Q(curation_assignment__curator=request.user)
-            )
-            .values_list("variant_id", "reference_genome")
+        page_size = self.get_page_size()
+
+        variants = VariantFilter(
+            request.query_params, queryset=visible_variants(request.user, Variant.objects.all())
+        ).qs
+
+        page = (
+            variants.values_list("xpos", "variant_id", "reference_genome")
+            .order_by("xpos", "variant_id", "reference_genome")
             .distinct()
         )
 
+        if "cursor" in request.query_params:
+            xpos, variant_id, reference_genome = decode_cursor(
+                request.query_params["cursor"], int, str, str
+            )
+            page = page.filter(
+                Q(xpos__gt=xpos)
+                | Q(xpos=xpos, variant_id__gt=variant_id)
+                | Q(xpos=xpos, variant_id=variant_id, reference_genome__gt=reference_genome)
+            )
+
+        page, has_next_page = get_page(page, page_size)
+
         return Response(
-            {"variants": [{"variant_id": v[0], "reference_genome": v[1]} for v in variants]}
+            {
+                "variants": [{"variant_id": v[1], "reference_genome": v[2]} for v in page],
+                "next_cursor": encode_cursor(page[-1]) if has_next_page else None,
+            }
         )
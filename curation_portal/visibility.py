@@ -0,0 +1,58 @@
+from django.db.models import Q
+
+from curation_portal.models import CurationAssignment
+from curation_portal.rules import (
+    get_curated_project_ids,
+    get_owned_project_ids,
+    load_curated_project_ids,
+    load_owned_project_ids,
+)
+
+
+# Users can see all variants and results in projects they own, and variants and results in other
+# projects that are assigned to them. Rather than joining through project owners and assignments
+# (which requires removing duplicate rows), the IDs of projects that a user owns or curates are
+# loaded once per request and queries are filtered by project ID.
+
+
+def get_visible_project_ids(user):
+    """Return IDs of projects owned by a user and IDs of other projects where they are a curator."""
+    owned_project_ids = get_owned_project_ids(user)
+    if owned_project_ids is None:
+        owned_project_ids = load_owned_project_ids(user)
+
+    curated_project_ids = get_curated_project_ids(user)
+    if curated_project_ids is None:
+        curated_project_ids = load_curated_project_ids(user)
+
+    return owned_project_ids, curated_project_ids - owned_project_ids
+
+
+def visible_variants(user, variants):
+    """Filter a queryset of variants to those that a user can see."""
+    owned_project_ids, curated_project_ids = get_visible_project_ids(user)
+    return variants.filter(
+        Q(project__in=owned_project_ids)
+        | Q(
+            project__in=curated_project_ids,
+            id__in=CurationAssignment.objects.filter(curator=user).values("variant_id"),
+        )
+    )
+
+
+def visible_assignments(user, assignments, prefix=""):
+    """
+    Filter a queryset of assignments to those that a user can see.
+
+    To filter a queryset of related objects, prefix is the lookup path to the assignment.
+    """
+    owned_project_ids, curated_project_ids = get_visible_project_ids(user)
+    return assignments.filter(
+        Q(**{f"{prefix}variant__project__in": owned_project_ids})
+        | Q(
+            **{
+                f"{prefix}variant__project__in": curated_project_ids,
+                f"{prefix}curator": user,
+            }
+        )
+    )
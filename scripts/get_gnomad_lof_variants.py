@@ -410,7 +410,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Include variants marked low-confidence by LOFTEE",
     )
-    parser.add_argument("--output", required=True, help="destination for variants file")
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="destination for variants file (use a .ndjson or .ndjson.gz extension for newline-delimited JSON)",
+    )
     args = parser.parse_args()
 
     if args.gene_ids or args.genes_file:
@@ -440,6 +444,12 @@ if __name__ == "__main__":
 
     if args.output.endswith(".ht"):
         variants.write(args.output)
+    elif args.output.endswith((".ndjson", ".ndjson.gz", ".ndjson.bgz")):
+        # Write one variant per line. These files can be uploaded to the curation portal
+        # without the server holding the entire list of variants in memory.
+        variants.annotate(json=hl.json(variants.row_value)).key_by().select("json").export(
+            args.output, header=False
+        )
     else:
         # Convert to JSON and write
         rows = variants.annotate(json=hl.json(variants.row_value)).key_by().select("json").collect()
@@ -2,6 +2,7 @@
 import pytest
 from rest_framework.test import APIClient
 
+from curation_portal import export
 from curation_portal.models import User
 
 pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
@@ -28,3 +29,11 @@ def test_app_settings_returns_configured_sign_out_url(db_setup, settings, sign_o
     client.force_authenticate(User.objects.get(username="user"))
     response = client.get("/api/settings/").json()
     assert response["settings"]["sign_out_url"] == sign_out_url
+
+
+def test_app_settings_only_lists_available_export_formats(db_setup, monkeypatch):
+    monkeypatch.setattr(export, "pyarrow", None)
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user"))
+    response = client.get("/api/settings/").json()
+    assert response["settings"]["export_formats"] == ["csv"]
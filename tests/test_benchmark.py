@@ -0,0 +1,66 @@
+# pylint: disable=redefined-outer-name,unused-argument
+import pytest
+
+from curation_portal import benchmark
+from curation_portal.cache import get_project_cache
+from curation_portal.urls import urlpatterns
+
+pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
+
+
+def test_benchmark_includes_all_api_views():
+    api_url_names = set(
+        pattern.name for pattern in urlpatterns if pattern.name and pattern.name.startswith("api-")
+    )
+    benchmarked_url_names = set(request["url_name"] for request in benchmark.BENCHMARK_REQUESTS)
+    assert benchmarked_url_names == api_url_names
+
+
+def test_benchmark_includes_all_api_view_methods():
+    benchmarked_requests = set(
+        (request["url_name"], request["method"]) for request in benchmark.BENCHMARK_REQUESTS
+    )
+    for pattern in urlpatterns:
+        if pattern.name and pattern.name.startswith("api-"):
+            view_class = pattern.callback.cls
+            for method in ("get", "post", "put", "patch", "delete"):
+                if hasattr(view_class, method):
+                    assert (pattern.name, method) in benchmarked_requests
+
+
+def test_benchmark_does_not_clear_project_cache(settings):
+    settings.CACHES = {
+        **settings.CACHES,
+        "project_data": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test_project_data",
+        },
+    }
+    get_project_cache().set("benchmark-test", "cached")
+
+    benchmark.run_benchmark([2], repeat=1)
+
+    assert get_project_cache().get("benchmark-test") == "cached"
+    get_project_cache().clear()
+
+
+def test_api_view_query_counts_do_not_depend_on_project_size(monkeypatch):
+    monkeypatch.setattr(benchmark.export, "EXPORT_CHUNK_SIZE", 4)
+
+    report = benchmark.run_benchmark([2, 8], num_annotations=2, num_curators=2, repeat=1)
+    assert report["failures"] == {}
+
+
+def test_benchmark_reports_query_count_regressions():
+    measurements = {
+        10: {"status_code": 200, "queries": 5, "batches": 0, "time_ms": 1, "peak_memory_kb": 1},
+        100: {"status_code": 200, "queries": 14, "batches": 0, "time_ms": 1, "peak_memory_kb": 1},
+    }
+    assert benchmark.check_measurements(measurements) == [
+        "Query count depends on project size: 5 queries with 10 variants, "
+        "14 queries with 100 variants"
+    ]
+
+    assert benchmark.check_measurements(measurements, thresholds={"max_queries": 10})[1:] == [
+        "queries 14 exceeds 10 with 100 variants"
+    ]
@@ -1,5 +1,7 @@
 # pylint: disable=redefined-outer-name,unused-argument
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
 from curation_portal.models import CurationAssignment, Project, User, Variant
@@ -80,6 +82,43 @@ def test_create_projects_assignments(db_setup):
     CurationAssignment.objects.filter(curator__username="user3", variant__project=1).delete()
 
 
+def test_create_project_assignments_numbers_each_curators_assignments(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1"))
+    response = client.post(
+        "/api/project/1/assignments/",
+        {
+            "assignments": [
+                {"curator": "user2", "variant_id": "1-200-A-T"},
+                {"curator": "user2", "variant_id": "1-120-G-A"},
+                {"curator": "user3", "variant_id": "1-150-C-G"},
+            ]
+        },
+        format="json",
+    )
+    assert response.status_code == 200
+
+    def get_ordinals(username):
+        return list(
+            CurationAssignment.objects.filter(curator__username=username, project=1)
+            .order_by("ordinal")
+            .values_list("variant__variant_id", "ordinal")
+        )
+
+    assert get_ordinals("user2") == [("1-100-A-G", 0), ("1-120-G-A", 1), ("1-200-A-T", 2)]
+    assert get_ordinals("user3") == [("1-150-C-G", 0)]
+
+    CurationAssignment.objects.get(
+        curator__username="user2", variant__variant_id="1-120-G-A"
+    ).delete()
+    assert get_ordinals("user2") == [("1-100-A-G", 0), ("1-200-A-T", 1)]
+
+    CurationAssignment.objects.filter(curator__username="user2", variant__project=1).exclude(
+        variant__variant_id="1-100-A-G"
+    ).delete()
+    CurationAssignment.objects.filter(curator__username="user3", variant__project=1).delete()
+
+
 def test_create_project_assignments_validates_variant_exists(db_setup):
     client = APIClient()
     client.force_authenticate(User.objects.get(username="user1"))
@@ -180,3 +219,38 @@ def test_create_project_assignments_rejects_duplicate_assignments(db_setup):
     assert not CurationAssignment.objects.filter(
         curator__username="user3", variant__variant_id="1-120-G-A"
     ).exists()
+
+
+def test_create_project_assignments_query_count_does_not_depend_on_number_of_assignments(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1"))
+
+    def create_assignments(curators):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(
+                "/api/project/1/assignments/",
+                {
+                    "assignments": [
+                        {"curator": curator, "variant_id": variant_id}
+                        for curator in curators
+                        for variant_id in ["1-150-C-G", "1-200-A-T"]
+                    ]
+                },
+                format="json",
+            )
+            assert response.status_code == 200
+
+        return len(queries)
+
+    num_queries_for_few_assignments = create_assignments(["curator0"])
+    num_queries_for_many_assignments = create_assignments([f"curator{i}" for i in range(1, 26)])
+
+    assert num_queries_for_many_assignments == num_queries_for_few_assignments
+    assert (
+        CurationAssignment.objects.filter(
+            curator__username__startswith="curator", variant__project=1
+        ).count()
+        == 52
+    )
+
+    User.objects.filter(username__startswith="curator").delete()
@@ -1,5 +1,7 @@
 # pylint: disable=redefined-outer-name,unused-argument
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
 from curation_portal.models import CurationAssignment, CurationResult, Project, User, Variant
@@ -199,6 +201,50 @@ def test_curate_variant_orders_multiallelic_variants(db_setup):
             assert response["next_variant"] is None
 
 
+def test_curate_variant_index_is_position_in_curators_assignments(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user3@example.com"))
+
+    variant = Variant.objects.get(variant_id="1-100-A-C", project_id=1)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(f"/api/project/1/variant/{variant.id}/curate/").json()
+
+    assert response["index"] == 0
+    # Without filters, the index is the assignment's ordinal.
+    assert not any("COUNT(" in query["sql"] for query in queries.captured_queries)
+
+
+def test_assignment_ordinals_are_updated_when_assignments_are_added_or_removed(db_setup):
+    def get_ordinals(username):
+        return list(
+            CurationAssignment.objects.filter(curator__username=username, project=1)
+            .order_by("ordinal")
+            .values_list("variant__variant_id", "ordinal")
+        )
+
+    user3 = User.objects.get(username="user3@example.com")
+    CurationAssignment.objects.create(
+        curator=user3, variant=Variant.objects.get(variant_id="1-100-A-G", project_id=1)
+    )
+    CurationAssignment.objects.create(
+        curator=user3, variant=Variant.objects.get(variant_id="1-100-A-AC", project_id=1)
+    )
+    assert get_ordinals("user3@example.com") == [
+        ("1-100-A-AC", 0),
+        ("1-100-A-C", 1),
+        ("1-100-A-G", 2),
+    ]
+
+    # Deleting a variant deletes and renumbers assignments for all curators.
+    Variant.objects.get(variant_id="1-100-A-C", project_id=1).delete()
+    assert get_ordinals("user3@example.com") == [("1-100-A-AC", 0), ("1-100-A-G", 1)]
+    assert get_ordinals("user2@example.com") == [
+        ("1-100-A-AC", 0),
+        ("1-100-A-AT", 1),
+        ("1-100-A-G", 2),
+    ]
+
+
 def test_curate_variant_adjacent_variants_respects_filters(db_setup):
     client = APIClient()
     client.force_authenticate(User.objects.get(username="user2@example.com"))
@@ -0,0 +1,145 @@
+# pylint: disable=redefined-outer-name,unused-argument
+import json
+import os
+
+import pytest
+from rest_framework.test import APIClient
+
+from curation_portal import metrics
+from curation_portal.models import CurationAssignment, CurationResult, Project, User
+
+pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
+
+
+@pytest.fixture(scope="module")
+def db_setup(django_db_setup, django_db_blocker, create_variant):
+    with django_db_blocker.unblock():
+        project = Project.objects.create(id=1, name="Test Project")
+        variant1 = create_variant(project, "1-100-A-G")
+
+        user1 = User.objects.create(username="user1@example.com")
+        staff_user = User.objects.create(username="staff@example.com", is_staff=True)
+
+        project.owners.set([user1])
+        CurationAssignment.objects.create(
+            curator=user1, variant=variant1, result=CurationResult.objects.create(verdict="lof")
+        )
+
+        yield
+
+        project.delete()
+
+        user1.delete()
+        staff_user.delete()
+        # Created by results upload
+        User.objects.filter(username="user2@example.com").delete()
+
+
+def get_metrics():
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="staff@example.com"))
+    response = client.get("/api/metrics/")
+    assert response.status_code == 200
+
+    values = {}
+    for line in response.content.decode("utf-8").splitlines():
+        if line and not line.startswith("#"):
+            sample, value = line.rsplit(" ", 1)
+            values[sample] = float(value)
+
+    return values
+
+
+def test_metrics_can_only_be_viewed_by_staff(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/metrics/")
+    assert response.status_code == 403
+
+    client.force_authenticate(User.objects.get(username="staff@example.com"))
+    response = client.get("/api/metrics/")
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+    assert "# TYPE curation_portal_request_duration_seconds histogram" in response.content.decode(
+        "utf-8"
+    )
+
+
+def test_metrics_record_requests_by_view(db_setup):
+    requests_sample = 'curation_portal_requests_total{method="GET",status="200",view="api-project"}'
+    queries_sample = 'curation_portal_request_queries_count{view="api-project"}'
+    duration_sample = (
+        'curation_portal_request_duration_seconds_bucket{view="api-project",le="+Inf"}'
+    )
+
+    before = get_metrics()
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    client.get("/api/project/1/")
+    client.get("/api/project/1/")
+
+    after = get_metrics()
+    assert after[requests_sample] - before.get(requests_sample, 0) == 2
+    assert after[queries_sample] - before.get(queries_sample, 0) == 2
+    assert after[duration_sample] - before.get(duration_sample, 0) == 2
+    assert after['curation_portal_request_queries_sum{view="api-project"}'] > 0
+
+
+def test_metrics_record_imported_rows(db_setup):
+    sample = 'curation_portal_imported_rows_total{kind="results"}'
+    before = get_metrics().get(sample, 0)
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.post(
+        "/api/project/1/results/",
+        [{"curator": "user2@example.com", "variant_id": "1-100-A-G", "verdict": "not_lof"}],
+        format="json",
+    )
+    assert response.status_code == 200
+
+    assert get_metrics()[sample] - before == 1
+
+
+def test_metrics_record_exported_bytes(db_setup):
+    sample = 'curation_portal_exported_bytes_total{format="csv"}'
+    before = get_metrics().get(sample, 0)
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/results/export/")
+    content = b"".join(response.streaming_content)
+
+    after = get_metrics()
+    assert after[sample] - before == len(content)
+    assert after['curation_portal_export_duration_seconds_count{format="csv"}'] >= 1
+
+
+def test_metrics_are_combined_across_processes(db_setup, settings, tmpdir):
+    settings.CURATION_PORTAL_METRICS_DIR = str(tmpdir)
+
+    sample = 'curation_portal_imported_rows_total{kind="variants"}'
+    before = get_metrics().get(sample, 0)
+
+    with open(os.path.join(str(tmpdir), "metrics-1-abc.json"), "w") as metrics_file:
+        json.dump(
+            [
+                ["curation_portal_imported_rows_total", {"kind": "variants"}, 5],
+                [
+                    "curation_portal_export_duration_seconds",
+                    {"format": "parquet"},
+                    {"buckets": [1] + [0] * 10, "sum": 0.005, "count": 1},
+                ],
+            ],
+            metrics_file,
+        )
+
+    after = get_metrics()
+    assert after[sample] - before == 5
+    assert after['curation_portal_export_duration_seconds_bucket{format="parquet",le="0.01"}'] == 1
+    assert after['curation_portal_export_duration_seconds_bucket{format="parquet",le="+Inf"}'] == 1
+
+    # The current process's metrics are written to the same directory.
+    metrics.store.flush()
+    assert os.path.exists(os.path.join(str(tmpdir), metrics.store.filename))
@@ -0,0 +1,83 @@
+# pylint: disable=redefined-outer-name,unused-argument
+import pytest
+from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from curation_portal.models import CurationAssignment, Project, User
+from curation_portal.rules import permission_cache
+
+pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
+
+
+@pytest.fixture(scope="module")
+def db_setup(django_db_setup, django_db_blocker, create_variant):
+    with django_db_blocker.unblock():
+        project1 = Project.objects.create(id=1, name="Project #1")
+        project2 = Project.objects.create(id=2, name="Project #2")
+        variant = create_variant(project2, "1-100-A-G")
+
+        user1 = User.objects.create(username="user1@example.com")
+        user1.user_permissions.add(Permission.objects.get(codename="add_variant"))
+        user2 = User.objects.create(username="user2@example.com")
+
+        project1.owners.set([user1])
+        CurationAssignment.objects.create(curator=user1, variant=variant)
+
+        yield
+
+        project1.delete()
+        project2.delete()
+
+        user1.delete()
+        user2.delete()
+
+
+@pytest.mark.parametrize(
+    "username,project_id,perm,expected_result",
+    [
+        ("user1@example.com", 1, "view_project", True),
+        ("user1@example.com", 1, "change_project", True),
+        ("user1@example.com", 1, "add_variant_to_project", True),
+        ("user1@example.com", 2, "view_project", True),
+        ("user1@example.com", 2, "change_project", False),
+        ("user2@example.com", 1, "view_project", False),
+        ("user2@example.com", 1, "change_project", False),
+    ],
+)
+def test_cached_permissions_match_uncached_permissions(
+    db_setup, username, project_id, perm, expected_result
+):
+    user = User.objects.get(username=username)
+    project = Project.objects.get(id=project_id)
+
+    assert user.has_perm(f"curation_portal.{perm}", project) == expected_result
+
+    with permission_cache():
+        assert user.has_perm(f"curation_portal.{perm}", project) == expected_result
+
+
+def test_permission_checks_are_cached(db_setup):
+    user = User.objects.get(username="user1@example.com")
+    projects = list(Project.objects.filter(id__in=[1, 2]))
+
+    with permission_cache():
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(3):
+                for project in projects:
+                    user.has_perm("curation_portal.view_project", project)
+                    user.has_perm("curation_portal.change_project", project)
+                    user.has_perm("curation_portal.add_variant_to_project", project)
+
+        # Owned projects, curated projects, and permissions
+        assert len(queries) == 3
+
+
+def test_permission_cache_is_cleared_when_owners_change(db_setup):
+    user = User.objects.get(username="user2@example.com")
+    project = Project.objects.get(id=1)
+
+    with permission_cache():
+        assert not user.has_perm("curation_portal.change_project", project)
+        project.owners.add(user)
+        assert user.has_perm("curation_portal.change_project", project)
@@ -0,0 +1,135 @@
+# pylint: disable=redefined-outer-name,unused-argument
+import json
+import logging
+import time
+
+import pytest
+from rest_framework.test import APIClient
+
+from curation_portal.models import CurationAssignment, Project, User, Variant
+from curation_portal.views.project_assignments import AssignmentSerializer
+
+pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
+
+
+@pytest.fixture(scope="module")
+def db_setup(django_db_setup, django_db_blocker, create_variant):
+    with django_db_blocker.unblock():
+        project = Project.objects.create(id=1, name="Test Project")
+        variant1 = create_variant(project, "1-100-A-G")
+
+        user1 = User.objects.create(username="user1@example.com")
+        CurationAssignment.objects.create(curator=user1, variant=variant1)
+
+        yield
+
+        project.delete()
+
+        user1.delete()
+
+
+@pytest.fixture
+def profiling(settings, tmpdir):
+    settings.CURATION_PORTAL_PROFILING = True
+    settings.CURATION_PORTAL_PROFILING_SLOW_REQUEST_MS = 0
+    settings.CURATION_PORTAL_PROFILING_SLOW_REQUEST_SAMPLE_RATE = 1
+    settings.CURATION_PORTAL_PROFILING_SLOW_REQUEST_FILE = str(tmpdir.join("slow_requests.jsonl"))
+    return settings
+
+
+def get_curate_variant_response():
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    variant = Variant.objects.get(variant_id="1-100-A-G")
+    return client.get(f"/api/project/1/variant/{variant.id}/curate/")
+
+
+def parse_server_timing(header):
+    metrics = {}
+    for metric in header.split(", "):
+        name, *params = metric.split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+
+    return metrics
+
+
+def test_profiling_is_disabled_by_default(db_setup):
+    response = get_curate_variant_response()
+    assert response.status_code == 200
+    assert "Server-Timing" not in response
+
+
+def test_profiling_adds_server_timing_header(db_setup, profiling):
+    response = get_curate_variant_response()
+    assert response.status_code == 200
+
+    metrics = parse_server_timing(response["Server-Timing"])
+    assert set(metrics.keys()) == {"db", "perm", "ser", "total"}
+    assert int(metrics["db"]["desc"].strip('"').split()[0]) > 0
+    assert float(metrics["ser"]["dur"]) > 0
+    assert float(metrics["total"]["dur"]) >= float(metrics["db"]["dur"])
+
+
+def test_profiling_records_permission_check_time(db_setup, profiling):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/")
+    assert response.status_code == 200
+
+    metrics = parse_server_timing(response["Server-Timing"])
+    assert float(metrics["perm"]["dur"]) > 0
+
+
+def test_profiling_records_serialization_time_in_views(db_setup, profiling, monkeypatch):
+    serializer_class = AssignmentSerializer
+    to_representation = serializer_class.to_representation
+
+    def slow_to_representation(self, instance):
+        time.sleep(0.05)
+        return to_representation(self, instance)
+
+    monkeypatch.setattr(serializer_class, "to_representation", slow_to_representation)
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/assignments/")
+    assert response.status_code == 200
+
+    metrics = parse_server_timing(response["Server-Timing"])
+    assert float(metrics["ser"]["dur"]) >= 50
+
+
+def test_profiling_logs_request_timings(db_setup, profiling, caplog):
+    with caplog.at_level(logging.INFO, logger="curation_portal.profiling"):
+        get_curate_variant_response()
+
+    log_entries = [
+        json.loads(record.getMessage())
+        for record in caplog.records
+        if record.name == "curation_portal.profiling"
+    ]
+    assert len(log_entries) == 1
+    assert log_entries[0]["method"] == "GET"
+    assert log_entries[0]["status"] == 200
+    assert log_entries[0]["user"] == "user1@example.com"
+    assert log_entries[0]["queries"] > 0
+
+
+def test_profiling_samples_slow_requests(db_setup, profiling):
+    get_curate_variant_response()
+
+    with open(profiling.CURATION_PORTAL_PROFILING_SLOW_REQUEST_FILE) as sample_file:
+        samples = [json.loads(line) for line in sample_file]
+
+    assert len(samples) == 1
+    assert samples[0]["path"].endswith("/curate/")
+    assert len(samples[0]["slowest_queries"]) == min(samples[0]["queries"], 20)
+    assert all("sql" in query for query in samples[0]["slowest_queries"])
+
+
+def test_profiling_does_not_sample_fast_requests(db_setup, profiling):
+    profiling.CURATION_PORTAL_PROFILING_SLOW_REQUEST_MS = 60 * 60 * 1000
+    get_curate_variant_response()
+
+    with pytest.raises(FileNotFoundError):
+        open(profiling.CURATION_PORTAL_PROFILING_SLOW_REQUEST_FILE)
@@ -1,8 +1,20 @@
 # pylint: disable=redefined-outer-name,unused-argument
+import importlib
+
 import pytest
+from django.apps import apps
+from django.core.management import call_command
 from rest_framework.test import APIClient
 
-from curation_portal.models import CurationAssignment, CurationResult, Project, User
+from curation_portal.models import (
+    CurationAssignment,
+    CurationResult,
+    Project,
+    User,
+    Variant,
+    VariantAnnotation,
+    FLAG_FIELDS,
+)
 
 pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
 
@@ -72,11 +84,13 @@ def db_setup(django_db_setup, django_db_blocker, create_variant):
         CurationAssignment.objects.create(curator=user3, variant=variant3)
         CurationAssignment.objects.create(curator=user3, variant=variant4)
 
-        assignment1.result = CurationResult.objects.create(verdict="lof")
+        assignment1.result = CurationResult.objects.create(
+            verdict="lof", flag_mapping_error=True, flag_mnp=True
+        )
         assignment1.save()
 
         assignment2.result = CurationResult.objects.create(
-            verdict="likely_lof", should_revisit=True
+            verdict="likely_lof", should_revisit=True, flag_mapping_error=True
         )
         assignment2.save()
 
@@ -138,7 +152,9 @@ def test_projects_assignments_list_shows_assigned_variants(db_setup, username, e
         ("", ["1-100-A-G", "1-120-G-A", "1-150-C-G"]),
         ("variant__annotation__gene_symbol=GENEONE", ["1-100-A-G", "1-120-G-A"]),
         ("variant__annotation__consequence__contains=stop_gained", ["1-120-G-A"]),
+        ("variant__annotation__consequence__contains=STOP_GAINED", ["1-120-G-A"]),
         ("variant__annotation__consequence=splice_acceptor_variant", []),
+        ("variant__annotation__gene_symbol__contains=one", ["1-100-A-G", "1-120-G-A"]),
     ],
 )
 def test_projects_assignments_list_can_be_filtered_on_variant_annotations(
@@ -153,12 +169,39 @@ def test_projects_assignments_list_can_be_filtered_on_variant_annotations(
     assert assigned_variants == expected_variants
 
 
+def test_projects_assignments_filtered_on_variant_annotations_are_not_duplicated(db_setup):
+    VariantAnnotation.objects.create(
+        variant=Variant.objects.get(variant_id="1-100-A-G"),
+        consequence="frameshift_variant",
+        gene_id="g1",
+        gene_symbol="GENEONE",
+        transcript_id="t1-1",
+    )
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    response = client.get(
+        "/api/project/1/assignments/",
+        {"variant__annotation__gene_symbol": "GENEONE", "page_size": 10},
+    ).json()
+    assigned_variants = [
+        assignment["variant"]["variant_id"] for assignment in response["assignments"]
+    ]
+    assert assigned_variants == ["1-100-A-G", "1-120-G-A"]
+    assert response["count"] == 2
+
+
 @pytest.mark.parametrize(
     "query,expected_variants",
     [
         ("result__verdict=lof", ["1-100-A-G"]),
         ("result__should_revisit=true", ["1-120-G-A"]),
         ("result__verdict__isnull=true", ["1-150-C-G"]),
+        ("result__flags__any=flag_mnp", ["1-100-A-G"]),
+        ("result__flags__any=technical", ["1-100-A-G", "1-120-G-A"]),
+        ("result__flags__any=flag_mnp,flag_homopolymer", ["1-100-A-G"]),
+        ("result__flags__all=flag_mapping_error,flag_mnp", ["1-100-A-G"]),
+        ("result__flags__all=flag_mapping_error,flag_homopolymer", []),
     ],
 )
 def test_projects_assignments_list_can_be_filtered_on_result_fields(
@@ -171,3 +214,167 @@ def test_projects_assignments_list_can_be_filtered_on_result_fields(
         assignment["variant"]["variant_id"] for assignment in response["assignments"]
     ]
     assert assigned_variants == expected_variants
+
+
+def test_projects_assignments_list_rejects_unknown_flags(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    response = client.get("/api/project/1/assignments/?result__flags__any=flag_unknown")
+    assert response.status_code == 400
+
+
+def test_projects_assignments_list_can_be_paginated(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+
+    response = client.get("/api/project/1/assignments/", {"page_size": 2}).json()
+    assert [a["variant"]["variant_id"] for a in response["assignments"]] == [
+        "1-100-A-G",
+        "1-120-G-A",
+    ]
+    assert response["count"] == 3
+    assert response["next_cursor"]
+
+    response = client.get(
+        "/api/project/1/assignments/", {"page_size": 2, "cursor": response["next_cursor"]}
+    ).json()
+    assert [a["variant"]["variant_id"] for a in response["assignments"]] == ["1-150-C-G"]
+    assert response["count"] == 3
+    assert response["next_cursor"] is None
+
+
+def test_projects_assignments_list_pagination_respects_filters(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+
+    response = client.get(
+        "/api/project/1/assignments/",
+        {"page_size": 1, "variant__annotation__gene_symbol": "GENEONE"},
+    ).json()
+    assert [a["variant"]["variant_id"] for a in response["assignments"]] == ["1-100-A-G"]
+    assert response["count"] == 2
+
+    response = client.get(
+        "/api/project/1/assignments/",
+        {
+            "page_size": 1,
+            "variant__annotation__gene_symbol": "GENEONE",
+            "cursor": response["next_cursor"],
+        },
+    ).json()
+    assert [a["variant"]["variant_id"] for a in response["assignments"]] == ["1-120-G-A"]
+    assert response["next_cursor"] is None
+
+
+@pytest.mark.parametrize("query", ["page_size=0", "page_size=foo", "page_size=2&cursor=foo"])
+def test_projects_assignments_list_rejects_invalid_pagination_parameters(db_setup, query):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    response = client.get(f"/api/project/1/assignments/?{query}")
+    assert response.status_code == 400
+
+
+def test_projects_assignments_list_can_select_fields(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    response = client.get(
+        "/api/project/1/assignments/", {"fields": "variant.variant_id,result.verdict"}
+    ).json()
+    assert response["assignments"] == [
+        {"variant": {"variant_id": "1-100-A-G"}, "result": {"verdict": "lof"}},
+        {"variant": {"variant_id": "1-120-G-A"}, "result": {"verdict": "likely_lof"}},
+        {"variant": {"variant_id": "1-150-C-G"}, "result": None},
+    ]
+
+
+def test_projects_assignments_list_does_not_include_internal_result_fields(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    response = client.get("/api/project/1/assignments/").json()
+    result = response["assignments"][0]["result"]
+    assert set(result.keys()) == {
+        "id",
+        "created_at",
+        "updated_at",
+        *FLAG_FIELDS,
+        "notes",
+        "should_revisit",
+        "verdict",
+    }
+
+
+@pytest.mark.parametrize("fields", ["foo", "variant.foo", "variant.variant_id.foo"])
+def test_projects_assignments_list_rejects_unknown_fields(db_setup, fields):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    response = client.get("/api/project/1/assignments/", {"fields": fields})
+    assert response.status_code == 400
+
+
+def test_projects_assignments_list_includes_major_consequence_and_genes(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    response = client.get(
+        "/api/project/1/assignments/",
+        {"fields": "variant.variant_id,variant.major_consequence,variant.genes"},
+    ).json()
+    assert [a["variant"] for a in response["assignments"]] == [
+        {
+            "variant_id": "1-100-A-G",
+            "major_consequence": "frameshift_variant",
+            "genes": ["GENEONE"],
+        },
+        {"variant_id": "1-120-G-A", "major_consequence": "stop_gained", "genes": ["GENEONE"]},
+        {
+            "variant_id": "1-150-C-G",
+            "major_consequence": "frameshift_variant",
+            "genes": ["GENETWO"],
+        },
+    ]
+
+
+def test_variant_annotation_summaries_can_be_backfilled(db_setup):
+    Variant.objects.filter(project=1).update(
+        major_consequence=None, major_consequence_rank=None, gene_symbols=None
+    )
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    response = client.get("/api/project/1/assignments/", {"fields": "variant"}).json()
+    assert [a["variant"]["major_consequence"] for a in response["assignments"]] == [
+        "frameshift_variant",
+        "stop_gained",
+        "frameshift_variant",
+    ]
+
+    call_command("backfill_variant_annotation_summaries")
+
+    variant = Variant.objects.get(project=1, variant_id="1-120-G-A")
+    assert variant.major_consequence == "stop_gained"
+    assert variant.major_consequence_rank == 3
+    assert variant.gene_symbols == "GENEONE"
+
+
+def test_variant_annotation_summaries_are_backfilled_by_migration(db_setup):
+    Variant.objects.filter(project=1).update(
+        major_consequence=None, major_consequence_rank=None, gene_symbols=None
+    )
+
+    migration = importlib.import_module(
+        "curation_portal.migrations.0023_backfill_variant_annotation_summaries"
+    )
+    migration.set_variant_annotation_summaries(apps, None)
+
+    variant = Variant.objects.get(project=1, variant_id="1-120-G-A")
+    assert variant.major_consequence == "stop_gained"
+    assert variant.major_consequence_rank == 3
+    assert variant.gene_symbols == "GENEONE"
+
+
+def test_projects_assignments_list_can_be_filtered_on_major_consequence(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    response = client.get(
+        "/api/project/1/assignments/", {"variant__major_consequence": "stop_gained"}
+    ).json()
+    assert [a["variant"]["variant_id"] for a in response["assignments"]] == ["1-120-G-A"]
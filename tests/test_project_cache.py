@@ -0,0 +1,197 @@
+# pylint: disable=redefined-outer-name,unused-argument
+import pytest
+from django.core.cache.backends.filebased import FileBasedCache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from curation_portal.cache import (
+    CACHE_STATS_KEYS,
+    bump_project_cache_generation,
+    get_generation_key,
+    get_project_cache,
+    get_project_cache_generation,
+    increment_stat,
+)
+from curation_portal.models import CurationAssignment, CurationResult, Project, User, Variant
+
+pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
+
+
+@pytest.fixture(scope="module")
+def db_setup(django_db_setup, django_db_blocker, create_variant):
+    with django_db_blocker.unblock():
+        project = Project.objects.create(id=1, name="Test Project")
+        variant1 = create_variant(project, "1-100-A-G")
+        create_variant(project, "1-200-G-A")
+
+        user1 = User.objects.create(username="user1@example.com")
+        user2 = User.objects.create(username="user2@example.com")
+        staff_user = User.objects.create(username="staff@example.com", is_staff=True)
+
+        project.owners.set([user1])
+        CurationAssignment.objects.create(curator=user2, variant=variant1)
+
+        yield
+
+        project.delete()
+
+        user1.delete()
+        user2.delete()
+        staff_user.delete()
+
+
+@pytest.fixture
+def project_cache(settings):
+    settings.CACHES = {
+        **settings.CACHES,
+        "project_data": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test_project_data",
+        },
+    }
+    cache = get_project_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def get_cache_stats():
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="staff@example.com"))
+    return client.get("/api/cache/stats/").json()["stats"]
+
+
+def test_cache_stats_can_only_be_viewed_by_staff(db_setup, project_cache):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/cache/stats/")
+    assert response.status_code == 403
+
+    client.force_authenticate(User.objects.get(username="staff@example.com"))
+    response = client.get("/api/cache/stats/")
+    assert response.status_code == 200
+    assert response.json() == {"stats": {"hits": 0, "misses": 0}}
+
+
+@pytest.mark.parametrize(
+    "url", ["/api/project/1/", "/api/project/1/variants/", "/api/project/1/results/"]
+)
+def test_project_data_is_cached(db_setup, project_cache, url):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+
+    first_response = client.get(url).json()
+    second_response = client.get(url).json()
+    assert second_response == first_response
+    assert get_cache_stats() == {"hits": 1, "misses": 1}
+
+
+def test_cached_project_data_depends_on_permissions(db_setup, project_cache):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    owner_response = client.get("/api/project/1/").json()
+    assert "owners" in owner_response
+
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    curator_response = client.get("/api/project/1/").json()
+    assert "owners" not in curator_response
+
+    assert get_cache_stats() == {"hits": 0, "misses": 2}
+
+
+def test_cached_results_are_invalidated_when_results_change(db_setup, project_cache):
+    owner_client = APIClient()
+    owner_client.force_authenticate(User.objects.get(username="user1@example.com"))
+    assert owner_client.get("/api/project/1/results/").json()["results"] == []
+
+    curator_client = APIClient()
+    curator_client.force_authenticate(User.objects.get(username="user2@example.com"))
+    variant = Variant.objects.get(variant_id="1-100-A-G")
+    response = curator_client.post(
+        f"/api/project/1/variant/{variant.id}/curate/", {"verdict": "lof"}, format="json"
+    )
+    assert response.status_code == 200
+
+    results = owner_client.get("/api/project/1/results/").json()["results"]
+    assert [result["verdict"] for result in results] == ["lof"]
+
+    response = curator_client.post(
+        f"/api/project/1/variant/{variant.id}/curate/", {"verdict": "not_lof"}, format="json"
+    )
+    assert response.status_code == 200
+
+    results = owner_client.get("/api/project/1/results/").json()["results"]
+    assert [result["verdict"] for result in results] == ["not_lof"]
+
+    assert get_cache_stats() == {"hits": 0, "misses": 3}
+
+
+def test_result_changes_invalidate_cache_without_looking_up_assignments(db_setup, project_cache):
+    variant = Variant.objects.get(variant_id="1-100-A-G")
+    assignment = CurationAssignment.objects.get(variant=variant)
+    assignment.result = CurationResult.objects.create(project_id=1, verdict="lof")
+    assignment.save()
+    result = CurationResult.objects.get(id=assignment.result_id)
+
+    generation = get_project_cache_generation(1)
+    with CaptureQueriesContext(connection) as queries:
+        result.verdict = "not_lof"
+        result.save()
+
+    assert get_project_cache_generation(1) != generation
+    assert not any("curation_assignment" in query["sql"] for query in queries.captured_queries)
+
+
+def test_cache_stats_are_counted_when_missing_from_cache(db_setup, project_cache):
+    increment_stat("hits")
+    increment_stat("hits")
+    assert project_cache.get(CACHE_STATS_KEYS["hits"]) == 2
+
+
+def test_cached_variants_are_invalidated_when_variants_change(
+    db_setup, project_cache, create_variant
+):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/variants/").json()
+    assert len(response["variants"]) == 2
+
+    create_variant(Project.objects.get(id=1), "1-300-T-C")
+
+    response = client.get("/api/project/1/variants/").json()
+    assert len(response["variants"]) == 3
+
+
+def test_cached_project_progress_is_invalidated_when_assignments_change(db_setup, project_cache):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/").json()
+    assert set(response["assignments"].keys()) == {"user2@example.com"}
+
+    CurationAssignment.objects.create(
+        curator=User.objects.get(username="user1@example.com"),
+        variant=Variant.objects.get(variant_id="1-200-G-A"),
+    )
+
+    response = client.get("/api/project/1/").json()
+    assert set(response["assignments"].keys()) == {"user1@example.com", "user2@example.com"}
+
+
+def test_cached_project_data_is_invalidated_for_other_processes(db_setup, settings, tmp_path):
+    settings.CACHES = {
+        **settings.CACHES,
+        "project_data": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path),
+        },
+    }
+
+    # A separate cache instance reads the same files as another app server process would.
+    other_process_cache = FileBasedCache(str(tmp_path), {})
+
+    generation = get_project_cache_generation(1)
+    assert other_process_cache.get(get_generation_key(1)) == generation
+
+    bump_project_cache_generation(1)
+    assert other_process_cache.get(get_generation_key(1)) != generation
@@ -0,0 +1,248 @@
+# pylint: disable=redefined-outer-name,unused-argument
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import Permission
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from curation_portal.imports import (
+    ImportJobInterrupted,
+    claim_next_import_job,
+    fail_stale_import_jobs,
+    run_import_job,
+    save_import,
+)
+from curation_portal.models import (
+    CurationAssignment,
+    CurationResult,
+    ImportJob,
+    Project,
+    User,
+    Variant,
+)
+
+pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
+
+
+@pytest.fixture(scope="module")
+def db_setup(django_db_setup, django_db_blocker, create_variant):
+    with django_db_blocker.unblock():
+        project = Project.objects.create(id=1, name="Test Project")
+        variant1 = create_variant(project, "1-100-A-G")
+        create_variant(project, "1-200-G-A")
+
+        user1 = User.objects.create(username="user1@example.com")
+        user1.user_permissions.add(Permission.objects.get(codename="add_variant"))
+        user2 = User.objects.create(username="user2@example.com")
+        user3 = User.objects.create(username="user3@example.com")
+        user4 = User.objects.create(username="user4@example.com")
+
+        project.owners.set([user1, user4])
+        CurationAssignment.objects.create(curator=user2, variant=variant1)
+
+        yield
+
+        project.delete()
+
+        user1.delete()
+        user2.delete()
+        user3.delete()
+        user4.delete()
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+def submit_import(username, kind, content, filename="upload.json"):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username=username))
+    return client.post(
+        "/api/project/1/imports/",
+        {"kind": kind, "file": SimpleUploadedFile(filename, content)},
+        format="multipart",
+    )
+
+
+def get_import(import_job_id):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    return client.get(f"/api/project/1/import/{import_job_id}/").json()["import"]
+
+
+@pytest.mark.parametrize(
+    "username,kind,expected_status_code",
+    [
+        ("user1@example.com", "variants", 202),  # owner with add_variant permission
+        ("user1@example.com", "results", 202),
+        ("user2@example.com", "results", 403),  # curator
+        ("user3@example.com", "results", 404),  # no project access
+        ("user4@example.com", "variants", 403),  # owner without add_variant permission
+        ("user4@example.com", "results", 202),
+    ],
+)
+def test_import_jobs_can_only_be_submitted_by_project_owners(
+    db_setup, username, kind, expected_status_code
+):
+    response = submit_import(username, kind, b"[]")
+    assert response.status_code == expected_status_code
+
+    ImportJob.objects.all().delete()
+
+
+def test_submitting_import_job_does_not_import_data(db_setup):
+    response = submit_import("user1@example.com", "variants", b'[{"variant_id": "1-300-T-C"}]')
+    assert response.status_code == 202
+
+    import_job = response.json()["import"]
+    assert import_job["status"] == "pending"
+    assert import_job["created_by"] == "user1@example.com"
+    assert not Variant.objects.filter(project=1, variant_id="1-300-T-C").exists()
+
+    ImportJob.objects.all().delete()
+
+
+def test_variant_import_job(db_setup):
+    content = "\n".join(
+        json.dumps({"variant_id": variant_id}) for variant_id in ["1-300-T-C", "1-400-A-C"]
+    ).encode()
+    response = submit_import("user1@example.com", "variants", gzip.compress(content), "v.ndjson.gz")
+    import_job_id = response.json()["import"]["id"]
+
+    call_command("process_import_jobs", "--once")
+
+    import_job = get_import(import_job_id)
+    assert import_job["status"] == "succeeded"
+    assert import_job["rows_processed"] == 2
+    assert import_job["rows_imported"] == 2
+    assert Variant.objects.filter(project=1, variant_id__in=["1-300-T-C", "1-400-A-C"]).count() == 2
+
+    Variant.objects.filter(project=1, variant_id__in=["1-300-T-C", "1-400-A-C"]).delete()
+    ImportJob.objects.all().delete()
+
+
+def test_result_import_job(db_setup):
+    content = json.dumps(
+        [{"curator": "user3@example.com", "variant_id": "1-200-G-A", "verdict": "lof"}]
+    ).encode()
+    response = submit_import("user1@example.com", "results", content)
+    import_job_id = response.json()["import"]["id"]
+
+    call_command("process_import_jobs", "--once")
+
+    assert get_import(import_job_id)["status"] == "succeeded"
+    assert CurationResult.objects.filter(
+        assignment__curator__username="user3@example.com",
+        assignment__variant__variant_id="1-200-G-A",
+        verdict="lof",
+    ).exists()
+
+    CurationAssignment.objects.filter(curator__username="user3@example.com").delete()
+    ImportJob.objects.all().delete()
+
+
+def test_import_job_records_errors_for_rows(db_setup):
+    content = "\n".join(
+        json.dumps({"variant_id": variant_id})
+        for variant_id in ["1-300-T-C", "1-100-A-G", "rs123", "1-300-T-C"]
+    ).encode()
+    response = submit_import("user1@example.com", "variants", content)
+    import_job_id = response.json()["import"]["id"]
+
+    call_command("process_import_jobs", "--once")
+
+    import_job = get_import(import_job_id)
+    assert import_job["status"] == "failed"
+    assert import_job["rows_processed"] == 4
+    assert import_job["rows_imported"] == 0
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    errors = client.get(f"/api/project/1/import/{import_job_id}/errors/").json()["errors"]
+    assert errors == [
+        {"row": 2, "errors": {"non_field_errors": ["Variant already exists in project"]}},
+        {"row": 3, "errors": {"variant_id": ["This value does not match the required pattern."]}},
+        {"row": 4, "errors": {"non_field_errors": ["Duplicate variant"]}},
+    ]
+
+    assert not Variant.objects.filter(project=1, variant_id="1-300-T-C").exists()
+
+    ImportJob.objects.all().delete()
+
+
+def test_import_job_fails_on_invalid_file(db_setup):
+    response = submit_import("user1@example.com", "variants", b"[{")
+    import_job_id = response.json()["import"]["id"]
+
+    call_command("process_import_jobs", "--once")
+
+    import_job = get_import(import_job_id)
+    assert import_job["status"] == "failed"
+    assert import_job["error"]
+
+    ImportJob.objects.all().delete()
+
+
+def test_interrupted_import_jobs_are_marked_as_failed(db_setup, settings):
+    settings.CURATION_PORTAL_IMPORT_JOB_TIMEOUT = 60
+
+    response = submit_import("user1@example.com", "variants", b'[{"variant_id": "1-300-T-C"}]')
+    stale_job_id = response.json()["import"]["id"]
+    response = submit_import("user1@example.com", "variants", b'[{"variant_id": "1-400-A-C"}]')
+    running_job_id = response.json()["import"]["id"]
+
+    ImportJob.objects.filter(id=stale_job_id).update(
+        status="importing", heartbeat_at=timezone.now() - timedelta(seconds=120)
+    )
+    ImportJob.objects.filter(id=running_job_id).update(
+        status="importing", heartbeat_at=timezone.now()
+    )
+
+    assert fail_stale_import_jobs() == 1
+
+    stale_job = get_import(stale_job_id)
+    assert stale_job["status"] == "failed"
+    assert stale_job["error"] == "Import job was interrupted"
+    assert get_import(running_job_id)["status"] == "importing"
+
+    ImportJob.objects.all().delete()
+
+
+def test_import_job_failed_by_another_worker_is_not_saved(db_setup):
+    response = submit_import("user1@example.com", "variants", b'[{"variant_id": "1-300-T-C"}]')
+    import_job_id = response.json()["import"]["id"]
+
+    job = claim_next_import_job()
+
+    # Simulate another worker marking the job as failed while it is running.
+    ImportJob.objects.filter(id=import_job_id).update(
+        status="failed", error="Import job was interrupted"
+    )
+
+    run_import_job(job)
+
+    import_job = get_import(import_job_id)
+    assert import_job["status"] == "failed"
+    assert import_job["error"] == "Import job was interrupted"
+    assert not Variant.objects.filter(variant_id="1-300-T-C").exists()
+
+    ImportJob.objects.all().delete()
+
+
+def test_import_job_rows_are_not_saved_if_job_is_no_longer_running(db_setup):
+    submit_import("user1@example.com", "variants", b'[{"variant_id": "1-300-T-C"}]')
+    job = claim_next_import_job()
+
+    with pytest.raises(ImportJobInterrupted):
+        save_import(job)
+
+    assert not Variant.objects.filter(variant_id="1-300-T-C").exists()
+    assert ImportJob.objects.get(id=job.id).status == "validating"
+
+    ImportJob.objects.all().delete()
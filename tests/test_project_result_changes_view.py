@@ -0,0 +1,218 @@
+# pylint: disable=redefined-outer-name,unused-argument
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from curation_portal.models import CurationAssignment, CurationResult, Project, User, Variant
+
+pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
+
+
+@pytest.fixture(scope="module")
+def db_setup(django_db_setup, django_db_blocker, create_variant):
+    with django_db_blocker.unblock():
+        project = Project.objects.create(id=1, name="Test Project")
+        variants = [
+            create_variant(project, variant_id)
+            for variant_id in ["1-100-A-G", "1-200-G-A", "1-300-T-C"]
+        ]
+
+        user1 = User.objects.create(username="user1@example.com")
+        user2 = User.objects.create(username="user2@example.com")
+        user3 = User.objects.create(username="user3@example.com")
+
+        project.owners.set([user1])
+        for variant, verdict in zip(variants, ["lof", "not_lof", "uncertain"]):
+            CurationAssignment.objects.create(
+                curator=user2,
+                variant=variant,
+                result=CurationResult.objects.create(verdict=verdict),
+            )
+
+        yield
+
+        project.delete()
+
+        user1.delete()
+        user2.delete()
+        user3.delete()
+
+
+@pytest.fixture(autouse=True)
+def change_feed_delay(settings):
+    settings.CURATION_PORTAL_CHANGE_FEED_DELAY = 0
+
+
+@pytest.mark.parametrize("feed", ["changes", "deletions"])
+@pytest.mark.parametrize(
+    "username,expected_status_code",
+    [("user1@example.com", 200), ("user2@example.com", 403), ("user3@example.com", 404)],
+)
+def test_result_feeds_can_only_be_viewed_by_project_owners(
+    db_setup, feed, username, expected_status_code
+):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username=username))
+    response = client.get(f"/api/project/1/results/{feed}/")
+    assert response.status_code == expected_status_code
+
+
+def get_changed_variants(response):
+    return [result["variant"]["variant_id"] for result in response["results"]]
+
+
+def test_result_changes_are_paginated(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+
+    response = client.get("/api/project/1/results/changes/", {"page_size": 2}).json()
+    assert get_changed_variants(response) == ["1-100-A-G", "1-200-G-A"]
+    assert response["has_more"]
+
+    response = client.get(
+        "/api/project/1/results/changes/", {"page_size": 2, "cursor": response["cursor"]}
+    ).json()
+    assert get_changed_variants(response) == ["1-300-T-C"]
+    assert not response["has_more"]
+
+    cursor = response["cursor"]
+    response = client.get("/api/project/1/results/changes/", {"cursor": cursor}).json()
+    assert get_changed_variants(response) == []
+    assert response["cursor"] == cursor
+
+
+def test_result_changes_include_results_updated_after_cursor(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+
+    cursor = client.get("/api/project/1/results/changes/").json()["cursor"]
+
+    result = CurationResult.objects.get(assignment__variant__variant_id="1-200-G-A")
+    result.verdict = "likely_not_lof"
+    result.save()
+
+    response = client.get("/api/project/1/results/changes/", {"cursor": cursor}).json()
+    assert [(r["variant"]["variant_id"], r["verdict"]) for r in response["results"]] == [
+        ("1-200-G-A", "likely_not_lof")
+    ]
+
+
+def test_result_changes_are_listed_after_delay(db_setup, settings):
+    settings.CURATION_PORTAL_CHANGE_FEED_DELAY = 60
+    CurationResult.objects.update(changed_at=timezone.now() - timedelta(seconds=300))
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+
+    result = CurationResult.objects.get(assignment__variant__variant_id="1-200-G-A")
+    result.save()
+
+    response = client.get("/api/project/1/results/changes/").json()
+    assert "1-200-G-A" not in get_changed_variants(response)
+    cursor = response["cursor"]
+
+    CurationResult.objects.filter(id=result.id).update(
+        changed_at=timezone.now() - timedelta(seconds=120)
+    )
+
+    response = client.get("/api/project/1/results/changes/", {"cursor": cursor}).json()
+    assert get_changed_variants(response) == ["1-200-G-A"]
+
+
+def test_result_changes_include_imported_results_with_earlier_timestamps(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+
+    cursor = client.get("/api/project/1/results/changes/").json()["cursor"]
+
+    response = client.post(
+        "/api/project/1/results/",
+        [
+            {
+                "variant_id": "1-100-A-G",
+                "curator": "user3@example.com",
+                "verdict": "lof",
+                "updated_at": "2019-01-01T00:00:00Z",
+            }
+        ],
+        format="json",
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/project/1/results/changes/", {"cursor": cursor}).json()
+    assert [(r["variant"]["variant_id"], r["curator"]) for r in response["results"]] == [
+        ("1-100-A-G", "user3@example.com")
+    ]
+
+    CurationResult.objects.filter(assignment__curator__username="user3@example.com").delete()
+    CurationAssignment.objects.filter(curator__username="user3@example.com").delete()
+
+
+def test_result_deletions_are_listed(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+
+    response = client.get("/api/project/1/results/deletions/").json()
+    assert response["deletions"] == []
+    assert response["cursor"] is None
+
+    assignment = CurationAssignment.objects.get(variant__variant_id="1-100-A-G")
+    result_id = assignment.result_id
+    assignment.delete()
+
+    response = client.get("/api/project/1/results/deletions/").json()
+    assert [
+        (deletion["result_id"], deletion["variant_id"], deletion["curator"])
+        for deletion in response["deletions"]
+    ] == [(result_id, "1-100-A-G", "user2@example.com")]
+
+    response = client.get("/api/project/1/results/deletions/", {"cursor": response["cursor"]})
+    assert response.json()["deletions"] == []
+
+
+def test_result_deletions_are_listed_when_variants_are_deleted(db_setup):
+    Variant.objects.get(variant_id="1-300-T-C").delete()
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/results/deletions/").json()
+    assert [deletion["variant_id"] for deletion in response["deletions"]] == ["1-300-T-C"]
+
+
+def test_result_deletions_are_recorded_without_loading_variants_and_curators_separately(db_setup):
+    with CaptureQueriesContext(connection) as queries:
+        User.objects.get(username="user2@example.com").delete()
+
+    assert not any(
+        query["sql"].startswith("SELECT")
+        and ('FROM "curation_variant"' in query["sql"] or 'FROM "auth_user"' in query["sql"])
+        for query in queries.captured_queries
+    )
+    # The curator's remaining assignments are deleted too, so they are not renumbered.
+    assert not any(
+        query["sql"].startswith('UPDATE "curation_assignment"')
+        for query in queries.captured_queries
+    )
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/results/deletions/").json()
+    assert sorted(
+        (deletion["variant_id"], deletion["curator"]) for deletion in response["deletions"]
+    ) == [
+        ("1-100-A-G", "user2@example.com"),
+        ("1-200-G-A", "user2@example.com"),
+        ("1-300-T-C", "user2@example.com"),
+    ]
+
+
+@pytest.mark.parametrize("query", [{"cursor": "foo"}, {"page_size": 0}, {"page_size": "foo"}])
+def test_result_changes_rejects_invalid_parameters(db_setup, query):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/results/changes/", query)
+    assert response.status_code == 400
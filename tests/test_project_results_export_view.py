@@ -6,6 +6,7 @@ from io import StringIO
 import pytest
 from rest_framework.test import APIClient
 
+from curation_portal import export
 from curation_portal.models import CurationAssignment, CurationResult, Project, User
 
 pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
@@ -116,7 +117,7 @@ def get_exported_results(db_setup):
         client = APIClient()
         client.force_authenticate(User.objects.get(username=username))
         response = client.get("/api/project/1/results/export/", query_params)
-        reader = csv.DictReader(StringIO(response.content.decode("utf-8")))
+        reader = csv.DictReader(StringIO(b"".join(response.streaming_content).decode("utf-8")))
         return [row for row in reader]
 
     return _get_exported_results
@@ -217,3 +218,93 @@ def test_curators_cannot_filter_exported_results(get_exported_results):
         )
     )
     assert results == set([("1-100-A-G", "user2@example.com")])
+
+
+def test_results_export_is_streamed_in_chunks(db_setup, monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_CHUNK_SIZE", 1)
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/results/export/")
+    assert response.streaming
+
+    reader = csv.DictReader(StringIO(b"".join(response.streaming_content).decode("utf-8")))
+    rows = [row for row in reader]
+    assert set((row["Variant ID"], row["Curator"]) for row in rows) == set(
+        [
+            ("1-100-A-G", "user1@example.com"),
+            ("1-200-G-T", "user1@example.com"),
+            ("1-100-A-G", "user2@example.com"),
+        ]
+    )
+    for row in rows:
+        if row["Variant ID"] == "1-200-G-T":
+            assert set(row["Gene"].split(";")) == {
+                "g2:GENETWO",
+                "g3:GENETHREEANDFOUR",
+                "g4:GENETHREEANDFOUR",
+            }
+
+
+def test_results_export_rejects_unknown_file_formats(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/results/export/", {"file_format": "xlsx"})
+    assert response.status_code == 400
+
+
+def test_columnar_results_export_requires_pyarrow(db_setup, monkeypatch):
+    monkeypatch.setattr(export, "pyarrow", None)
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/results/export/", {"file_format": "parquet"})
+    assert response.status_code == 400
+
+
+def read_columnar_export(response, file_format):
+    pyarrow = pytest.importorskip("pyarrow")
+    content = b"".join(response.streaming_content)
+    if file_format == "parquet":
+        pytest.importorskip("pyarrow.parquet")
+        return pyarrow.parquet.read_table(pyarrow.BufferReader(content))
+
+    return pyarrow.ipc.open_stream(content).read_all()
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_results_can_be_exported_in_columnar_formats(db_setup, monkeypatch, file_format):
+    pyarrow = pytest.importorskip("pyarrow")
+    monkeypatch.setattr(export, "EXPORT_CHUNK_SIZE", 2)
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/results/export/", {"file_format": file_format})
+    assert response.status_code == 200
+    assert response["Content-Disposition"] == (
+        f'attachment; filename="Test-Project_results.{file_format}"'
+    )
+
+    table = read_columnar_export(response, file_format)
+    assert table.schema.field("should_revisit").type == pyarrow.bool_()
+    assert table.schema.field("flag_mapping_error").type == pyarrow.bool_()
+    assert pyarrow.types.is_dictionary(table.schema.field("verdict").type)
+    assert pyarrow.types.is_list(table.schema.field("gene_ids").type)
+
+    rows = {(row["variant_id"], row["curator"]): row for row in table.to_pylist()}
+    assert set(rows.keys()) == set(
+        [
+            ("1-100-A-G", "user1@example.com"),
+            ("1-200-G-T", "user1@example.com"),
+            ("1-100-A-G", "user2@example.com"),
+        ]
+    )
+
+    row = rows[("1-200-G-T", "user1@example.com")]
+    assert row["verdict"] == "lof"
+    assert row["notes"] == "LoF for sure"
+    assert row["gene_ids"] == ["g2", "g3", "g4"]
+    assert row["gene_symbols"] == ["GENETWO", "GENETHREEANDFOUR", "GENETHREEANDFOUR"]
+    assert row["transcript_ids"] == ["t2", "t2-1", "t3", "t4"]
+
+    assert rows[("1-100-A-G", "user2@example.com")]["should_revisit"] is True
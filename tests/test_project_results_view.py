@@ -1,5 +1,9 @@
 # pylint: disable=redefined-outer-name,unused-argument
+from datetime import date
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
 from curation_portal.models import CurationAssignment, CurationResult, Project, User
@@ -89,6 +93,44 @@ def test_upload_results_creates_assignments_and_results(db_setup):
     assert result.verdict == "likely_lof"
 
 
+def test_upload_results_keeps_imported_timestamps(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.post(
+        "/api/project/1/results/",
+        [
+            {
+                "variant_id": "1-200-G-A",
+                "curator": "user3@example.com",
+                "verdict": "lof",
+                "created_at": "2019-01-01T00:00:00Z",
+                "updated_at": "2019-02-01T00:00:00Z",
+            },
+            {"variant_id": "1-300-T-C", "curator": "user3@example.com", "verdict": "lof"},
+        ],
+        format="json",
+    )
+    assert response.status_code == 200
+
+    results = CurationResult.objects.filter(
+        assignment__curator__username="user3@example.com",
+        assignment__variant__variant_id__in=["1-200-G-A", "1-300-T-C"],
+    )
+    imported_result = results.get(assignment__variant__variant_id="1-200-G-A")
+    assert imported_result.created_at.date() == date(2019, 1, 1)
+    assert imported_result.updated_at.date() == date(2019, 2, 1)
+
+    result = results.get(assignment__variant__variant_id="1-300-T-C")
+    assert result.created_at.year > 2019
+    assert result.updated_at.year > 2019
+
+    results.delete()
+    CurationAssignment.objects.filter(
+        curator__username="user3@example.com",
+        variant__variant_id__in=["1-200-G-A", "1-300-T-C"],
+    ).delete()
+
+
 def test_upload_results_validates_variant_ids(db_setup):
     client = APIClient()
     client.force_authenticate(User.objects.get(username="user1@example.com"))
@@ -199,3 +241,94 @@ def test_upload_results_rejects_duplicate_assignments(db_setup):
         assignment__variant__variant_id="1-300-T-C",
         assignment__curator__username="user3@example.com",
     ).exists()
+
+
+def test_upload_results_query_count_does_not_depend_on_number_of_results(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+
+    def upload_results(curators):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(
+                "/api/project/1/results/",
+                [
+                    {"variant_id": "1-300-T-C", "curator": curator, "verdict": "likely_lof"}
+                    for curator in curators
+                ],
+                format="json",
+            )
+            assert response.status_code == 200
+
+        return len(queries)
+
+    num_queries_for_few_results = upload_results([f"curator{i}@example.com" for i in range(2)])
+    num_queries_for_many_results = upload_results([f"curator{i}@example.com" for i in range(2, 22)])
+
+    assert num_queries_for_many_results == num_queries_for_few_results
+    assert (
+        CurationResult.objects.filter(
+            assignment__variant__project=1, assignment__variant__variant_id="1-300-T-C"
+        ).count()
+        == 22
+    )
+
+
+def test_results_view_returns_not_modified_until_results_change(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/results/")
+    assert response.status_code == 200
+    etag = response["ETag"]
+
+    response = client.get("/api/project/1/results/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    assignment = CurationAssignment.objects.get(
+        curator__username="user2@example.com", variant__variant_id="1-100-A-G"
+    )
+    assignment.result = CurationResult.objects.create(verdict="lof")
+    assignment.save()
+
+    response = client.get("/api/project/1/results/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 1
+
+
+@pytest.mark.parametrize(
+    "query,expected_variants",
+    [
+        ("flags__any=technical", ["1-200-G-A"]),
+        ("flags__any=flag_mapping_error,flag_mnp", ["1-200-G-A", "1-300-T-C"]),
+        ("flags__all=flag_mnp,flag_in_frame_exon", ["1-300-T-C"]),
+        ("flags__all=flag_mapping_error,flag_mnp", []),
+    ],
+)
+def test_results_can_be_filtered_on_flags(db_setup, query, expected_variants):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.post(
+        "/api/project/1/results/",
+        [
+            {
+                "variant_id": "1-200-G-A",
+                "curator": "user3@example.com",
+                "verdict": "not_lof",
+                "flag_mapping_error": True,
+            },
+            {
+                "variant_id": "1-300-T-C",
+                "curator": "user3@example.com",
+                "verdict": "likely_lof",
+                "flag_mnp": True,
+                "flag_in_frame_exon": True,
+            },
+        ],
+        format="json",
+    )
+    assert response.status_code == 200
+
+    response = client.get(f"/api/project/1/results/?{query}")
+    assert response.status_code == 200
+    assert sorted(result["variant"]["variant_id"] for result in response.json()["results"]) == (
+        expected_variants
+    )
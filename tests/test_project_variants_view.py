@@ -1,8 +1,14 @@
 # pylint: disable=redefined-outer-name,unused-argument
+import gzip
+import json
+
 import pytest
 from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
+from curation_portal import serializers
 from curation_portal.models import CurationAssignment, Project, User, Variant
 
 pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
@@ -246,3 +252,156 @@ def test_upload_variants_creates_no_variants_on_validation_error(db_setup):
 
     assert response.status_code == 400
     assert project.variants.count() == starting_variant_count
+
+
+def test_upload_variants_query_count_does_not_depend_on_number_of_variants(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+
+    def upload_variants(variant_ids):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(
+                "/api/project/1/variants/",
+                [
+                    {
+                        "variant_id": variant_id,
+                        "annotations": [
+                            {
+                                "consequence": "stop_gained",
+                                "gene_id": "GENE_1",
+                                "gene_symbol": "SOMEGENE",
+                                "transcript_id": "TRANSCRIPT_1",
+                            }
+                        ],
+                        "tags": [{"label": "tag1", "value": "foo"}],
+                    }
+                    for variant_id in variant_ids
+                ],
+                format="json",
+            )
+            assert response.status_code == 200
+
+        return len(queries)
+
+    num_queries_for_small_upload = upload_variants([f"3-{pos}-A-G" for pos in range(1, 3)])
+    num_queries_for_large_upload = upload_variants([f"3-{pos}-A-G" for pos in range(3, 53)])
+
+    assert num_queries_for_large_upload == num_queries_for_small_upload
+
+    variant = Variant.objects.get(project=1, variant_id="3-52-A-G")
+    assert [a.gene_symbol for a in variant.annotations.all()] == ["SOMEGENE"]
+    assert [(t.label, t.value) for t in variant.tags.all()] == [("tag1", "foo")]
+
+
+def test_upload_variants_accepts_newline_delimited_json(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.post(
+        "/api/project/1/variants/",
+        "\n".join(
+            [
+                json.dumps(
+                    {"variant_id": "4-100-A-G", "tags": [{"label": "tag1", "value": "foo"}]}
+                ),
+                "",
+                json.dumps({"variant_id": "4-200-C-T", "AC": 3}),
+            ]
+        ),
+        content_type="application/x-ndjson",
+    )
+    assert response.status_code == 200
+
+    assert Variant.objects.get(project=1, variant_id="4-100-A-G").tags.count() == 1
+    assert Variant.objects.get(project=1, variant_id="4-200-C-T").AC == 3
+
+
+def test_upload_variants_accepts_gzipped_newline_delimited_json(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.post(
+        "/api/project/1/variants/",
+        gzip.compress(b'{"variant_id": "4-300-A-G"}\n{"variant_id": "4-400-C-T"}\n'),
+        content_type="application/x-ndjson",
+        HTTP_CONTENT_ENCODING="gzip",
+    )
+    assert response.status_code == 200
+
+    assert Variant.objects.filter(project=1, variant_id__in=["4-300-A-G", "4-400-C-T"]).count() == 2
+
+
+def test_upload_newline_delimited_json_reports_errors_by_line(db_setup, monkeypatch):
+    monkeypatch.setattr(serializers, "VARIANT_UPLOAD_CHUNK_SIZE", 2)
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    project = Project.objects.get(id=1)
+    starting_variant_count = project.variants.count()
+    response = client.post(
+        "/api/project/1/variants/",
+        "\n".join(
+            json.dumps({"variant_id": variant_id})
+            for variant_id in ["4-500-A-G", "4-600-A-G", "4-500-A-G", "rs123", "4-700-A-G"]
+        ),
+        content_type="application/x-ndjson",
+    )
+    assert response.status_code == 400
+    assert response.json() == {
+        "line 3": {"non_field_errors": ["Variant already exists in project"]},
+        "line 4": {"variant_id": ["This value does not match the required pattern."]},
+    }
+
+    assert project.variants.count() == starting_variant_count
+
+
+def test_upload_newline_delimited_json_rejects_invalid_json(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.post(
+        "/api/project/1/variants/",
+        '{"variant_id": "4-800-A-G"}\n{"variant_id": ',
+        content_type="application/x-ndjson",
+    )
+    assert response.status_code == 400
+    assert "line 2" in response.json()["detail"]
+    assert not Variant.objects.filter(project=1, variant_id="4-800-A-G").exists()
+
+
+def test_upload_variants_keeps_assignment_order(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.post(
+        "/api/project/1/variants/",
+        [{"variant_id": "1-50-C-T"}, {"variant_id": "1-150-T-A"}],
+        format="json",
+    )
+    assert response.status_code == 200
+
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    variant = Variant.objects.get(project=1, variant_id="1-200-G-A")
+    response = client.get(f"/api/project/1/variant/{variant.id}/curate/").json()
+    assert response["index"] == 1
+    assert response["previous_variant"]["variant_id"] == "1-100-A-G"
+    assert response["next_variant"] is None
+
+    assert list(
+        CurationAssignment.objects.filter(curator__username="user2@example.com")
+        .order_by("ordinal")
+        .values_list("variant__variant_id", "ordinal")
+    ) == [("1-100-A-G", 0), ("1-200-G-A", 1)]
+
+
+def test_upload_variants_does_not_renumber_assignments(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(
+            "/api/project/1/variants/", [{"variant_id": "1-10-A-G"}], format="json"
+        )
+        assert response.status_code == 200
+
+    # Ordinals number each curator's assignments, so new variants do not change them.
+    assert not any(
+        '"curation_assignment"."ordinal"' in query["sql"] for query in queries.captured_queries
+    )
+
+    Variant.objects.filter(project=1, variant_id="1-10-A-G").delete()
@@ -1,8 +1,19 @@
 # pylint: disable=redefined-outer-name,unused-argument
 import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
-from curation_portal.models import CurationAssignment, Project, User
+from curation_portal.models import (
+    CurationAssignment,
+    CurationResult,
+    CuratorProgress,
+    Project,
+    ProjectProgress,
+    User,
+    Variant,
+)
 
 pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
 
@@ -86,3 +97,139 @@ def test_project_view_returns_limited_information_for_curator(db_setup):
     response = client.get("/api/project/1/").json()
 
     assert response == {"id": 1, "name": "Test Project"}
+
+
+def test_project_view_progress_is_updated_when_variants_are_curated(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user3@example.com"))
+    variant = Variant.objects.get(project=1, variant_id="1-150-C-G")
+    response = client.post(f"/api/project/1/variant/{variant.id}/curate/", {"verdict": "lof"})
+    assert response.status_code == 200
+
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/").json()
+    assert response["assignments"] == {
+        "user2@example.com": {"total": 3, "completed": 0},
+        "user3@example.com": {"total": 2, "completed": 1},
+    }
+    assert response["variants"] == {"total": 4, "curated": 1}
+
+    CurationAssignment.objects.get(curator__username="user3@example.com", variant=variant).delete()
+
+    response = client.get("/api/project/1/").json()
+    assert response["assignments"] == {
+        "user2@example.com": {"total": 3, "completed": 0},
+        "user3@example.com": {"total": 1, "completed": 0},
+    }
+    assert response["variants"] == {"total": 4, "curated": 0}
+
+
+def test_project_view_progress_follows_verdict_changes(db_setup):
+    client = APIClient()
+    variant = Variant.objects.get(project=1, variant_id="1-150-C-G")
+
+    def curate(username, verdict):
+        client.force_authenticate(User.objects.get(username=username))
+        response = client.post(
+            f"/api/project/1/variant/{variant.id}/curate/", {"verdict": verdict}, format="json"
+        )
+        assert response.status_code == 200
+
+    def get_progress():
+        client.force_authenticate(User.objects.get(username="user1@example.com"))
+        response = client.get("/api/project/1/").json()
+        return (
+            response["assignments"]["user2@example.com"]["completed"],
+            response["assignments"]["user3@example.com"]["completed"],
+            response["variants"]["curated"],
+        )
+
+    curate("user2@example.com", "lof")
+    assert get_progress() == (1, 0, 1)
+
+    curate("user2@example.com", "not_lof")
+    assert get_progress() == (1, 0, 1)
+
+    curate("user3@example.com", "lof")
+    assert get_progress() == (1, 1, 1)
+
+    curate("user2@example.com", None)
+    assert get_progress() == (0, 1, 1)
+
+    curate("user3@example.com", None)
+    assert get_progress() == (0, 0, 0)
+
+    CurationResult.objects.filter(assignment__variant=variant).delete()
+
+
+def test_project_view_progress_counts_repeated_saves_once(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    variant = Variant.objects.get(project=1, variant_id="1-120-G-A")
+    for _ in range(2):
+        response = client.post(f"/api/project/1/variant/{variant.id}/curate/", {"verdict": "lof"})
+        assert response.status_code == 200
+
+    assert CurationResult.objects.filter(assignment__variant=variant).count() == 1
+
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/").json()
+    assert response["assignments"]["user2@example.com"]["completed"] == 1
+    assert response["variants"]["curated"] == 1
+
+    CurationResult.objects.filter(assignment__variant=variant).delete()
+    call_command("rebuild_progress", "1")
+
+
+def test_curating_variant_does_not_recount_progress(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    variant = Variant.objects.get(project=1, variant_id="1-120-G-A")
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(f"/api/project/1/variant/{variant.id}/curate/", {"verdict": "lof"})
+        assert response.status_code == 200
+
+    assert not any("COUNT(" in query["sql"] for query in queries.captured_queries)
+
+    CurationResult.objects.filter(assignment__variant=variant).delete()
+    call_command("rebuild_progress", "1")
+
+
+def test_rebuild_progress_command(db_setup):
+    CuratorProgress.objects.filter(project=1).delete()
+    ProjectProgress.objects.filter(project=1).delete()
+
+    call_command("rebuild_progress", "1")
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/").json()
+    assert response["assignments"] == {
+        "user2@example.com": {"total": 3, "completed": 0},
+        "user3@example.com": {"total": 2, "completed": 0},
+    }
+    assert response["variants"] == {"total": 4, "curated": 0}
+
+
+def test_project_view_supports_conditional_requests(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/")
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert response["Last-Modified"]
+
+    response = client.get("/api/project/1/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    # Responses depend on the user's permissions
+    client.force_authenticate(User.objects.get(username="user2@example.com"))
+    response = client.get("/api/project/1/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+
+    Project.objects.get(id=1).save()
+
+    client.force_authenticate(User.objects.get(username="user1@example.com"))
+    response = client.get("/api/project/1/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
@@ -0,0 +1,107 @@
+# pylint: disable=redefined-outer-name,unused-argument
+import pytest
+from django.db import connection
+from django.db.models import Q
+
+from curation_portal.models import (
+    CurationAssignment,
+    CurationResult,
+    Project,
+    User,
+    Variant,
+    VariantAnnotation,
+)
+
+pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
+
+
+@pytest.fixture(scope="module")
+def db_setup(django_db_setup, django_db_blocker, create_variant):
+    with django_db_blocker.unblock():
+        project = Project.objects.create(id=1, name="Test Project")
+        variant = create_variant(project, "1-100-A-G")
+        create_variant(project, "1-200-G-A")
+
+        user = User.objects.create(username="user1@example.com")
+        CurationAssignment.objects.create(curator=user, variant=variant)
+
+        yield
+
+        project.delete()
+        user.delete()
+
+
+@pytest.fixture
+def prefer_index_scans(db_setup):
+    # Test tables are too small for PostgreSQL to choose an index scan on its own.
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+
+def test_variant_lookup_across_projects_uses_index(prefer_index_scans):
+    plan = Variant.objects.filter(variant_id="1-100-A-G", reference_genome="GRCh37").explain()
+    assert "variant_id_idx" in plan
+
+
+def test_variant_region_lookup_uses_index(prefer_index_scans):
+    plan = Variant.objects.filter(xpos__gte=1000000100, xpos__lte=1000000200).explain()
+    assert "variant_xpos_idx" in plan
+
+
+def test_curator_assigned_variants_lookup_uses_index(prefer_index_scans):
+    user = User.objects.get(username="user1@example.com")
+    plan = CurationAssignment.objects.filter(curator=user).values_list("variant_id").explain()
+    assert "assignment_curator_idx" in plan
+
+
+def test_project_variant_region_lookup_uses_index(prefer_index_scans):
+    plan = Variant.objects.filter(
+        project_id=1, xpos__gte=1000000100, xpos__lte=1000000200
+    ).explain()
+    assert "variant_project_xpos_idx" in plan
+
+
+def test_variant_gene_lookup_uses_index(prefer_index_scans):
+    plan = VariantAnnotation.objects.filter(gene_symbol="GENEONE").values("variant_id").explain()
+    assert "annotation_gene_symbol_idx" in plan
+
+
+def test_variant_consequence_lookup_uses_index(prefer_index_scans):
+    plan = (
+        VariantAnnotation.objects.filter(consequence="stop_gained").values("variant_id").explain()
+    )
+    assert "annotation_consequence_idx" in plan
+
+
+def test_curator_adjacent_assignment_lookup_uses_index(prefer_index_scans):
+    user = User.objects.get(username="user1@example.com")
+    plan = (
+        CurationAssignment.objects.filter(curator=user, project_id=1, ordinal__gt=0)
+        .order_by("ordinal")
+        .values_list("variant_id")
+        .explain()
+    )
+    assert "assignment_project_ordinal_idx" in plan
+
+
+def test_curator_assignments_page_lookup_uses_index(prefer_index_scans):
+    user = User.objects.get(username="user1@example.com")
+    plan = (
+        CurationAssignment.objects.filter(curator=user, project_id=1)
+        .filter(Q(ordinal__gt=0) | Q(ordinal=0, id__gt=1))
+        .order_by("ordinal", "id")
+        .values_list("variant_id")
+        .explain()
+    )
+    assert "assignment_project_ordinal_idx" in plan
+
+
+def test_project_result_changes_lookup_uses_index(prefer_index_scans):
+    plan = (
+        CurationResult.objects.filter(project_id=1, changed_at__gt="2019-01-01")
+        .order_by("changed_at", "id")
+        .values_list("id")
+        .explain()
+    )
+    assert "result_changed_idx" in plan
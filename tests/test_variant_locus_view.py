@@ -0,0 +1,157 @@
+# pylint: disable=redefined-outer-name,unused-argument
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from curation_portal.models import CurationAssignment, CurationResult, Project, User
+
+pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
+
+
+def annotation(gene_id, gene_symbol, transcript_id):
+    return {
+        "consequence": "stop_gained",
+        "gene_id": gene_id,
+        "gene_symbol": gene_symbol,
+        "transcript_id": transcript_id,
+    }
+
+
+@pytest.fixture(scope="module")
+def db_setup(django_db_setup, django_db_blocker, create_variant):
+    with django_db_blocker.unblock():
+        project1 = Project.objects.create(id=1, name="Project #1")
+        variant1_p1 = create_variant(
+            project1, "1-100-A-G", annotations=[annotation("ENSG01", "GENEONE", "t1")]
+        )
+        create_variant(project1, "1-200-G-A", annotations=[annotation("ENSG01", "GENEONE", "t1")])
+        create_variant(project1, "1-300-C-T", annotations=[annotation("ENSG02", "GENETWO", "t2")])
+        create_variant(project1, "2-100-C-T", annotations=[annotation("ENSG03", "GENETHREE", "t3")])
+
+        project2 = Project.objects.create(id=2, name="Project #2")
+        create_variant(project2, "1-100-A-G", annotations=[annotation("ENSG01", "GENEONE", "t1")])
+        variant2_p2 = create_variant(
+            project2, "1-200-G-A", annotations=[annotation("ENSG01", "GENEONE", "t1")]
+        )
+
+        user1 = User.objects.create(username="user1")
+        user2 = User.objects.create(username="user2")
+        user3 = User.objects.create(username="user3")
+
+        project1.owners.set([user1])
+
+        CurationAssignment.objects.create(
+            curator=user2,
+            variant=variant1_p1,
+            result=CurationResult.objects.create(verdict="lof"),
+        )
+        CurationAssignment.objects.create(curator=user3, variant=variant1_p1)
+        CurationAssignment.objects.create(curator=user2, variant=variant2_p2)
+
+        yield
+
+        project1.delete()
+        project2.delete()
+
+        user1.delete()
+        user2.delete()
+        user3.delete()
+
+
+def get_locus(username, path, params):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username=username))
+    return client.get(path, params)
+
+
+def test_project_variants_locus_requires_permission(db_setup):
+    response = get_locus("user3", "/api/project/2/variants/locus/", {"region": "1:1-1000"})
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "username,params,expected_variants",
+    [
+        ("user1", {"region": "1:150-300"}, ["1-200-G-A", "1-300-C-T"]),
+        ("user1", {"region": "1:100"}, ["1-100-A-G"]),
+        ("user1", {"region": "2:1-1000"}, ["2-100-C-T"]),
+        ("user1", {"gene": "GENEONE"}, ["1-100-A-G", "1-200-G-A"]),
+        ("user1", {"gene": "ENSG02"}, ["1-300-C-T"]),
+        ("user2", {"region": "1:1-1000"}, ["1-100-A-G"]),
+        ("user2", {"gene": "GENETWO"}, []),
+    ],
+)
+def test_project_variants_locus_returns_visible_variants_in_locus(
+    db_setup, username, params, expected_variants
+):
+    response = get_locus(username, "/api/project/1/variants/locus/", params)
+    assert response.status_code == 200
+    variants = [variant["variant_id"] for variant in response.json()["variants"]]
+    assert variants == expected_variants
+
+
+def test_project_variants_locus_returns_curation_status(db_setup):
+    response = get_locus("user1", "/api/project/1/variants/locus/", {"region": "1:100"}).json()
+    assert response["variants"][0]["assignments"] == {"total": 2, "completed": 1}
+    assert response["variants"][0]["is_variant_curator"] is False
+
+    response = get_locus("user2", "/api/project/1/variants/locus/", {"region": "1:100"}).json()
+    assert "assignments" not in response["variants"][0]
+    assert response["variants"][0]["is_variant_curator"] is True
+    assert response["variants"][0]["verdict"] == "lof"
+
+
+@pytest.mark.parametrize(
+    "username,params,expected_variants",
+    [
+        ("user1", {"gene": "GENEONE"}, [(1, "1-100-A-G"), (1, "1-200-G-A")]),
+        ("user2", {"gene": "GENEONE"}, [(1, "1-100-A-G"), (2, "1-200-G-A")]),
+        ("user2", {"region": "1:100-200"}, [(1, "1-100-A-G"), (2, "1-200-G-A")]),
+        ("user2", {"region": "1:100-200", "reference_genome": "GRCh38"}, []),
+        ("user3", {"region": "1:150-300"}, []),
+    ],
+)
+def test_variants_locus_returns_visible_variants_across_projects(
+    db_setup, username, params, expected_variants
+):
+    response = get_locus(username, "/api/variants/locus/", params)
+    assert response.status_code == 200
+    variants = [
+        (variant["project"]["id"], variant["variant_id"]) for variant in response.json()["variants"]
+    ]
+    assert variants == expected_variants
+
+
+def test_variants_locus_paginates_variants(db_setup):
+    variants = []
+    cursor = None
+    for _ in range(4):
+        params = {"region": "1:1-1000", "page_size": 1, **({"cursor": cursor} if cursor else {})}
+        response = get_locus("user1", "/api/variants/locus/", params).json()
+        variants.extend(variant["variant_id"] for variant in response["variants"])
+        cursor = response["next_cursor"]
+        if not cursor:
+            break
+
+    assert variants == ["1-100-A-G", "1-200-G-A", "1-300-C-T"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"region": "foo"}, {"region": "1:100", "cursor": "foo"}, {"gene": "x", "page_size": 0}],
+)
+def test_variants_locus_rejects_invalid_parameters(db_setup, params):
+    response = get_locus("user1", "/api/variants/locus/", params)
+    assert response.status_code == 400
+
+
+def test_variants_locus_query_count_does_not_depend_on_number_of_variants(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1"))
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/api/variants/locus/", {"region": "1:1-1000"})
+        assert response.status_code == 200
+
+    # Owned projects, curated projects, and variants
+    assert len(queries) == 3
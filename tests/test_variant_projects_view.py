@@ -1,5 +1,7 @@
 # pylint: disable=redefined-outer-name,unused-argument
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
 from curation_portal.models import CurationAssignment, CurationResult, Project, User
@@ -197,3 +199,23 @@ def test_get_variant_projects_shows_completed_assignments_in_project_for_project
         assert project["assignments"]["completed"] == expected_completed_assignments
     else:
         assert "assignments" not in project
+
+
+def test_get_variant_projects_query_count_does_not_depend_on_number_of_projects(
+    db_setup, create_variant
+):
+    user = User.objects.get(username="user1")
+    for i in range(3, 8):
+        project = Project.objects.create(id=i, name=f"Project #{i}")
+        project.owners.set([user])
+        create_variant(project, "1-100-A-G")
+
+    client = APIClient()
+    client.force_authenticate(user)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/api/variant/1-100-A-G/projects/")
+        assert response.status_code == 200
+
+    assert len(queries) == 1
+    project_ids = [project["id"] for project in response.json()["variant"]["projects"]]
+    assert project_ids == [1, 2, 3, 4, 5, 6, 7]
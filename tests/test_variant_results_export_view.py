@@ -74,7 +74,7 @@ def get_exported_results(db_setup):
         client = APIClient()
         client.force_authenticate(User.objects.get(username=username))
         response = client.get(f"/api/variant/{variant_id}/results/export/", query_params)
-        reader = csv.DictReader(io.StringIO(response.content.decode("utf-8")))
+        reader = csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode("utf-8")))
         return [row for row in reader]
 
     return _get_exported_results
@@ -62,3 +62,89 @@ def test_get_variants_returns_variants_user_can_access(db_setup, username, expec
     response = response.json()
     variants = [variant["variant_id"] for variant in response["variants"]]
     assert variants == expected_variants
+
+
+def test_get_variants_paginates_variants(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1"))
+
+    variants = []
+    cursor = None
+    for _ in range(3):
+        params = {"page_size": 1, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/variants/", params).json()
+        assert len(response["variants"]) == 1
+        variants.extend(variant["variant_id"] for variant in response["variants"])
+        cursor = response["next_cursor"]
+
+    assert cursor is None
+    assert variants == ["1-100-A-G", "1-200-G-A", "1-300-C-T"]
+
+
+def test_get_variants_rejects_invalid_cursor(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1"))
+    response = client.get("/api/variants/", {"cursor": "foo"})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "params,expected_variants",
+    [
+        ({"variant_id": "1-2"}, ["1-200-G-A"]),
+        ({"variant_id": "1:300"}, ["1-300-C-T"]),
+        ({"region": "1:150-300"}, ["1-200-G-A", "1-300-C-T"]),
+        ({"region": "chr1:100"}, ["1-100-A-G"]),
+        ({"region": "2:100-300"}, []),
+        ({"gene": "gene"}, ["1-200-G-A", "1-300-C-T"]),
+        ({"gene": "GENEONE"}, ["1-300-C-T"]),
+        ({"gene": "GENEONE", "region": "1:100-200"}, []),
+    ],
+)
+def test_get_variants_can_search_variants(db_setup, create_variant, params, expected_variants):
+    project = Project.objects.create(id=3, name="Project #3")
+    project.owners.set([User.objects.get(username="user1")])
+    create_variant(
+        project,
+        "1-200-G-A",
+        annotations=[
+            {
+                "consequence": "stop_gained",
+                "gene_id": "g2",
+                "gene_symbol": "GENETWO",
+                "transcript_id": "t2",
+            },
+        ],
+    )
+    create_variant(
+        project,
+        "1-300-C-T",
+        annotations=[
+            {
+                "consequence": "stop_gained",
+                "gene_id": "g1",
+                "gene_symbol": "GENEONE",
+                "transcript_id": "t1",
+            },
+            {
+                "consequence": "frameshift_variant",
+                "gene_id": "g1",
+                "gene_symbol": "GENEONE",
+                "transcript_id": "t1-1",
+            },
+        ],
+    )
+
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1"))
+    response = client.get("/api/variants/", params)
+    assert response.status_code == 200
+    variants = [variant["variant_id"] for variant in response.json()["variants"]]
+    assert variants == expected_variants
+
+
+def test_get_variants_rejects_invalid_region(db_setup):
+    client = APIClient()
+    client.force_authenticate(User.objects.get(username="user1"))
+    response = client.get("/api/variants/", {"region": "1:300-100"})
+    assert response.status_code == 400
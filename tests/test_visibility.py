@@ -0,0 +1,128 @@
+# pylint: disable=redefined-outer-name,unused-argument
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from curation_portal.models import CurationAssignment, CurationResult, Project, User, Variant
+from curation_portal.rules import permission_cache
+from curation_portal.visibility import visible_assignments, visible_variants
+
+pytestmark = pytest.mark.django_db  # pylint: disable=invalid-name
+
+
+@pytest.fixture(scope="module")
+def db_setup(django_db_setup, django_db_blocker, create_variant):
+    with django_db_blocker.unblock():
+        project1 = Project.objects.create(id=1, name="Project #1")
+        variant1_p1 = create_variant(project1, "1-100-A-G")
+        create_variant(project1, "1-200-G-A")
+
+        project2 = Project.objects.create(id=2, name="Project #2")
+        variant1_p2 = create_variant(project2, "1-100-A-G")
+        variant2_p2 = create_variant(project2, "1-200-G-A")
+
+        project3 = Project.objects.create(id=3, name="Project #3")
+        create_variant(project3, "1-100-A-G")
+
+        user1 = User.objects.create(username="user1@example.com")
+        user2 = User.objects.create(username="user2@example.com")
+
+        project1.owners.set([user1])
+        CurationAssignment.objects.create(curator=user1, variant=variant1_p2)
+        CurationAssignment.objects.create(
+            curator=user2, variant=variant1_p1, result=CurationResult.objects.create(verdict="lof")
+        )
+        CurationAssignment.objects.create(
+            curator=user2,
+            variant=variant2_p2,
+            result=CurationResult.objects.create(verdict="not_lof"),
+        )
+
+        yield
+
+        project1.delete()
+        project2.delete()
+        project3.delete()
+
+        user1.delete()
+        user2.delete()
+
+
+@pytest.mark.parametrize(
+    "username,expected_variants",
+    [
+        (
+            "user1@example.com",
+            {(1, "1-100-A-G"), (1, "1-200-G-A"), (2, "1-100-A-G")},
+        ),
+        ("user2@example.com", {(1, "1-100-A-G"), (2, "1-200-G-A")}),
+    ],
+)
+def test_visible_variants_include_owned_projects_and_assigned_variants(
+    db_setup, username, expected_variants
+):
+    user = User.objects.get(username=username)
+    variants = visible_variants(user, Variant.objects.all())
+    assert set(variants.values_list("project_id", "variant_id")) == expected_variants
+
+
+@pytest.mark.parametrize(
+    "username,expected_assignments",
+    [
+        (
+            "user1@example.com",
+            {
+                ("user1@example.com", 2, "1-100-A-G"),
+                ("user2@example.com", 1, "1-100-A-G"),
+            },
+        ),
+        (
+            "user2@example.com",
+            {
+                ("user2@example.com", 1, "1-100-A-G"),
+                ("user2@example.com", 2, "1-200-G-A"),
+            },
+        ),
+    ],
+)
+def test_visible_assignments_include_owned_projects_and_own_assignments(
+    db_setup, username, expected_assignments
+):
+    user = User.objects.get(username=username)
+    assignments = visible_assignments(user, CurationAssignment.objects.all())
+    assert (
+        set(
+            assignments.values_list(
+                "curator__username", "variant__project_id", "variant__variant_id"
+            )
+        )
+        == expected_assignments
+    )
+
+
+@pytest.mark.parametrize(
+    "username,expected_verdicts",
+    [("user1@example.com", {"lof"}), ("user2@example.com", {"lof", "not_lof"})],
+)
+def test_visible_assignments_can_filter_related_objects(db_setup, username, expected_verdicts):
+    user = User.objects.get(username=username)
+    results = visible_assignments(user, CurationResult.objects.all(), prefix="assignment__")
+    assert set(results.values_list("verdict", flat=True)) == expected_verdicts
+
+
+def test_visible_variants_query_does_not_join_owners_or_remove_duplicates(db_setup):
+    user = User.objects.get(username="user1@example.com")
+    sql = str(visible_variants(user, Variant.objects.all()).query).lower()
+    assert "distinct" not in sql
+    assert "curation_project_owners" not in sql
+
+
+def test_visible_project_ids_are_loaded_once_per_request(db_setup):
+    user = User.objects.get(username="user1@example.com")
+    with permission_cache():
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(3):
+                list(visible_variants(user, Variant.objects.all()))
+
+        # Owned projects, curated projects, and one query for each list of variants
+        assert len(queries) == 5